@@ -7,9 +7,11 @@ It provides a clean interface for all tool modules to communicate with Rhino.
 
 import os
 import json
+import asyncio
 import logging
 import requests
-from typing import Dict, Any, Optional
+import httpx
+from typing import Dict, Any, List, Optional, Sequence, Union
 
 # Configuration for Rhino Bridge Server
 BRIDGE_HOST = os.getenv('RHINO_BRIDGE_HOST', 'localhost')
@@ -18,6 +20,182 @@ BRIDGE_URL = f"http://{BRIDGE_HOST}:{BRIDGE_PORT}"
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive HTTP client for async tool calls. Reusing one client
+# keeps the TCP connection to the bridge warm across tool invocations
+# instead of paying socket setup on every call.
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_lock: Optional[asyncio.Lock] = None
+
+# Shared session for the synchronous path: requests pools connections
+# per host, so repeated tool calls reuse one warm socket instead of
+# paying TCP setup and teardown every time.
+_sync_session = requests.Session()
+
+
+async def _get_async_client() -> httpx.AsyncClient:
+    """Lazily create the shared AsyncClient (guarded against races)."""
+    global _async_client, _async_client_lock
+
+    if _async_client_lock is None:
+        _async_client_lock = asyncio.Lock()
+
+    async with _async_client_lock:
+        if _async_client is None:
+            _async_client = httpx.AsyncClient(
+                base_url=BRIDGE_URL,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60.0)
+            )
+        return _async_client
+
+
+async def close_bridge_session() -> None:
+    """Close the shared async HTTP client (call on server shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+async def call_bridge_api_async(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Make an async HTTP call to the Rhino Bridge Server over a shared
+    keep-alive connection.
+
+    Args:
+        endpoint: API endpoint (e.g., '/draw_line')
+        data: Request payload dictionary
+
+    Returns:
+        Dict containing the API response
+    """
+    response = None
+    try:
+        client = await _get_async_client()
+
+        if data is None:
+            logger.info(f"Making GET request to {BRIDGE_URL}{endpoint}")
+            response = await client.get(endpoint)
+        else:
+            logger.info(f"Making POST request to {BRIDGE_URL}{endpoint} with data: {data}")
+            response = await client.post(
+                endpoint,
+                json=data,
+                headers={'Content-Type': 'application/json'}
+            )
+
+        logger.debug(f"Response status code: {response.status_code}")
+
+        response.raise_for_status()
+        return response.json()
+
+    except httpx.ConnectError as e:
+        error_msg = f"Cannot connect to Rhino Bridge Server at {BRIDGE_URL}. Make sure the bridge server is running in Rhino."
+        logger.error(f"Connection error: {e}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "error_type": "ConnectionError",
+            "endpoint": endpoint,
+            "bridge_url": BRIDGE_URL
+        }
+    except httpx.TimeoutException as e:
+        error_msg = f"Request to Rhino Bridge Server timed out after 10 seconds"
+        logger.error(f"Timeout error for {endpoint}: {e}")
+        return {
+            "success": False,
+            "error": error_msg,
+            "error_type": "Timeout",
+            "endpoint": endpoint,
+            "request_data": data
+        }
+    except httpx.HTTPStatusError as e:
+        # HTTP error (4xx, 5xx)
+        status_code = e.response.status_code
+        response_text = e.response.text
+
+        logger.error(f"HTTP error for {endpoint}: {e}")
+        logger.error(f"Response status: {status_code}")
+        logger.error(f"Response body: {response_text[:500]}")  # First 500 chars
+
+        return {
+            "success": False,
+            "error": f"HTTP {status_code} error from bridge server",
+            "error_type": "HTTPError",
+            "status_code": status_code,
+            "endpoint": endpoint,
+            "response_body": response_text[:1000],  # Include response for debugging
+            "request_data": data
+        }
+    except httpx.HTTPError as e:
+        # Generic transport-level error
+        logger.error(f"Bridge API request failed for {endpoint}: {e}")
+        return {
+            "success": False,
+            "error": f"Bridge API request failed: {str(e)}",
+            "error_type": "RequestException",
+            "endpoint": endpoint,
+            "request_data": data
+        }
+    except json.JSONDecodeError as e:
+        # Failed to parse JSON response
+        response_text = response.text if response is not None else ""
+        response_status = response.status_code if response is not None else "unknown"
+
+        logger.error(f"Failed to parse JSON response from {endpoint}")
+        logger.error(f"JSON decode error: {e}")
+        logger.error(f"Response body (first 500 chars): {response_text[:500]}")
+
+        return {
+            "success": False,
+            "error": f"Bridge API request failed: {str(e)}",
+            "error_type": "JSONDecodeError",
+            "endpoint": endpoint,
+            "request_data": data,
+            "response_status": response_status,
+            "response_body": response_text[:1000],  # First 1000 chars for debugging
+            "debug_hint": "The bridge server returned a non-JSON response. This may indicate a Python error in the handler or the endpoint doesn't exist."
+        }
+
+
+async def call_bridge_api_batch(
+    operations: Sequence[Union[Dict[str, Any], tuple]]
+) -> List[Dict[str, Any]]:
+    """
+    Submit several bridge operations in a single HTTP round-trip.
+
+    The bridge server's /batch endpoint dispatches each operation to its
+    registered handler and returns the results in submission order, so N
+    sequential tool operations cost one request instead of N.
+
+    Args:
+        operations: List of (endpoint, data) pairs or
+            {"endpoint": ..., "data": ...} dicts
+
+    Returns:
+        List of per-operation response dicts, in submission order
+    """
+    ops = []
+    for op in operations:
+        if isinstance(op, dict):
+            entry = {"endpoint": op["endpoint"], "data": op.get("data")}
+            # Optional result chaining: feed an earlier operation's output
+            # into this one's payload on the bridge side
+            if "input_from" in op:
+                entry["input_from"] = op["input_from"]
+            ops.append(entry)
+        else:
+            op_endpoint, op_data = op
+            ops.append({"endpoint": op_endpoint, "data": op_data})
+
+    response = await call_bridge_api_async("/batch", {"operations": ops})
+    if not response.get("success"):
+        # Transport-level failure: report it against every operation so
+        # callers can treat the result list uniformly
+        return [response for _ in ops]
+    return response.get("results", [])
+
+
 def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Make HTTP call to the Rhino Bridge Server.
@@ -36,11 +214,11 @@ def call_bridge_api(endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dic
         if data is None:
             # GET request
             logger.info(f"Making GET request to {url}")
-            response = requests.get(url, timeout=10)
+            response = _sync_session.get(url, timeout=10)
         else:
             # POST request
             logger.info(f"Making POST request to {url} with data: {data}")
-            response = requests.post(
+            response = _sync_session.post(
                 url,
                 json=data,
                 headers={'Content-Type': 'application/json'},
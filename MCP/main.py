@@ -23,7 +23,9 @@ except ImportError:
 
 # Import tool discovery system
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Tools'))
+_TOOLS_PATH = os.path.join(os.path.dirname(__file__), '..', 'Tools')
+if _TOOLS_PATH not in sys.path:
+    sys.path.append(_TOOLS_PATH)
 try:
     from tool_registry import discover_tools, get_rhino_tools, get_gh_tools, get_custom_tools
 except ImportError as e:
@@ -31,7 +33,7 @@ except ImportError as e:
     sys.exit(1)
 
 try:
-    from bridge_client import BRIDGE_URL, get_bridge_status
+    from bridge_client import BRIDGE_URL, get_bridge_status, close_bridge_session
 except ImportError as e:
     print(f"Error importing bridge client: {e}")
     sys.exit(1)
@@ -124,8 +126,19 @@ if __name__ == "__main__":
     # Start MCP server
     print("MCP server starting...")
     
-    # MCP Transport Options:    
+    # MCP Transport Options:
     # - "stdio": Standard input/output for local CLI tools (used with Claude Desktop)
     # - "sse": Server-Sent Events HTTP server for web-based access (app.run_sse(host, port))
     # - Custom: Direct asyncio streams with app.run(read_stream, write_stream, init_options)
-    mcp.run(transport="stdio")
\ No newline at end of file
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        # Release the shared keep-alive connection to the bridge. The
+        # client's connections belong to the server's already-terminated
+        # loop, so closing from a fresh loop can raise; at this point the
+        # process is exiting anyway, so a failed close is only logged.
+        import asyncio
+        try:
+            asyncio.run(close_bridge_session())
+        except Exception as e:
+            logger.warning(f"Could not close bridge session cleanly: {e}")
\ No newline at end of file
@@ -23,6 +23,24 @@ import urllib.parse
 import sys
 import os
 
+# Prefer a C-accelerated JSON encoder for responses when one is installed.
+# Handler results are large nested dicts with many repeated keys, so
+# serialization is a measurable part of the response path.
+try:
+    import orjson
+
+    def _encode_json(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    try:
+        import ujson
+
+        def _encode_json(data):
+            return ujson.dumps(data, indent=2).encode('utf-8')
+    except ImportError:
+        def _encode_json(data):
+            return json.dumps(data, indent=2).encode('utf-8')
+
 # Add Tools directory to path for dynamic handler discovery
 tools_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'Tools'))
 if tools_path not in sys.path:
@@ -154,6 +172,13 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
             else:
                 request_data = {}
 
+            # Built-in multi-op endpoint: run each listed operation
+            # against its dynamic handler and return the results in
+            # order, amortizing HTTP and JSON overhead over the batch
+            if endpoint == '/batch':
+                self.send_json_response(self.run_batch(request_data))
+                return
+
             # Try dynamic handler
             if endpoint in _dynamic_handlers:
                 try:
@@ -228,6 +253,72 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
             }
             self.send_json_response(error_response, 500)
     
+    def run_batch(self, request_data):
+        """Execute a list of operations against the dynamic handlers"""
+        import traceback
+
+        operations = request_data.get('operations')
+        if not isinstance(operations, list):
+            return {
+                "success": False,
+                "error": "Batch request must contain an 'operations' list",
+                "error_type": "InvalidBatchRequest",
+                "debug_hint": "POST {\"operations\": [{\"endpoint\": \"/draw_line\", \"data\": {...}}, ...]} to /batch."
+            }
+
+        results = []
+        for op in operations:
+            op_endpoint = op.get('endpoint') if isinstance(op, dict) else None
+            handler_func = _dynamic_handlers.get(op_endpoint)
+            if handler_func is None:
+                results.append({
+                    "success": False,
+                    "error": f"Unknown endpoint: {op_endpoint}",
+                    "error_type": "EndpointNotFound",
+                    "endpoint": op_endpoint,
+                    "debug_hint": "Each batch operation needs an 'endpoint' registered with @bridge_handler."
+                })
+                continue
+            op_data = op.get('data') or {}
+
+            # Optional chaining: merge the result of an earlier operation
+            # into this one's payload so dependent calls don't need a
+            # second round-trip to feed outputs forward
+            input_from = op.get('input_from')
+            if input_from is not None:
+                if isinstance(input_from, int) and 0 <= input_from < len(results):
+                    merged = dict(results[input_from])
+                    merged.update(op_data)
+                    op_data = merged
+                else:
+                    results.append({
+                        "success": False,
+                        "error": f"input_from index {input_from} does not refer to a completed operation",
+                        "error_type": "InvalidBatchRequest",
+                        "endpoint": op_endpoint,
+                        "debug_hint": "input_from must be the zero-based index of an earlier operation in the same batch."
+                    })
+                    continue
+
+            try:
+                results.append(handler_func(op_data))
+            except Exception as e:
+                error_traceback = traceback.format_exc()
+                print(f"ERROR: Handler exception for {op_endpoint} (batch)")
+                print(f"Exception type: {type(e).__name__}")
+                print(f"Exception message: {str(e)}")
+                print(f"Full traceback:\n{error_traceback}")
+                results.append({
+                    "success": False,
+                    "error": f"Handler error: {str(e)}",
+                    "error_type": type(e).__name__,
+                    "endpoint": op_endpoint,
+                    "traceback": error_traceback,
+                    "debug_hint": "An exception occurred in the Rhino bridge handler. Check the Rhino Python console for full traceback."
+                })
+
+        return {"success": True, "count": len(results), "results": results}
+
     def send_status_response(self):
         """Send server status"""
         status = {
@@ -275,8 +366,7 @@ class RhinoBridgeHandler(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
         
-        response_json = json.dumps(data, indent=2)
-        self.wfile.write(response_json.encode('utf-8'))
+        self.wfile.write(_encode_json(data))
     
     def send_error_response(self, status_code, message):
         """Send error response"""
@@ -0,0 +1,49 @@
+"""
+Shared .env cache
+
+Tool modules each need DEBUG_MODE (and potentially other settings) from
+the project-root .env file. Parsing it per module duplicates the disk
+read and the line-by-line loop; this module parses it once and hands the
+same dict to every caller, re-reading only when the file's mtime
+changes.
+"""
+
+import os
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_ENV_FILE = os.path.join(_PROJECT_ROOT, '.env')
+
+# (mtime, parsed dict) for the last successful read
+_cached = None
+
+
+def get_env():
+    """Parsed key/value pairs from the project .env file (may be empty)"""
+    global _cached
+    try:
+        mtime = os.path.getmtime(_ENV_FILE)
+    except OSError:
+        # No .env file; callers fall back to the process environment
+        return {}
+
+    if _cached is None or _cached[0] != mtime:
+        env = {}
+        try:
+            with open(_ENV_FILE, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        env[key.strip()] = value.strip()
+        except (OSError, UnicodeDecodeError):
+            return {}
+        _cached = (mtime, env)
+    return _cached[1]
+
+
+def get_debug_mode():
+    """DEBUG_MODE from .env, falling back to the process environment"""
+    env = get_env()
+    if 'DEBUG_MODE' in env:
+        return env['DEBUG_MODE'].lower() == 'true'
+    return os.environ.get('DEBUG_MODE', 'false').lower() == 'true'
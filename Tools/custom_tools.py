@@ -21,9 +21,10 @@ import numpy as np
 try:
     from tool_registry import custom_tool
 except ImportError:
-    # Add parent directory to path for imports
+    # Add parent directory to path for imports (only once per process)
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    sys.path.append(parent_dir)
+    if parent_dir not in sys.path:
+        sys.path.append(parent_dir)
     from tool_registry import custom_tool
 
 @custom_tool(
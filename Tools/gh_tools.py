@@ -9,11 +9,24 @@ Tools are automatically registered using the @gh_tool decorator.
 
 import sys
 import os
+import re
+import time
+import array
+import asyncio
+import functools
+import threading
+import traceback
+from collections import Counter
+from heapq import nsmallest
+from operator import itemgetter
 from typing import Dict, Any
 
-# Import bridge_client from MCP directory
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'MCP'))
-from bridge_client import call_bridge_api
+# Import bridge_client from MCP directory (path added once per process;
+# discovery reloads this module and unguarded appends grow sys.path)
+_MCP_PATH = os.path.join(os.path.dirname(__file__), '..', 'MCP')
+if _MCP_PATH not in sys.path:
+    sys.path.append(_MCP_PATH)
+from bridge_client import call_bridge_api, call_bridge_api_async
 
 # Import the decorator system
 try:
@@ -22,31 +35,1024 @@ except ImportError:
     # Fallback for direct import
     from tool_registry import gh_tool, bridge_handler
 
-# Get DEBUG_MODE from environment or bridge server
-DEBUG_MODE = False
+# Get DEBUG_MODE from the shared, mtime-cached .env parse
 try:
-    # Try to load from .env file in project root
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    env_file = os.path.join(project_root, '.env')
-
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key.strip() == 'DEBUG_MODE':
-                        DEBUG_MODE = value.strip().lower() == 'true'
-                        break
-    else:
-        DEBUG_MODE = os.environ.get('DEBUG_MODE', 'false').lower() == 'true'
+    from ._envcache import get_debug_mode
+except ImportError:
+    # Fallback for direct import
+    from _envcache import get_debug_mode
+DEBUG_MODE = get_debug_mode()
+
+# Tracebacks are only formatted when explicitly requested: format_exc
+# walks every frame and reads source files from disk, which is a silent
+# tax on error paths that agents retry in loops.
+_DEBUG_TB = DEBUG_MODE or os.environ.get('RHINO_MCP_DEBUG_TB', '0') == '1'
+
+# Rhino/Grasshopper version strings are constant for the life of the process,
+# so resolve them once at import time instead of on every debug call.
+# Outside of Rhino these imports fail and the values stay "Unknown".
+_RHINO_VERSION = "Unknown"
+_GH_VERSION = "Unknown"
+try:
+    import Rhino as _Rhino
+    _RHINO_VERSION = str(_Rhino.RhinoApp.Version)
 except:
-    DEBUG_MODE = False
+    pass
+try:
+    import Grasshopper as _Grasshopper
+    if hasattr(_Grasshopper, 'Versioning'):
+        _GH_VERSION = str(_Grasshopper.Versioning.Version)
+except:
+    pass
+
+# Whether the Grasshopper assemblies are importable is fixed for the life
+# of the process: inside Rhino they are, on the MCP side they never will
+# be. Probe once at import so handlers can short-circuit on a flag instead
+# of paying for an ImportError on every call.
+try:
+    import clr as _clr
+    _clr.AddReference('Grasshopper')
+    import Grasshopper  # noqa: F401 -- re-imported locally by handlers
+    _GH_AVAILABLE = True
+    _GH_IMPORT_ERROR = None
+except Exception as _gh_err:
+    _GH_AVAILABLE = False
+    _GH_IMPORT_ERROR = str(_gh_err)
+
+
+# Interpreter/CLR facts never change for the life of the process, so the
+# debug handler reads them from this memo instead of re-probing per call
+_SYSTEM_INFO = None
+
+
+def _system_info():
+    """Process-constant interpreter and CLR info, computed once"""
+    global _SYSTEM_INFO
+    if _SYSTEM_INFO is None:
+        info = {
+            "python_version": sys.version,
+            "platform": sys.platform,
+            "clr_version": "Unknown"
+        }
+        try:
+            import clr
+            if hasattr(clr, 'version'):
+                info["clr_version"] = str(clr.version)
+        except ImportError:
+            pass
+        _SYSTEM_INFO = info
+    return _SYSTEM_INFO
+
+
+def _gh_unavailable():
+    """Standard error dict for calls made where Grasshopper cannot load"""
+    return {
+        "success": False,
+        "error": f"Grasshopper not available: {_GH_IMPORT_ERROR}"
+    }
+
+
+# Special component classes and their per-type detail builders, bound once.
+# Resolving Grasshopper.Kernel.Special.GH_* is a chain of CLR attribute
+# lookups, so handlers fetch these instead of re-resolving inside loops.
+_SPECIAL_TYPES = None
+_SPECIAL_HANDLERS = None
+
+
+def _component_slider_details(obj, component_info):
+    """Fill the slider-specific fields of a component record"""
+    slider = obj.Slider
+    component_info["is_special"] = True
+    component_info["special_type"] = "NumberSlider"
+    component_info["slider_info"] = {
+        "current_value": _dec_to_float(slider.Value),
+        "min_value": _dec_to_float(slider.Minimum),
+        "max_value": _dec_to_float(slider.Maximum),
+        "precision": slider.DecimalPlaces
+    }
+
+
+def _component_panel_details(obj, component_info):
+    """Fill the panel-specific fields of a component record"""
+    component_info["is_special"] = True
+    component_info["special_type"] = "Panel"
+    component_info["panel_text"] = getattr(obj, 'UserText', "")
+
+
+def _component_valuelist_details(obj, component_info):
+    """Fill the ValueList-specific fields of a component record"""
+    component_info["is_special"] = True
+    component_info["special_type"] = "ValueList"
+    component_info["list_items"] = [
+        {"name": item.Name, "value": str(item.Value)}
+        for item in obj.ListItems
+    ] if hasattr(obj, 'ListItems') else []
+
+
+def _clamp(value, lo, hi):
+    """
+    Clamp value into [lo, hi], returning (clamped_value, was_clamped).
+
+    Deriving the flag from the comparisons avoids the equality test
+    between the caller's int/float input and the clamped float, which
+    could report a spurious clamp when the types differed.
+    """
+    if value < lo:
+        return lo, True
+    if value > hi:
+        return hi, True
+    return value, False
+
+
+# The Grasshopper plugin object is process-wide; resolve it once instead
+# of calling GetPlugInObject (a CLR crossing) on every RPC.
+_GH_PLUGIN = None
+_GH_SETUP_LOCK = threading.Lock()
+
+
+def _gh_setup():
+    """Resolve and memoize the Grasshopper plugin object"""
+    global _GH_PLUGIN
+    if _GH_PLUGIN is None:
+        with _GH_SETUP_LOCK:
+            if _GH_PLUGIN is None:
+                _, Rhino = _get_gh()
+                _GH_PLUGIN = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+    return _GH_PLUGIN
+
+
+# Memoized (Grasshopper, Rhino) module references. clr.AddReference and
+# the module imports only need to run once per process; afterwards every
+# handler call is a tuple unpack instead of CLR metadata work.
+_GH_MODULES = None
+
+
+def _get_gh():
+    """Return the cached (Grasshopper, Rhino) modules, importing once"""
+    global _GH_MODULES
+    if _GH_MODULES is None:
+        with _GH_SETUP_LOCK:
+            if _GH_MODULES is None:
+                import clr
+                clr.AddReference('Grasshopper')
+                import Grasshopper
+                import Rhino
+                _GH_MODULES = (Grasshopper, Rhino)
+    return _GH_MODULES
+
+
+def _acquire_doc():
+    """
+    Resolve the memoized plugin and the active document in one step.
+
+    Returns (gh, gh_doc, error) where error is a ready-to-return error
+    dict when acquisition failed; callers merge their own context keys
+    into it. The plugin lookup is cached, so after the first call this
+    costs one ActiveCanvas property read per request.
+    """
+    gh = _gh_setup()
+    if not gh:
+        return None, None, {
+            "success": False,
+            "error": "Grasshopper plugin not available"
+        }
+
+    Grasshopper, _ = _get_gh()
+    canvas = Grasshopper.Instances.ActiveCanvas
+    gh_doc = canvas.Document if canvas else None
+    if not gh_doc:
+        return gh, None, {
+            "success": False,
+            "error": "No active Grasshopper document found"
+        }
+
+    return gh, gh_doc, None
+
+
+def gh_doc_handler(error_context):
+    """
+    Decorator collapsing the setup/error boilerplate shared by document
+    handlers. The wrapped function receives (gh, gh_doc, data) with the
+    plugin and active document already resolved; availability checks and
+    the standard error dicts are handled here once.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapped(data):
+            if not _GH_AVAILABLE:
+                return _gh_unavailable()
+            try:
+                gh, gh_doc, err = _acquire_doc()
+                if err:
+                    return err
+
+                return fn(gh, gh_doc, data)
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": f"Error {error_context}: {str(e)}",
+                    "traceback": traceback.format_exc() if _DEBUG_TB else None
+                }
+        return wrapped
+    return decorate
+
+
+# Cached slider analysis, keyed on a document fingerprint. Connection
+# wiring only changes when the graph is edited, so repeated analysis
+# calls (the normal agent pattern before deciding what to mutate) can be
+# answered without re-walking every slider's recipients.
+_ANALYZE_CACHE = None
+_DOC_MUTATION_COUNT = 0
+
+# Last runtime-message scan from the debug snapshot, keyed by the same
+# document fingerprint as the analysis cache.
+_MSG_SNAPSHOT_CACHE = None
+
+
+def _bump_doc_mutation():
+    """Invalidate per-solve caches after this process mutates the document"""
+    global _DOC_MUTATION_COUNT
+    _DOC_MUTATION_COUNT += 1
+
+
+def _doc_solution_token(gh_doc):
+    """Fingerprint that changes when the document mutates or recomputes"""
+    return (id(gh_doc), gh_doc.ObjectCount,
+            getattr(gh_doc, 'SolutionIndex', None),
+            _DOC_MUTATION_COUNT)
+
+
+# Slider purpose inference, compiled once. Each entry is checked in
+# priority order; a compiled alternation replaces the per-call
+# any(keyword in name for keyword in [...]) substring scans.
+_PURPOSE_PATTERNS = [
+    (re.compile(r"width|w|x"), "Width/X-dimension control"),
+    (re.compile(r"height|h|y"), "Height/Y-dimension control"),
+    (re.compile(r"depth|d|z"), "Depth/Z-dimension control"),
+    (re.compile(r"count|num|n"), "Count/quantity control"),
+    (re.compile(r"angle|rot|rotation"), "Angle/rotation control"),
+    (re.compile(r"scale|size"), "Scale/size control"),
+    (re.compile(r"offset|shift"), "Offset/position control")
+]
+
+_TRANSFORM_TYPES = frozenset(("GH_Move", "Transform"))
+_DIVISION_TYPES = frozenset(("GH_Divide", "Division"))
+
+
+def _infer_slider_purpose(name_lower, connected_types, connected_components):
+    """Classify what a slider controls from its name and connections"""
+    for pattern, label in _PURPOSE_PATTERNS:
+        if pattern.search(name_lower):
+            return label
+    if not _TRANSFORM_TYPES.isdisjoint(connected_types):
+        return "Transformation parameter"
+    if not _DIVISION_TYPES.isdisjoint(connected_types):
+        return "Division/array parameter"
+    if connected_components:
+        return f"Parameter for {connected_components[0]['component_name']}"
+    return "Unknown"
+
+
+def _ensure_gh_types():
+    """Bind (GH_NumberSlider, GH_Panel, GH_ValueList) and the dispatch table once"""
+    global _SPECIAL_TYPES, _SPECIAL_HANDLERS
+    if _SPECIAL_TYPES is None:
+        import Grasshopper
+        special = Grasshopper.Kernel.Special
+        _SPECIAL_TYPES = (special.GH_NumberSlider, special.GH_Panel, special.GH_ValueList)
+        _SPECIAL_HANDLERS = {
+            special.GH_NumberSlider: _component_slider_details,
+            special.GH_Panel: _component_panel_details,
+            special.GH_ValueList: _component_valuelist_details
+        }
+    return _SPECIAL_TYPES
+
+
+# The four "special" input types the EML/bulk handlers classify against.
+# Resolving Grasshopper.Kernel.Special.GH_X is three attribute lookups
+# through a CLR namespace proxy; handlers bind these to locals at loop
+# entry so the per-object isinstance checks run against plain locals.
+_SPECIAL_INPUT_TYPES = None
+
+
+def _special_types():
+    """Bind (GH_NumberSlider, GH_Panel, GH_BooleanToggle, GH_ValueList) once"""
+    global _SPECIAL_INPUT_TYPES
+    if _SPECIAL_INPUT_TYPES is None:
+        Grasshopper, _ = _get_gh()
+        special = Grasshopper.Kernel.Special
+        _SPECIAL_INPUT_TYPES = (special.GH_NumberSlider, special.GH_Panel,
+                                special.GH_BooleanToggle, special.GH_ValueList)
+    return _SPECIAL_INPUT_TYPES
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Ordered (predicate, extractor) probes for pulling display text out of a
+# panel object. Iterated once per panel, breaking on the first hit, instead
+# of running three independent try/except blocks per object.
+_PANEL_TEXT_PROBES = [
+    (lambda o: hasattr(o, 'Properties') and hasattr(o.Properties, 'Text'),
+     lambda o: o.Properties.Text),
+    (lambda o: hasattr(o, 'GetValue'),
+     lambda o: o.GetValue(0, 0)),
+    (lambda o: hasattr(o, 'ToString'),
+     lambda o: o.ToString()),
+]
+
+# Memoizes the winning probe per .NET type so repeated calls skip the
+# hasattr scans entirely. .NET types are static per-process, so the
+# cache never needs invalidation.
+_PANEL_PROBE_CACHE = {}
+
+
+def _panel_display_text(obj):
+    """Get a panel's display text via the first accessor its type supports"""
+    extract = _PANEL_PROBE_CACHE.get(type(obj))
+    if extract is not None:
+        value = extract(obj)
+        return str(value) if value is not None else None
+
+    for probe, extract in _PANEL_TEXT_PROBES:
+        if probe(obj):
+            value = extract(obj)
+            if value is not None:
+                _PANEL_PROBE_CACHE[type(obj)] = extract
+                return str(value)
+    return None
+
+
+def _objects_of_type(gh_doc, net_type):
+    """
+    Iterate document objects of a single .NET type.
+
+    Pushes the type filter down to LINQ so non-matching objects never cross
+    the CLR/Python boundary; falls back to a Python-side isinstance filter
+    when System.Linq is not importable.
+    """
+    try:
+        from System.Linq import Enumerable
+        return Enumerable.OfType[net_type](gh_doc.Objects)
+    except ImportError:
+        return (obj for obj in gh_doc.Objects if isinstance(obj, net_type))
+
+
+# Materialized per-type object lists, keyed per component kind. The
+# version token (document identity + object count) is cheap to compute and
+# changes whenever objects are added or removed, which is when the list
+# could go stale. Repeated listing calls then reuse the same Python list
+# instead of re-enumerating gh_doc.Objects through interop.
+_TYPED_OBJECTS_CACHE = {}
+
+
+def _typed_objects(gh_doc, net_type, kind):
+    """
+    Get the cached list of document objects of one .NET type, rebuilding
+    only when the document or its object count changes.
+    """
+    token = (id(gh_doc), gh_doc.ObjectCount)
+    cached = _TYPED_OBJECTS_CACHE.get(kind)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    objs = list(_objects_of_type(gh_doc, net_type))
+    _TYPED_OBJECTS_CACHE[kind] = (token, objs)
+    return objs
+
+
+# Lazily built {nickname: [objects]} indexes keyed per component kind,
+# versioned with the same token as the typed-object lists.
+_NICKNAME_INDEX_CACHE = {}
+
+
+def _nickname_index(gh_doc, net_type, kind):
+    """
+    Get a {nickname: [objects]} index for one component type, rebuilding it
+    only when the document or its object count changes. Makes named lookups
+    O(1) instead of a full document scan per call.
+    """
+    token = (id(gh_doc), gh_doc.ObjectCount)
+    cached = _NICKNAME_INDEX_CACHE.get(kind)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    index = {}
+    for obj in _typed_objects(gh_doc, net_type, kind):
+        index.setdefault(obj.NickName or "Unnamed", []).append(obj)
+    _NICKNAME_INDEX_CACHE[kind] = (token, index)
+    return index
+
+
+# Per-ValueList {name-or-value: index} lookup tables, keyed by object
+# identity and versioned with the item count. Avoids re-scanning (and
+# re-stringifying) the items on every selection request.
+_VL_ITEM_INDEX_CACHE = {}
+
+
+def _valuelist_item_index(obj, items):
+    """
+    Get the {selector: index} table for one ValueList, rebuilding when
+    its item count changes. Names and stringified values are merged in
+    scan order with setdefault, so lookups resolve to the same item the
+    old first-match loop found.
+    """
+    key = id(obj)
+    count = len(items)
+    cached = _VL_ITEM_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == count:
+        return cached[1]
+
+    table = {}
+    for i, item in enumerate(items):
+        table.setdefault(item.Name, i)
+        table.setdefault(str(item.Value), i)
+    _VL_ITEM_INDEX_CACHE[key] = (count, table)
+    return table
+
+
+def _extract_slider_info(obj):
+    """Build the info dict for a GH_NumberSlider (shared by list and bulk tools)"""
+    # Fetch the GH_SliderBase once; each obj.Slider access is its own
+    # CLR property crossing
+    slider = obj.Slider
+    return {
+        "name": obj.NickName or "Unnamed",
+        "current_value": _dec_to_float(slider.Value),
+        "min_value": _dec_to_float(slider.Minimum),
+        "max_value": _dec_to_float(slider.Maximum),
+        "precision": slider.DecimalPlaces,
+        "type": slider.Type.ToString()
+    }
+
+
+try:
+    # Available when running inside Rhino; on the MCP side the System
+    # namespace does not exist, so fall back to the Python-only subset
+    from System import NullReferenceException, InvalidOperationException
+    _EXPECTED_NET_ERRORS = (AttributeError, NullReferenceException, InvalidOperationException)
+except ImportError:
+    _EXPECTED_NET_ERRORS = (AttributeError,)
+
+try:
+    from System import Decimal as _NetDecimal
+except ImportError:
+    _NetDecimal = None
+
+
+def _dec_to_float(value):
+    """
+    Convert a .NET Decimal (slider Value/Minimum/Maximum) to a Python float.
+
+    Decimal.ToDouble is a single numeric conversion across the CLR
+    boundary, versus float(str(...)) which marshals a managed string and
+    re-parses it per value. Falls back to the string route for anything
+    that is not a Decimal.
+    """
+    if _NetDecimal is not None:
+        try:
+            return _NetDecimal.ToDouble(value)
+        except (TypeError, ValueError):
+            pass
+    return float(str(value))
+
+
+def _extract_valuelist_info(obj):
+    """Build the info dict for a GH_ValueList (shared by list and bulk tools)"""
+    # Hoist the properties; each access is an interop crossing, and the old
+    # loop re-read SelectionIndex per item
+    sel = obj.SelectionIndex
+    valuelist_info = {
+        "name": obj.NickName or "Unnamed",
+        "current_selection_index": sel,
+        "current_selection_name": None,
+        "current_selection_value": None,
+        "list_items": []
+    }
+
+    # Get all available items
+    if hasattr(obj, 'ListItems'):
+        items = obj.ListItems
+        valuelist_info["list_items"] = [
+            {"index": i, "name": item.Name, "value": str(item.Value)}
+            for i, item in enumerate(items)
+        ]
+
+        # Resolve the current selection with one indexed access
+        if 0 <= sel < len(items):
+            selected = items[sel]
+            valuelist_info["current_selection_name"] = selected.Name
+            valuelist_info["current_selection_value"] = str(selected.Value)
+
+    return valuelist_info
+
+
+# The context analyzers query "scribbles within 150 canvas units" once
+# per slider/parameter. Bucketing scribbles into a radius-sized grid
+# turns each query from a scan of every scribble into a lookup of at
+# most nine cells; exact distances are only computed for the candidates.
+_ANNOTATION_RADIUS = 150.0
+_ANNOTATION_RADIUS_SQ = _ANNOTATION_RADIUS * _ANNOTATION_RADIUS
+
+
+def _scribble_grid(scribbles):
+    """Bucket scribbles into radius-sized grid cells for point queries.
+
+    Cells hold flat (x, y, text, text_lower) tuples rather than the
+    scribble dicts, so the distance loop unpacks plain floats and the
+    lowercase text needed for purpose inference is computed once per
+    scribble instead of once per nearby component.
+    """
+    grid = {}
+    cell = _ANNOTATION_RADIUS
+    for scribble in scribbles:
+        pos = scribble["position"]
+        x = pos["x"]
+        y = pos["y"]
+        text = scribble["text"]
+        key = (int(x // cell), int(y // cell))
+        grid.setdefault(key, []).append((x, y, text, text.lower()))
+    return grid
+
+
+def _scribble_candidates(grid, x, y):
+    """(x, y, text, text_lower) tuples in the 3x3 cells around (x, y)"""
+    cell = _ANNOTATION_RADIUS
+    cx = int(x // cell)
+    cy = int(y // cell)
+    out = []
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            bucket = grid.get((gx, gy))
+            if bucket:
+                out.extend(bucket)
+    return out
+
+
+# Geometry parameter classes recognised by the context analyzers, keyed
+# by their full CLR type name. The outputs analyzer additionally treats
+# mesh params as geometry.
+_GEOM_INPUT_PARAM_TYPES = frozenset((
+    "Grasshopper.Kernel.Parameters.Param_Curve",
+    "Grasshopper.Kernel.Parameters.Param_Surface",
+    "Grasshopper.Kernel.Parameters.Param_Brep",
+    "Grasshopper.Kernel.Parameters.Param_Geometry",
+    "Grasshopper.Kernel.Parameters.Param_Line",
+    "Grasshopper.Kernel.Parameters.Param_Circle",
+    "Grasshopper.Kernel.Parameters.Param_Arc",
+    "Grasshopper.Kernel.Parameters.Param_Point",
+))
+_GEOM_OUTPUT_PARAM_TYPES = _GEOM_INPUT_PARAM_TYPES | frozenset((
+    "Grasshopper.Kernel.Parameters.Param_Mesh",
+))
+
+# Inferred purpose keyed directly by the param's full type name; generic
+# param types (Brep, Geometry, Circle, Arc) fall back to the
+# context-keyword scan in the inputs analyzer
+_PARAM_PURPOSE = {
+    "Grasshopper.Kernel.Parameters.Param_Curve": "Curve input",
+    "Grasshopper.Kernel.Parameters.Param_Surface": "Surface input",
+    "Grasshopper.Kernel.Parameters.Param_Point": "Point input",
+    "Grasshopper.Kernel.Parameters.Param_Line": "Line input"
+}
+
+# Priority-ordered purpose classifiers for the context analyzers (same
+# scheme as _PURPOSE_PATTERNS): each compiled alternation stands in for a
+# chain of per-keyword substring scans over the assembled context text
+_INPUT_PURPOSE_PATTERNS = [
+    (re.compile(r"length|distance|span"), "Length/Distance control"),
+    (re.compile(r"width|wide"), "Width control"),
+    (re.compile(r"height|tall|depth"), "Height/Depth control"),
+    (re.compile(r"count|number|quantity|num"), "Count/Quantity control"),
+    (re.compile(r"angle|rotation|rotate"), "Angle/Rotation control"),
+    (re.compile(r"factor|ratio|proportion"), "Factor/Ratio control"),
+    (re.compile(r"truss|structural|beam"), "Structural parameter")
+]
+
+_OUTPUT_PURPOSE_PATTERNS = [
+    (re.compile(r"truss|beam|member|element"), "Structural elements output"),
+    (re.compile(r"upper|top|chord"), "Upper/top elements output"),
+    (re.compile(r"lower|bottom"), "Lower/bottom elements output"),
+    (re.compile(r"vertical|vert"), "Vertical elements output"),
+    (re.compile(r"diagonal|diag|brace"), "Diagonal/bracing elements output")
+]
+
+# One "Module.Name" string per distinct type instead of rebuilding it for
+# every object on the canvas
+_TYPE_FULLNAME_CACHE = {}
+
+
+def _type_fullname(net_type):
+    """Memoized type.__module__ + "." + type.__name__."""
+    full = _TYPE_FULLNAME_CACHE.get(net_type)
+    if full is None:
+        full = _TYPE_FULLNAME_CACHE[net_type] = net_type.__module__ + "." + net_type.__name__
+    return full
+
+
+def _annotations_near(grid, px, py, limit=5):
+    """The `limit` annotations nearest to (px, py) within _ANNOTATION_RADIUS.
+
+    Returns (entries, lowered): the payload dicts nearest-first and the
+    matching pre-lowered texts for purpose inference. Candidates are
+    rejected on squared distance; the sqrt runs only for the entries
+    that survive nsmallest, which keeps selection O(n log limit)
+    instead of sorting everything in range.
+    """
+    nearby = []
+    append = nearby.append
+    for x, y, text, text_lower in _scribble_candidates(grid, px, py):
+        dx = x - px
+        dy = y - py
+        d2 = dx * dx + dy * dy
+        if d2 < _ANNOTATION_RADIUS_SQ:
+            append((d2, text, text_lower))
+    nearest = nsmallest(limit, nearby, key=itemgetter(0))
+    entries = [{"text": text, "distance": d2 ** 0.5} for d2, text, _ in nearest]
+    lowered = [text_lower for _, _, text_lower in nearest]
+    return entries, lowered
+
+
+# Capability probes memoized per (type, attribute). hasattr on a CLR
+# proxy is an exception-guarded member lookup, and member availability
+# is decided by the type, not the instance, so one probe per type is
+# enough.
+_HAS_CACHE = {}
+
+
+def _has(obj, attr):
+    """Memoized hasattr keyed on (type(obj), attr)"""
+    key = (type(obj), attr)
+    cached = _HAS_CACHE.get(key)
+    if cached is None:
+        cached = _HAS_CACHE[key] = hasattr(obj, attr)
+    return cached
+
+
+# Is-a-parameter classification, also type-determined: the name test
+# and both capability probes give the same answer for every instance of
+# a component class. Values are (is_param, has_sources_attr) tuples so
+# one cache lookup answers both questions.
+_PARAM_CLS_CACHE = {}
+
+
+def _param_traits(obj):
+    """Memoized per-type traits of a component: (is_param, has_sources_attr)"""
+    t = type(obj)
+    v = _PARAM_CLS_CACHE.get(t)
+    if v is None:
+        is_param = ("Param" in t.__name__ or
+                    (hasattr(obj, 'Category') and obj.Category == "Params") or
+                    hasattr(obj, 'PersistentData'))
+        v = _PARAM_CLS_CACHE[t] = (is_param, hasattr(obj, 'SourceCount'))
+    return v
+
+
+def _is_param(obj):
+    """Memoized check that an object is a settable parameter component"""
+    return _param_traits(obj)[0]
+
+
+# Shared canvas-layout snapshot reused across /analyze_inputs_context and
+# /analyze_outputs_context, which callers typically hit back-to-back on
+# the same document.
+_DOC_CTX_CACHE = None
+
+
+def _build_doc_context(Grasshopper, gh_doc, debug_log=None):
+    """
+    One pass over gh_doc.Objects producing the layout context both
+    analyzers need: per-object records with guid/pivot read into plain
+    Python values, slider and scribble buckets, the group map, the
+    component-to-group mapping, the scribble grid and guid/name lookup
+    indexes. Cached against the document fingerprint so consecutive
+    calls share one scan.
+    """
+    global _DOC_CTX_CACHE
+    token = _doc_solution_token(gh_doc)
+    if _DOC_CTX_CACHE is not None and _DOC_CTX_CACHE[0] == token:
+        return _DOC_CTX_CACHE[1]
+
+    GH_Group = Grasshopper.Kernel.Special.GH_Group
+    GH_Scribble = Grasshopper.Kernel.Special.GH_Scribble
+    GH_NumberSlider = Grasshopper.Kernel.Special.GH_NumberSlider
+    GH_Panel = Grasshopper.Kernel.Special.GH_Panel
+
+    group_records = []   # (obj, guid, bounds_data)
+    all_records = []     # (obj, guid, x, y)
+    slider_records = []
+    param_records = []   # candidates for geometry-param analysis
+    scribbles = []
+    guid_to_obj = {}
+    name_to_objs = {}    # {name_lower: [(obj, display_name)]} in doc order
+    name_records = []    # flat (obj, display_name, name_lower) in doc order
+
+    for obj in gh_doc.Objects:
+        try:
+            obj_guid = str(obj.InstanceGuid)
+            attrs = obj.Attributes
+            pivot = attrs.Pivot
+
+            record = (obj, obj_guid, float(pivot.X), float(pivot.Y))
+            all_records.append(record)
+            guid_to_obj[obj_guid] = obj
+
+            nick = obj.NickName
+            name = nick if nick else (obj.Name if _has(obj, 'Name') else "Unnamed")
+            name_lower = name.lower()
+            name_to_objs.setdefault(name_lower, []).append((obj, name))
+            name_records.append((obj, name, name_lower))
+
+            if isinstance(obj, GH_Group):
+                # Groups are the only objects whose Bounds we consume;
+                # convert to JSON-serializable form on the spot
+                if _has(attrs, 'Bounds'):
+                    bounds_rect = attrs.Bounds
+                    group_records.append((obj, obj_guid, {
+                        "left": float(bounds_rect.Left),
+                        "right": float(bounds_rect.Right),
+                        "top": float(bounds_rect.Top),
+                        "bottom": float(bounds_rect.Bottom)
+                    }))
+            elif isinstance(obj, GH_Scribble):
+                # Collect scribble text annotations
+                scribble_text = ""
+                if _has(obj, 'Text'):
+                    scribble_text = obj.Text
+                elif _has(obj, 'RichText'):
+                    scribble_text = obj.RichText
+
+                scribbles.append({
+                    "text": scribble_text,
+                    "position": {"x": record[2], "y": record[3]},
+                    "guid": obj_guid
+                })
+            elif isinstance(obj, GH_NumberSlider):
+                slider_records.append(record)
+            elif not isinstance(obj, GH_Panel):
+                param_records.append(record)
+        except Exception as obj_error:
+            if debug_log is not None:
+                debug_log.append(f"Error processing object {obj.NickName if _has(obj, 'NickName') else 'unknown'}: {str(obj_error)}")
+            continue
+
+    # Build a map of groups and their contained objects
+    groups_map = {}
+    for obj, obj_guid, bounds_data in group_records:
+        groups_map[obj_guid] = {
+            "name": obj.NickName or "Unnamed Group",
+            "color": str(obj.Colour) if _has(obj, 'Colour') else "Unknown",
+            "bounds": bounds_data,
+            "members": []
+        }
+
+    # Flatten group boxes once so the containment loop compares plain
+    # floats instead of chasing the nested bounds dicts per pair.
+    # Sorted smallest-area first: the first box containing a pivot is
+    # then the most specific (innermost) group rather than whichever
+    # group happened to enumerate first, and canvas-spanning groups
+    # that rarely match are tried last.
+    group_boxes = sorted(
+        ((info["bounds"]["left"], info["bounds"]["right"],
+          info["bounds"]["top"], info["bounds"]["bottom"], info)
+         for info in groups_map.values()),
+        key=lambda box: (box[1] - box[0]) * (box[3] - box[2])
+    )
+
+    # Map components to their groups
+    component_group_map = {}
+    for obj, obj_guid, px, py in all_records:
+        for left, right, top, bottom, group_info in group_boxes:
+            if left <= px <= right and top <= py <= bottom:
+                component_group_map[obj_guid] = group_info["name"]
+                group_info["members"].append(obj.NickName or type(obj).__name__)
+                break
+
+    ctx = {
+        "all_records": all_records,
+        "slider_records": slider_records,
+        "param_records": param_records,
+        "groups_map": groups_map,
+        "component_group_map": component_group_map,
+        "scribbles": scribbles,
+        "scribble_grid": _scribble_grid(scribbles),
+        "guid_to_obj": guid_to_obj,
+        "name_to_objs": name_to_objs,
+        "name_records": name_records
+    }
+    _DOC_CTX_CACHE = (token, ctx)
+    return ctx
+
+
+# Normalized curve parameters sampled when extracting curve outputs
+_SAMPLE_FRACS = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+# Rhino geometry type -> Grasshopper goo wrapper, and type -> extraction
+# branch tag. Both tables are built lazily (Rhino is only importable in
+# the bridge process) and memoized per concrete type, so the second
+# NurbsCurve in a list costs one dict hit instead of an isinstance
+# ladder across CLR proxies.
+_GH_WRAP_BASES = None
+_GH_WRAP_CACHE = {}
+
+_GEOM_KIND_BASES = None
+_GEOM_KIND_CACHE = {}
+
+
+def _gh_wrapper_for(geom_type):
+    """Goo wrapper class for a concrete Rhino geometry type, or None"""
+    global _GH_WRAP_BASES
+    if _GH_WRAP_BASES is None:
+        Grasshopper, Rhino = _get_gh()
+        types = Grasshopper.Kernel.Types
+        geo = Rhino.Geometry
+        _GH_WRAP_BASES = [
+            (geo.Curve, types.GH_Curve),
+            (geo.Surface, types.GH_Surface),
+            (geo.Brep, types.GH_Brep),
+            (geo.Point3d, types.GH_Point),
+            (geo.Mesh, types.GH_Mesh),
+        ]
+    try:
+        return _GH_WRAP_CACHE[geom_type]
+    except KeyError:
+        wrapper = None
+        for base, wrap in _GH_WRAP_BASES:
+            try:
+                if issubclass(geom_type, base):
+                    wrapper = wrap
+                    break
+            except TypeError:
+                continue
+        _GH_WRAP_CACHE[geom_type] = wrapper
+        return wrapper
+
+
+# Buffer element type for the batched persistent-data append, keyed by
+# the target parameter's class name. Typed persistent params carry a
+# GH_Structure of their own goo type; matching the buffer's element type
+# lets AppendRange bind directly instead of dropping to per-item adds.
+_PARAM_GOO_TYPES = None
+
+
+def _goo_type_for_param(param_type_name):
+    """List element type for a parameter class name, or None for generic"""
+    global _PARAM_GOO_TYPES
+    if _PARAM_GOO_TYPES is None:
+        Grasshopper, _Rhino = _get_gh()
+        types = Grasshopper.Kernel.Types
+        _PARAM_GOO_TYPES = {
+            "Param_Point": types.GH_Point,
+            "Param_Curve": types.GH_Curve,
+            "Param_Surface": types.GH_Surface,
+            "Param_Brep": types.GH_Brep,
+            "Param_Mesh": types.GH_Mesh,
+        }
+    return _PARAM_GOO_TYPES.get(param_type_name)
+
+
+def _geom_kind(geom_type):
+    """Extraction branch tag for a concrete type (ladder priority order)"""
+    global _GEOM_KIND_BASES
+    if _GEOM_KIND_BASES is None:
+        _Grasshopper, Rhino = _get_gh()
+        geo = Rhino.Geometry
+        # Order mirrors the original isinstance ladder: Line/Arc/Circle
+        # are structs and must be tested before Curve
+        _GEOM_KIND_BASES = [
+            (geo.Line, "Line"),
+            (geo.Arc, "Arc"),
+            (geo.Circle, "Circle"),
+            (geo.Curve, "Curve"),
+            (geo.Surface, "Surface"),
+            (geo.Point3d, "Point"),
+            (geo.Brep, "Brep"),
+            (geo.Mesh, "Mesh"),
+            (int, "Number"),
+            (float, "Number"),
+            (str, "Text"),
+            (bool, "Boolean"),
+        ]
+    try:
+        return _GEOM_KIND_CACHE[geom_type]
+    except KeyError:
+        kind = None
+        for base, tag in _GEOM_KIND_BASES:
+            try:
+                if issubclass(geom_type, base):
+                    kind = tag
+                    break
+            except TypeError:
+                continue
+        _GEOM_KIND_CACHE[geom_type] = kind
+        return kind
+
+
+def _err(error, **context):
+    """
+    Uniform failure-response template for bridge handlers.
+
+    Collapses the repeated {"success": False, "error": ..., <context>}
+    literals into one call; context keys ride through as keyword
+    arguments so every handler keeps its endpoint-specific fields.
+    """
+    response = {"success": False, "error": error}
+    response.update(context)
+    return response
+
+
+# Prebuilt table for swapping double quotes out of panel values. Built
+# once; the callers test for '"' first so the common quote-free string
+# skips the translate allocation entirely.
+_QUOTE_TRANS = str.maketrans({'"': "'"})
+
+
+def _extract_volatile_values(vd, out_list, sanitize=False, max_items=None):
+    """
+    Append the stringified items of one volatile data tree to out_list.
+
+    Single traversal shared by the panel handlers; the append is bound to
+    a local so the inner loop skips the attribute lookup per item. With
+    sanitize=True double quotes are swapped for single quotes, matching
+    what get_panel_data has always returned. When max_items is given,
+    collection stops once out_list reaches that length; returns True if
+    items were left unread so callers can flag the truncation.
+    """
+    append = out_list.append
+    # Enumerate the branches directly; going through Paths plus
+    # get_Branch(path) made two interop calls per branch for the same
+    # data (and the EML readers already iterate Branches this way)
+    for branch in vd.Branches:
+        if not branch:
+            continue
+        for item in branch:
+            if max_items is not None and len(out_list) >= max_items:
+                return True
+            try:
+                if item is None:
+                    continue
+                s = str(item.Value) if hasattr(item, 'Value') else str(item)
+                if sanitize and '"' in s:
+                    s = s.translate(_QUOTE_TRANS)
+                append(s)
+            except _EXPECTED_NET_ERRORS:
+                continue
+    return False
+
+
+def _extract_panel_info(obj):
+    """Build the info dict for a GH_Panel (shared by list and bulk tools)"""
+    pivot = obj.Attributes.Pivot
+    panel_info = {
+        "name": obj.NickName or "Unnamed",
+        "user_text": obj.UserText,
+        "position": {"x": float(pivot.X), "y": float(pivot.Y)},
+        "volatile_data": []
+    }
+
+    # Try to extract volatile data (computed values)
+    try:
+        values = panel_info["volatile_data"]
+        if obj.VolatileData:
+            _extract_volatile_values(obj.VolatileData, values)
+
+        # Fall back to the upstream sources only when the panel itself held
+        # nothing: a panel is a parameter (it has no Params collection),
+        # and a wired panel mirrors its sources in its own volatile data,
+        # so walking both just duplicated every value
+        if not values and obj.SourceCount > 0:
+            for source in obj.Sources:
+                if source.VolatileData:
+                    _extract_volatile_values(source.VolatileData, values)
+
+    except Exception as e:
+        panel_info["volatile_data_error"] = f"Error extracting data: {str(e)}"
+
+    return panel_info
+
+
+def _columnize(records):
+    """
+    Convert a list of per-object dicts into a dict of parallel columns.
+
+    Serializing one list per field is much cheaper than repeating every
+    key name for every object, which matters for definitions with
+    hundreds of panels or sliders. Keys missing from a record are padded
+    with None so all columns stay the same length.
+    """
+    columns = {}
+    for i, record in enumerate(records):
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * i
+            column.append(value)
+        for column in columns.values():
+            if len(column) <= i:
+                column.append(None)
+    return columns
+
+
 def filter_debug_response(response: Dict[str, Any]) -> Dict[str, Any]:
     """
     Filter response based on DEBUG_MODE setting.
@@ -109,10 +1115,7 @@ def ensure_file_is_active(file_name: str) -> Dict[str, Any]:
         return {"success": True}  # No specific file requested, use whatever is active
 
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import os
+        Grasshopper, _ = _get_gh()
 
         # Check if requested file is already active
         if Grasshopper.Instances.ActiveCanvas and Grasshopper.Instances.ActiveCanvas.Document:
@@ -135,11 +1138,10 @@ def ensure_file_is_active(file_name: str) -> Dict[str, Any]:
         return {"success": True}
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error ensuring file is active: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 # ============================================================================
@@ -165,13 +1167,12 @@ async def list_gh_files() -> Dict[str, Any]:
     Returns:
         Dict containing available files information and metadata
     """
-    return call_bridge_api("/list_gh_files", {})
+    return await call_bridge_api_async("/list_gh_files", {})
 
 @bridge_handler("/list_gh_files")
 def handle_list_gh_files(data):
     """Bridge handler for listing .gh files in the library with metadata"""
     try:
-        import os
         import json
 
         # Get the library path
@@ -249,11 +1250,10 @@ def handle_list_gh_files(data):
         return result
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error listing .gh files: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "files": []
         }
 
@@ -287,17 +1287,13 @@ async def open_gh_file(file_name: str, open_multiple: bool = False) -> Dict[str,
         "open_multiple": open_multiple
     }
 
-    return call_bridge_api("/open_gh_file", request_data)
+    return await call_bridge_api_async("/open_gh_file", request_data)
 
 @bridge_handler("/open_gh_file")
 def handle_open_gh_file(data):
     """Bridge handler for opening .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
         open_multiple = data.get('open_multiple', False)
@@ -460,9 +1456,9 @@ def handle_open_gh_file(data):
             return filter_debug_response(result)
 
         except Exception as e:
-            import traceback
             debug_log.append(f"Exception during opening: {str(e)}")
-            debug_log.append(f"Traceback: {traceback.format_exc()[:500]}")
+            if _DEBUG_TB:
+                debug_log.append(f"Traceback: {traceback.format_exc()[:500]}")
 
             result = {
                 "success": False,
@@ -470,16 +1466,15 @@ def handle_open_gh_file(data):
                 "file_name": file_name,
                 "file_path": target_file,
                 "debug_log": debug_log,
-                "traceback": traceback.format_exc()
+                "traceback": traceback.format_exc() if _DEBUG_TB else None
             }
             return filter_debug_response(result)
 
     except Exception as e:
-        import traceback
         result = {
             "success": False,
             "error": f"Error opening .gh file: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "file_name": data.get('file_name', 'unknown')
         }
         return filter_debug_response(result)
@@ -501,17 +1496,13 @@ async def get_active_gh_files() -> Dict[str, Any]:
     Returns:
         Dict containing information about open files
     """
-    return call_bridge_api("/get_active_gh_files", {})
+    return await call_bridge_api_async("/get_active_gh_files", {})
 
 @bridge_handler("/get_active_gh_files")
 def handle_get_active_gh_files(data):
     """Bridge handler for getting active .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
 
         # Get the Grasshopper plugin
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
@@ -566,11 +1557,10 @@ def handle_get_active_gh_files(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting active files: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "open_files": []
         }
 
@@ -599,17 +1589,13 @@ async def set_active_gh_file(file_name: str) -> Dict[str, Any]:
         "file_name": file_name
     }
 
-    return call_bridge_api("/set_active_gh_file", request_data)
+    return await call_bridge_api_async("/set_active_gh_file", request_data)
 
 @bridge_handler("/set_active_gh_file")
 def handle_set_active_gh_file(data):
     """Bridge handler for setting active .gh file - using simple OpenDocument approach"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
         import time
 
         file_name = data.get('file_name', '')
@@ -687,21 +1673,19 @@ def handle_set_active_gh_file(data):
                 "current_active": os.path.basename(str(Grasshopper.Instances.ActiveCanvas.Document.FilePath)) if Grasshopper.Instances.ActiveCanvas and Grasshopper.Instances.ActiveCanvas.Document and Grasshopper.Instances.ActiveCanvas.Document.FilePath else "Unknown"
             }
         except Exception as e:
-            import traceback
             return {
                 "success": False,
                 "error": f"Error calling OpenDocument: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": traceback.format_exc() if _DEBUG_TB else None,
                 "file_name": file_name,
                 "file_path": target_path
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting active file: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 
@@ -730,17 +1714,13 @@ async def open_all_gh_files(file_names=None) -> Dict[str, Any]:
         "file_names": file_names
     }
 
-    return call_bridge_api("/open_all_gh_files", request_data)
+    return await call_bridge_api_async("/open_all_gh_files", request_data)
 
 @bridge_handler("/open_all_gh_files")
 def handle_open_all_gh_files(data):
     """Bridge handler for opening multiple .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
 
         file_names = data.get('file_names', None)
         import time
@@ -879,9 +1859,9 @@ def handle_open_all_gh_files(data):
                 overall_debug_log.extend(debug_log)
 
             except Exception as e:
-                import traceback
                 debug_log.append(f"Exception: {str(e)}")
-                debug_log.append(f"Traceback: {traceback.format_exc()[:300]}")
+                if _DEBUG_TB:
+                    debug_log.append(f"Traceback: {traceback.format_exc()[:300]}")
                 results.append({
                     "file_name": file_name,
                     "success": False,
@@ -903,11 +1883,10 @@ def handle_open_all_gh_files(data):
         return filter_debug_response(result)
 
     except Exception as e:
-        import traceback
         result = {
             "success": False,
             "error": f"Error opening files: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
         return filter_debug_response(result)
 
@@ -939,17 +1918,13 @@ async def close_gh_file(file_name: str, save_changes: bool = False) -> Dict[str,
         "save_changes": save_changes
     }
 
-    return call_bridge_api("/close_gh_file", request_data)
+    return await call_bridge_api_async("/close_gh_file", request_data)
 
 @bridge_handler("/close_gh_file")
 def handle_close_gh_file(data):
     """Bridge handler for closing .gh files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
         save_changes = data.get('save_changes', False)
@@ -1007,11 +1982,10 @@ def handle_close_gh_file(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error closing file: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 # ============================================================================
@@ -1046,16 +2020,13 @@ async def list_eml_parameters() -> Dict[str, Any]:
     Returns:
         Dict containing categorized eml_ parameters
     """
-    return call_bridge_api("/list_eml_parameters", {})
+    return await call_bridge_api_async("/list_eml_parameters", {})
 
 @bridge_handler("/list_eml_parameters")
 def handle_list_eml_parameters(data):
     """Bridge handler for discovering all eml_ prefixed parameters"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
@@ -1086,6 +2057,7 @@ def handle_list_eml_parameters(data):
         }
 
         # Scan all objects in the document
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
         for obj in gh_doc.Objects:
             try:
                 nick_name = obj.NickName or ""
@@ -1121,19 +2093,19 @@ def handle_list_eml_parameters(data):
                 categorized = False
 
                 # 1. Number Sliders
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
+                if isinstance(obj, _T_SLIDER):
                     eml_params["sliders"].append({
                         **base_info,
-                        "current_value": float(str(obj.Slider.Value)),
-                        "min_value": float(str(obj.Slider.Minimum)),
-                        "max_value": float(str(obj.Slider.Maximum)),
+                        "current_value": _dec_to_float(obj.Slider.Value),
+                        "min_value": _dec_to_float(obj.Slider.Minimum),
+                        "max_value": _dec_to_float(obj.Slider.Maximum),
                         "precision": obj.Slider.DecimalPlaces,
                         "slider_type": obj.Slider.Type.ToString()
                     })
                     categorized = True
 
                 # 2. Panels
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
+                elif isinstance(obj, _T_PANEL):
                     panel_text = ""
                     if hasattr(obj, 'Properties') and hasattr(obj.Properties, 'UserText'):
                         panel_text = str(obj.Properties.UserText)
@@ -1146,7 +2118,7 @@ def handle_list_eml_parameters(data):
                     categorized = True
 
                 # 3. Boolean Toggles
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
+                elif isinstance(obj, _T_TOGGLE):
                     eml_params["boolean_toggles"].append({
                         **base_info,
                         "value": bool(obj.Value) if hasattr(obj, 'Value') else False
@@ -1154,7 +2126,7 @@ def handle_list_eml_parameters(data):
                     categorized = True
 
                 # 4. Value Lists
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
+                elif isinstance(obj, _T_VLIST):
                     selected_items = []
                     all_items = []
 
@@ -1302,11 +2274,10 @@ def handle_list_eml_parameters(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error discovering eml_ parameters: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
         
 @gh_tool(
@@ -1336,16 +2307,13 @@ async def get_eml_parameter_value(parameter_name: str) -> Dict[str, Any]:
         "parameter_name": parameter_name
     }
 
-    return call_bridge_api("/get_eml_parameter_value", request_data)
+    return await call_bridge_api_async("/get_eml_parameter_value", request_data)
 
 @bridge_handler("/get_eml_parameter_value")
 def handle_get_eml_parameter_value(data):
     """Bridge handler for getting eml_ parameter values"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         parameter_name = data.get('parameter_name', '')
 
@@ -1365,20 +2333,21 @@ def handle_get_eml_parameter_value(data):
             }
 
         # Find the parameter
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
         for obj in gh_doc.Objects:
             nick_name = obj.NickName or ""
             if nick_name.lower() == parameter_name.lower():
                 # Slider
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
+                if isinstance(obj, _T_SLIDER):
                     return {
                         "success": True,
                         "parameter_name": nick_name,
                         "type": "slider",
-                        "value": float(str(obj.Slider.Value))
+                        "value": _dec_to_float(obj.Slider.Value)
                     }
 
                 # Panel
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
+                elif isinstance(obj, _T_PANEL):
                     panel_text = ""
                     if hasattr(obj, 'Properties') and hasattr(obj.Properties, 'UserText'):
                         panel_text = str(obj.Properties.UserText)
@@ -1390,7 +2359,7 @@ def handle_get_eml_parameter_value(data):
                     }
 
                 # Boolean Toggle
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
+                elif isinstance(obj, _T_TOGGLE):
                     return {
                         "success": True,
                         "parameter_name": nick_name,
@@ -1399,7 +2368,7 @@ def handle_get_eml_parameter_value(data):
                     }
 
                 # Value List
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
+                elif isinstance(obj, _T_VLIST):
                     selected_items = []
                     if hasattr(obj, 'ListItems'):
                         for item in obj.ListItems:
@@ -1420,15 +2389,16 @@ def handle_get_eml_parameter_value(data):
                             values.append(str(item))
 
                     param_type = "unknown"
-                    if 'Number' in type(obj).__name__:
+                    obj_type_name = type(obj).__name__
+                    if 'Number' in obj_type_name:
                         param_type = "number"
                         values = [float(v) for v in values]
-                    elif 'Integer' in type(obj).__name__:
+                    elif 'Integer' in obj_type_name:
                         param_type = "integer"
                         values = [int(v) for v in values]
-                    elif 'String' in type(obj).__name__:
+                    elif 'String' in obj_type_name:
                         param_type = "text"
-                    elif any(g in type(obj).__name__ for g in ['Curve', 'Brep', 'Surface', 'Point', 'Line']):
+                    elif any(g in obj_type_name for g in ['Curve', 'Brep', 'Surface', 'Point', 'Line']):
                         param_type = "geometry"
                         values = [f"{type(item).__name__}" for item in obj.VolatileData.AllData(True)]
 
@@ -1447,11 +2417,10 @@ def handle_get_eml_parameter_value(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error getting parameter value: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
@@ -1489,15 +2458,13 @@ async def set_eml_parameter_value(parameter_name: str, value: Any) -> Dict[str,
         "value": value
     }
 
-    return call_bridge_api("/set_eml_parameter_value", request_data)
+    return await call_bridge_api_async("/set_eml_parameter_value", request_data)
 
 @bridge_handler("/set_eml_parameter_value")
 def handle_set_eml_parameter_value(data):
     """Bridge handler for setting eml_ parameter values"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
+        Grasshopper, _ = _get_gh()
         from Grasshopper.Kernel.Types import GH_Number, GH_Integer, GH_String
         from Grasshopper.Kernel.Data import GH_Path
         from Grasshopper.Kernel.Parameters import Param_String, Param_Number, Param_Integer
@@ -1523,6 +2490,7 @@ def handle_set_eml_parameter_value(data):
             }
 
         # Find and set the parameter
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
         for obj in gh_doc.Objects:
             nick_name = obj.NickName or ""
             if nick_name.lower() == parameter_name.lower():
@@ -1532,12 +2500,14 @@ def handle_set_eml_parameter_value(data):
                 has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
 
                 # 1. Number Slider
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
+                if isinstance(obj, _T_SLIDER):
                     new_value = float(value)
-                    clamped_value = max(float(str(obj.Slider.Minimum)),
-                                      min(float(str(obj.Slider.Maximum)), new_value))
-                    obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
+                    clamped_value, _ = _clamp(new_value,
+                                              _dec_to_float(obj.Slider.Minimum),
+                                              _dec_to_float(obj.Slider.Maximum))
+                    obj.Slider.Value = System.Convert.ToDecimal(clamped_value)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     return {
                         "success": True,
                         "parameter_name": nick_name,
@@ -1546,10 +2516,11 @@ def handle_set_eml_parameter_value(data):
                     }
 
                 # 2. Panel (yellow "A")
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
+                elif isinstance(obj, _T_PANEL):
                     obj.UserText = str(value)
                     obj.ExpireSolution(True)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     return {
                         "success": True,
                         "parameter_name": nick_name,
@@ -1558,9 +2529,10 @@ def handle_set_eml_parameter_value(data):
                     }
 
                 # 3. Boolean Toggle
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
+                elif isinstance(obj, _T_TOGGLE):
                     obj.Value = bool(value)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     return {
                         "success": True,
                         "parameter_name": nick_name,
@@ -1569,7 +2541,7 @@ def handle_set_eml_parameter_value(data):
                     }
 
                 # 4. Value List
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
+                elif isinstance(obj, _T_VLIST):
                     item_found = False
                     for i, item in enumerate(obj.ListItems):
                         if item.Name == str(value) or str(item.Value) == str(value):
@@ -1586,6 +2558,7 @@ def handle_set_eml_parameter_value(data):
                         }
                     
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     return {
                         "success": True,
                         "parameter_name": nick_name,
@@ -1612,6 +2585,7 @@ def handle_set_eml_parameter_value(data):
                     obj.PersistentData.Append(GH_String(str(value)), path)
                     obj.ExpireSolution(True)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     
                     return {
                         "success": True,
@@ -1639,6 +2613,7 @@ def handle_set_eml_parameter_value(data):
                     obj.PersistentData.Append(GH_Number(float(value)), path)
                     obj.ExpireSolution(True)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     
                     return {
                         "success": True,
@@ -1666,6 +2641,7 @@ def handle_set_eml_parameter_value(data):
                     obj.PersistentData.Append(GH_Integer(int(value)), path)
                     obj.ExpireSolution(True)
                     gh_doc.NewSolution(True)
+                    _bump_doc_mutation()
                     
                     return {
                         "success": True,
@@ -1692,11 +2668,10 @@ def handle_set_eml_parameter_value(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting parameter value: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
@@ -1722,16 +2697,13 @@ async def suggest_eml_connections() -> Dict[str, Any]:
     Returns:
         Dict containing connection suggestions
     """
-    return call_bridge_api("/suggest_eml_connections", {})
+    return await call_bridge_api_async("/suggest_eml_connections", {})
 
 @bridge_handler("/suggest_eml_connections")
 def handle_suggest_eml_connections(data):
     """Bridge handler for suggesting eml_ parameter connections"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
@@ -1757,6 +2729,7 @@ def handle_suggest_eml_connections(data):
         inputs = []   # Waiting for data
         isolated = [] # No connections
 
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
         for obj in gh_doc.Objects:
             try:
                 nick_name = obj.NickName or ""
@@ -1776,34 +2749,35 @@ def handle_suggest_eml_connections(data):
 
                 # Determine parameter type
                 param_type = "unknown"
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
+                obj_type_name = type(obj).__name__
+                if isinstance(obj, _T_SLIDER):
                     param_type = "slider_number"
                     has_data = True
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
+                elif isinstance(obj, _T_PANEL):
                     param_type = "panel_text"
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_BooleanToggle):
+                elif isinstance(obj, _T_TOGGLE):
                     param_type = "boolean"
                     has_data = True
-                elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
+                elif isinstance(obj, _T_VLIST):
                     param_type = "value_list"
                     has_data = True
-                elif 'Number' in type(obj).__name__:
+                elif 'Number' in obj_type_name:
                     param_type = "number"
-                elif 'Integer' in type(obj).__name__:
+                elif 'Integer' in obj_type_name:
                     param_type = "integer"
-                elif 'String' in type(obj).__name__:
+                elif 'String' in obj_type_name:
                     param_type = "text"
-                elif 'Curve' in type(obj).__name__:
+                elif 'Curve' in obj_type_name:
                     param_type = "curve"
-                elif 'Brep' in type(obj).__name__:
+                elif 'Brep' in obj_type_name:
                     param_type = "brep"
-                elif 'Surface' in type(obj).__name__:
+                elif 'Surface' in obj_type_name:
                     param_type = "surface"
-                elif 'Point' in type(obj).__name__:
+                elif 'Point' in obj_type_name:
                     param_type = "point"
-                elif 'Line' in type(obj).__name__:
+                elif 'Line' in obj_type_name:
                     param_type = "line"
-                elif 'Mesh' in type(obj).__name__:
+                elif 'Mesh' in obj_type_name:
                     param_type = "mesh"
 
                 param_info = {
@@ -1920,11 +2894,10 @@ def handle_suggest_eml_connections(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error analyzing connections: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 # ============================================================================
@@ -1939,35 +2912,41 @@ def handle_suggest_eml_connections(data):
         "then scan it to find all number slider components and return their names and current values.\n\n"
         "**Parameters:**\n"
         "- **file_name** (str, required): Name of the .gh file to list sliders from (e.g., 'Primary Truss Generator.gh')\n"
+        "- **fields** (str, optional): 'full' (default) returns complete slider records, "
+        "'names' returns just the slider names, 'counts' returns only the slider count, "
+        "'arrays' returns parallel names/values/mins/maxs lists plus a flat "
+        "[x0, y0, x1, y1, ...] positions array\n"
         "\n**Returns:**\n"
         "Dictionary containing list of sliders with their names and current values."
     )
 )
-async def list_grasshopper_sliders(file_name: str) -> Dict[str, Any]:
+async def list_grasshopper_sliders(file_name: str, fields: str = "full") -> Dict[str, Any]:
     """
     List all slider components in a specific Grasshopper file via HTTP bridge.
 
     Args:
         file_name: Name of the .gh file to list sliders from
+        fields: 'full', 'arrays', 'names' or 'counts' - how much detail to materialize
 
     Returns:
         Dict containing slider information
     """
 
     request_data = {
-        "file_name": file_name
+        "file_name": file_name,
+        "fields": fields
     }
 
-    return call_bridge_api("/list_sliders", request_data)
+    return await call_bridge_api_async("/list_sliders", request_data)
 
 @bridge_handler("/list_sliders")
 def handle_list_sliders(data):
     """Bridge handler for list sliders requests"""
+    if not _GH_AVAILABLE:
+        return _gh_unavailable()
+
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
 
@@ -2000,20 +2979,62 @@ def handle_list_sliders(data):
                 "sliders": []
             }
         
+        fields = data.get('fields', 'full')
+
+        # Materialize only what the caller asked for: names and counts
+        # skip the per-slider value/range extraction entirely
+        if fields == 'counts':
+            count = len(_typed_objects(gh_doc, _ensure_gh_types()[0], "sliders"))
+            return {
+                "success": True,
+                "count": count,
+                "message": f"Found {count} slider components"
+            }
+
+        if fields == 'names':
+            names = [obj.NickName or "Unnamed"
+                     for obj in _typed_objects(gh_doc, _ensure_gh_types()[0], "sliders")]
+            return {
+                "success": True,
+                "names": names,
+                "count": len(names),
+                "message": f"Found {len(names)} slider components"
+            }
+
+        if fields == 'arrays':
+            # Structure-of-arrays layout: one list per field instead of a
+            # dict per slider. array('d') keeps the numeric columns as
+            # packed doubles until serialization.
+            names = []
+            values = array.array('d')
+            mins = array.array('d')
+            maxs = array.array('d')
+            positions = array.array('d')
+            for obj in _typed_objects(gh_doc, _ensure_gh_types()[0], "sliders"):
+                slider = obj.Slider
+                names.append(obj.NickName or "Unnamed")
+                values.append(_dec_to_float(slider.Value))
+                mins.append(_dec_to_float(slider.Minimum))
+                maxs.append(_dec_to_float(slider.Maximum))
+                pivot = obj.Attributes.Pivot
+                positions.extend((float(pivot.X), float(pivot.Y)))
+            return {
+                "success": True,
+                "names": names,
+                "values": values.tolist(),
+                "mins": mins.tolist(),
+                "maxs": maxs.tolist(),
+                "positions": positions.tolist(),
+                "count": len(names),
+                "message": f"Found {len(names)} slider components"
+            }
+
         sliders = []
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
-                    "precision": obj.Slider.DecimalPlaces,
-                    "type": obj.Slider.Type.ToString()
-                }
-                sliders.append(slider_info)
-        
+
+        # Filter to sliders on the .NET side so other objects never cross over
+        for obj in _typed_objects(gh_doc, _ensure_gh_types()[0], "sliders"):
+            sliders.append(_extract_slider_info(obj))
+
         return {
             "success": True,
             "sliders": sliders,
@@ -2028,11 +3049,10 @@ def handle_list_sliders(data):
             "sliders": []
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error listing sliders: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "sliders": []
         }
 
@@ -2070,16 +3090,13 @@ async def set_grasshopper_slider(file_name: str, slider_name: str, new_value: fl
         "new_value": new_value
     }
 
-    return call_bridge_api("/set_slider", request_data)
+    return await call_bridge_api_async("/set_slider", request_data)
 
 @bridge_handler("/set_slider")
 def handle_set_slider(data):
     """Bridge handler for set slider requests"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
         import System
 
         file_name = data.get('file_name', '')
@@ -2118,29 +3135,31 @@ def handle_set_slider(data):
                 "new_value": new_value
             }
         
-        # Find the slider component
+        # Find the slider component via the cached nickname index
         slider_found = False
         old_value = None
         clamped_value = new_value
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                if (obj.NickName or "Unnamed") == slider_name:
-                    slider_found = True
-                    old_value = float(str(obj.Slider.Value))
-                    
-                    # Clamp value to slider bounds
-                    clamped_value = max(float(str(obj.Slider.Minimum)), 
-                                      min(float(str(obj.Slider.Maximum)), new_value))
-                    
-                    # Set the new value
-                    obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
-                    
-                    break
-        
+        was_clamped = False
+
+        index = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_NumberSlider, "sliders")
+        for obj in index.get(slider_name, []):
+            slider_found = True
+            old_value = _dec_to_float(obj.Slider.Value)
+
+            # Clamp value to slider bounds
+            clamped_value, was_clamped = _clamp(new_value,
+                                                _dec_to_float(obj.Slider.Minimum),
+                                                _dec_to_float(obj.Slider.Maximum))
+
+            # Set the new value
+            obj.Slider.Value = System.Convert.ToDecimal(clamped_value)
+
+            # Trigger solution recompute
+            gh_doc.NewSolution(True)
+            _bump_doc_mutation()
+
+            break
+
         if not slider_found:
             return {
                 "success": False,
@@ -2154,9 +3173,9 @@ def handle_set_slider(data):
             "slider_name": slider_name,
             "old_value": old_value,
             "new_value": clamped_value,
-            "clamped": clamped_value != new_value,
-            "message": f"Slider '{slider_name}' updated to {clamped_value}" + 
-                      (f" (clamped from {new_value})" if clamped_value != new_value else "")
+            "clamped": was_clamped,
+            "message": f"Slider '{slider_name}' updated to {clamped_value}" +
+                      (f" (clamped from {new_value})" if was_clamped else "")
         }
         
     except ImportError as e:
@@ -2167,11 +3186,10 @@ def handle_set_slider(data):
             "new_value": data.get('new_value', 0)
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting slider: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "slider_name": data.get('slider_name', ''),
             "new_value": data.get('new_value', 0)
         }
@@ -2182,98 +3200,78 @@ def handle_set_slider(data):
         "Get an overview of the current Grasshopper definition including file information, "
         "component counts, and general structure. This provides a high-level summary "
         "of what's loaded in Grasshopper.\n\n"
-        "**Returns:**\n"
+        "**Parameters:**\n"
+        "- **fields** (str, optional): 'full' (default) includes the per-type component "
+        "breakdown; 'counts' returns only the scalar document counts\n"
+        "\n**Returns:**\n"
         "Dictionary containing file info, component counts, and document status."
     )
 )
-async def get_grasshopper_overview() -> Dict[str, Any]:
+async def get_grasshopper_overview(fields: str = "full") -> Dict[str, Any]:
     """
     Get overview of the current Grasshopper definition via HTTP bridge.
-    
+
+    Args:
+        fields: 'full' or 'counts' - whether to include the per-type breakdown
+
     Returns:
         Dict containing file overview information
     """
-    
-    return call_bridge_api("/grasshopper_overview", {})
+
+    return await call_bridge_api_async("/grasshopper_overview", {"fields": fields})
 
 @bridge_handler("/grasshopper_overview")
-def handle_grasshopper_overview(data):
+@gh_doc_handler("getting overview")
+def handle_grasshopper_overview(gh, gh_doc, data):
     """Bridge handler for grasshopper overview requests"""
-    try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available"
-            }
-        
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found"
-            }
-        
-        # Count different component types
-        component_counts = {}
-        slider_count = 0
-        panel_count = 0
-        param_count = 0
-        total_objects = 0
-        
-        for obj in gh_doc.Objects:
-            total_objects += 1
-            obj_type = type(obj).__name__
-            component_counts[obj_type] = component_counts.get(obj_type, 0) + 1
-            
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_count += 1
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                panel_count += 1
-            elif hasattr(obj, 'Category') and obj.Category == "Params":
-                param_count += 1
-        
-        # Get document properties
-        doc_properties = {
-            "is_modified": gh_doc.IsModified,
-            "is_enabled": gh_doc.Enabled,
-            "object_count": total_objects,
-            "slider_count": slider_count,
-            "panel_count": panel_count,
-            "parameter_count": param_count
-        }
-        
-        # Try to get file path if available
-        file_path = "Unknown"
-        if hasattr(gh_doc, 'FilePath') and gh_doc.FilePath:
-            file_path = gh_doc.FilePath
-        
-        return {
-            "success": True,
-            "file_path": file_path,
-            "document_properties": doc_properties,
-            "component_counts": component_counts,
-            "summary": f"Document contains {total_objects} total objects including {slider_count} sliders and {panel_count} panels"
-        }
-        
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error getting overview: {str(e)}",
-            "traceback": traceback.format_exc()
-        }
+    counts_only = data.get('fields') == 'counts'
+
+    # Count different component types
+    component_counts = {}
+    slider_count = 0
+    panel_count = 0
+    param_count = 0
+    total_objects = 0
+
+    slider_t, panel_t, _ = _ensure_gh_types()
+
+    for obj in gh_doc.Objects:
+        total_objects += 1
+        obj_t = type(obj)
+        if not counts_only:
+            component_counts[obj_t.__name__] = component_counts.get(obj_t.__name__, 0) + 1
+
+        if obj_t is slider_t:
+            slider_count += 1
+        elif obj_t is panel_t:
+            panel_count += 1
+        elif getattr(obj, 'Category', None) == "Params":
+            param_count += 1
+
+    # Get document properties
+    doc_properties = {
+        "is_modified": gh_doc.IsModified,
+        "is_enabled": gh_doc.Enabled,
+        "object_count": total_objects,
+        "slider_count": slider_count,
+        "panel_count": panel_count,
+        "parameter_count": param_count
+    }
+    
+    # Try to get file path if available
+    file_path = "Unknown"
+    if hasattr(gh_doc, 'FilePath') and gh_doc.FilePath:
+        file_path = gh_doc.FilePath
+
+    result = {
+        "success": True,
+        "file_path": file_path,
+        "document_properties": doc_properties,
+        "summary": f"Document contains {total_objects} total objects including {slider_count} sliders and {panel_count} panels"
+    }
+    if not counts_only:
+        result["component_counts"] = component_counts
+    return result
 
 @gh_tool(
     name="analyze_grasshopper_sliders",
@@ -2281,125 +3279,99 @@ def handle_grasshopper_overview(data):
         "Analyze all sliders in the current Grasshopper definition, including their connections "
         "and inferred purposes. This provides detailed information about what each slider controls "
         "based on connected components and naming patterns.\n\n"
-        "**Returns:**\n"
+        "**Parameters:**\n"
+        "- **format** (str, optional): 'records' (default) returns a list of slider dicts; "
+        "'columns' returns parallel per-field lists, which is much more compact for large definitions\n"
+        "\n**Returns:**\n"
         "Dictionary containing detailed slider analysis with connections and purposes."
     )
 )
-async def analyze_grasshopper_sliders() -> Dict[str, Any]:
+async def analyze_grasshopper_sliders(format: str = "records") -> Dict[str, Any]:
     """
     Analyze sliders with connection details and purpose inference via HTTP bridge.
-    
+
+    Args:
+        format: 'records' for a list of dicts, 'columns' for parallel field lists
+
     Returns:
         Dict containing detailed slider analysis
     """
-    
-    return call_bridge_api("/analyze_sliders", {})
+
+    return await call_bridge_api_async("/analyze_sliders", {"format": format})
 
 @bridge_handler("/analyze_sliders")
-def handle_analyze_sliders(data):
+@gh_doc_handler("analyzing sliders")
+def handle_analyze_sliders(gh, gh_doc, data):
     """Bridge handler for slider analysis requests"""
-    try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available"
-            }
-        
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found"
-            }
-        
-        sliders = []
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
-                    "precision": obj.Slider.DecimalPlaces,
-                    "type": obj.Slider.Type.ToString(),
-                    "connected_components": [],
-                    "inferred_purpose": "Unknown",
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
-                }
-                
-                # Analyze connections - Sliders have Recipients directly, not through Params
-                try:
-                    if hasattr(obj, 'Recipients') and obj.Recipients.Count > 0:
-                        for recipient in obj.Recipients:
-                            try:
-                                component = recipient.Attributes.GetTopLevel.DocObject if hasattr(recipient.Attributes, 'GetTopLevel') else None
-                                if component:
-                                    connected_info = {
-                                        "component_name": component.NickName or type(component).__name__,
-                                        "component_type": type(component).__name__,
-                                        "parameter_name": recipient.NickName or recipient.Name if hasattr(recipient, 'NickName') else "Unknown",
-                                        "parameter_description": recipient.Description if hasattr(recipient, 'Description') else ""
-                                    }
-                                    slider_info["connected_components"].append(connected_info)
-                            except:
-                                continue
-                except:
-                    pass  # If we can't get connections, just skip
-                
-                # Infer purpose based on name and connections
-                slider_name_lower = slider_info["name"].lower()
-                connected_types = [conn["component_type"] for conn in slider_info["connected_components"]]
-                
-                if any(keyword in slider_name_lower for keyword in ["width", "w", "x"]):
-                    slider_info["inferred_purpose"] = "Width/X-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["height", "h", "y"]):
-                    slider_info["inferred_purpose"] = "Height/Y-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["depth", "d", "z"]):
-                    slider_info["inferred_purpose"] = "Depth/Z-dimension control"
-                elif any(keyword in slider_name_lower for keyword in ["count", "num", "n"]):
-                    slider_info["inferred_purpose"] = "Count/quantity control"
-                elif any(keyword in slider_name_lower for keyword in ["angle", "rot", "rotation"]):
-                    slider_info["inferred_purpose"] = "Angle/rotation control"
-                elif any(keyword in slider_name_lower for keyword in ["scale", "size"]):
-                    slider_info["inferred_purpose"] = "Scale/size control"
-                elif any(keyword in slider_name_lower for keyword in ["offset", "shift"]):
-                    slider_info["inferred_purpose"] = "Offset/position control"
-                elif "GH_Move" in connected_types or "Transform" in connected_types:
-                    slider_info["inferred_purpose"] = "Transformation parameter"
-                elif "GH_Divide" in connected_types or "Division" in connected_types:
-                    slider_info["inferred_purpose"] = "Division/array parameter"
-                elif len(slider_info["connected_components"]) > 0:
-                    slider_info["inferred_purpose"] = f"Parameter for {slider_info['connected_components'][0]['component_name']}"
-                
-                sliders.append(slider_info)
-        
+    global _ANALYZE_CACHE
+
+    # Serve repeated calls from the cache while the document is unchanged
+    token = _doc_solution_token(gh_doc)
+    if _ANALYZE_CACHE is not None and _ANALYZE_CACHE[0] == token:
+        return _build_analyze_response(_ANALYZE_CACHE[1], data)
+
+    sliders = []
+
+    for obj in _typed_objects(gh_doc, _ensure_gh_types()[0], "sliders"):
+        slider_info = {
+            "name": obj.NickName or "Unnamed",
+            "current_value": _dec_to_float(obj.Slider.Value),
+            "min_value": _dec_to_float(obj.Slider.Minimum),
+            "max_value": _dec_to_float(obj.Slider.Maximum),
+            "precision": obj.Slider.DecimalPlaces,
+            "type": obj.Slider.Type.ToString(),
+            "connected_components": [],
+            "inferred_purpose": "Unknown",
+            "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+        }
+            
+        # Analyze connections - Sliders have Recipients directly, not through Params
+        try:
+            if hasattr(obj, 'Recipients') and obj.Recipients.Count > 0:
+                for recipient in obj.Recipients:
+                    try:
+                        component = recipient.Attributes.GetTopLevel.DocObject if hasattr(recipient.Attributes, 'GetTopLevel') else None
+                        if component:
+                            connected_info = {
+                                "component_name": component.NickName or type(component).__name__,
+                                "component_type": type(component).__name__,
+                                "parameter_name": recipient.NickName or recipient.Name if hasattr(recipient, 'NickName') else "Unknown",
+                                "parameter_description": recipient.Description if hasattr(recipient, 'Description') else ""
+                            }
+                            slider_info["connected_components"].append(connected_info)
+                    except:
+                        continue
+        except:
+            pass  # If we can't get connections, just skip
+            
+        # Infer purpose based on name and connections
+        connected = slider_info["connected_components"]
+        connected_types = frozenset(conn["component_type"] for conn in connected)
+        slider_info["inferred_purpose"] = _infer_slider_purpose(
+            slider_info["name"].lower(), connected_types, connected)
+
+        sliders.append(slider_info)
+
+    _ANALYZE_CACHE = (token, sliders)
+    return _build_analyze_response(sliders, data)
+
+
+def _build_analyze_response(sliders, data):
+    """Shape the analyze-sliders payload (cached or fresh) for the caller"""
+    if data.get('format') == 'columns':
         return {
             "success": True,
-            "sliders": sliders,
+            "columns": _columnize(sliders),
             "count": len(sliders),
             "summary": f"Found {len(sliders)} sliders with connection analysis"
         }
-        
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error analyzing sliders: {str(e)}",
-            "traceback": traceback.format_exc()
-        }
+
+    return {
+        "success": True,
+        "sliders": sliders,
+        "count": len(sliders),
+        "summary": f"Found {len(sliders)} sliders with connection analysis"
+    }
 
 @gh_tool(
     name="get_grasshopper_components",
@@ -2407,140 +3379,124 @@ def handle_analyze_sliders(data):
         "Get a comprehensive list of all components in the current Grasshopper definition, "
         "including their types, parameters, and connections. This provides a complete map "
         "of the grasshopper definition structure.\n\n"
-        "**Returns:**\n"
-        "Dictionary containing all components with their details and connections."
+        "**Parameters:**\n"
+        "- **format** (str, optional): 'records' (default) returns a list of component dicts; "
+        "'columns' returns parallel per-field lists, which is much more compact for large definitions\n"
+        "\n**Returns:**\n"
+        "Dictionary containing all components with their details and connections. "
+        "Component positions are [x, y] pairs."
     )
 )
-async def get_grasshopper_components() -> Dict[str, Any]:
+async def get_grasshopper_components(format: str = "records") -> Dict[str, Any]:
     """
     Get all components in the current Grasshopper definition via HTTP bridge.
-    
+
+    Args:
+        format: 'records' for a list of dicts, 'columns' for parallel field lists
+
     Returns:
         Dict containing all component information
     """
-    
-    return call_bridge_api("/get_components", {})
+
+    return await call_bridge_api_async("/get_components", {"format": format})
 
 @bridge_handler("/get_components")
-def handle_get_components(data):
+@gh_doc_handler("getting components")
+def handle_get_components(gh, gh_doc, data):
     """Bridge handler for getting all components"""
-    try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available"
-            }
-        
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found"
-            }
-        
-        components = []
-        
-        for obj in gh_doc.Objects:
-            component_info = {
-                "name": obj.NickName or "Unnamed",
-                "type": type(obj).__name__,
-                "category": obj.Category if hasattr(obj, 'Category') else "Unknown",
-                "subcategory": obj.SubCategory if hasattr(obj, 'SubCategory') else "Unknown",
-                "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
-                "inputs": [],
-                "outputs": [],
-                "is_special": False,
-                "special_type": None
-            }
-            
-            # Check for special component types
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                component_info["is_special"] = True
-                component_info["special_type"] = "NumberSlider"
-                component_info["slider_info"] = {
-                    "current_value": float(str(obj.Slider.Value)),
-                    "min_value": float(str(obj.Slider.Minimum)),
-                    "max_value": float(str(obj.Slider.Maximum)),
-                    "precision": obj.Slider.DecimalPlaces
-                }
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                component_info["is_special"] = True
-                component_info["special_type"] = "Panel"
-                component_info["panel_text"] = obj.UserText if hasattr(obj, 'UserText') else ""
-            elif isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                component_info["is_special"] = True
-                component_info["special_type"] = "ValueList"
-                component_info["list_items"] = []
-                if hasattr(obj, 'ListItems'):
-                    for item in obj.ListItems:
-                        component_info["list_items"].append({
-                            "name": item.Name,
-                            "value": str(item.Value)
-                        })
-            
-            # Get input parameters
-            if hasattr(obj, 'Params') and obj.Params.Input:
-                for i in range(obj.Params.Input.Count):
-                    param = obj.Params.Input[i]
-                    param_info = {
+    components = []
+    seen = {}
+
+    # Bind the special types once so the loop dispatches on a dict
+    # lookup instead of an isinstance chain per object
+    _ensure_gh_types()
+    special_handlers = _SPECIAL_HANDLERS
+
+    for obj in gh_doc.Objects:
+        # Reuse the extraction when the same instance shows up again
+        guid = str(obj.InstanceGuid)
+        if guid in seen:
+            components.append(seen[guid])
+            continue
+
+        # Pull each CLR property once per object; repeated attribute
+        # access on .NET objects goes through clr's descriptor machinery
+        obj_t = type(obj)
+        nick = obj.NickName or "Unnamed"
+        pivot = obj.Attributes.Pivot
+        component_info = {
+            "name": nick,
+            "type": obj_t.__name__,
+            "category": getattr(obj, 'Category', "Unknown") or "Unknown",
+            "subcategory": getattr(obj, 'SubCategory', "Unknown") or "Unknown",
+            # Flat (x, y) pair: repeating {"x":..,"y":..} keys once per
+            # component roughly doubles the serialized position payload
+            "position": (float(pivot.X), float(pivot.Y)),
+            "inputs": [],
+            "outputs": [],
+            "is_special": False,
+            "special_type": None
+        }
+
+        # Check for special component types
+        detail_builder = special_handlers.get(obj_t)
+        if detail_builder is not None:
+            detail_builder(obj, component_info)
+
+        # Get input/output parameters, fetching Params once
+        params = getattr(obj, 'Params', None)
+        if params is not None:
+            inputs = params.Input
+            if inputs:
+                append_input = component_info["inputs"].append
+                for param in inputs:
+                    append_input({
                         "name": param.NickName or param.Name,
-                        "description": param.Description if hasattr(param, 'Description') else "",
+                        "description": getattr(param, 'Description', "") or "",
                         "type": type(param).__name__,
                         "optional": param.Optional,
                         "source_count": param.SourceCount
-                    }
-                    component_info["inputs"].append(param_info)
-            
-            # Get output parameters
-            if hasattr(obj, 'Params') and obj.Params.Output:
-                for i in range(obj.Params.Output.Count):
-                    param = obj.Params.Output[i]
-                    param_info = {
+                    })
+
+            outputs = params.Output
+            if outputs:
+                append_output = component_info["outputs"].append
+                for param in outputs:
+                    append_output({
                         "name": param.NickName or param.Name,
-                        "description": param.Description if hasattr(param, 'Description') else "",
+                        "description": getattr(param, 'Description', "") or "",
                         "type": type(param).__name__,
                         "recipient_count": param.Recipients.Count
-                    }
-                    component_info["outputs"].append(param_info)
-            
-            components.append(component_info)
-        
-        # Group components by category
-        categories = {}
-        for comp in components:
-            cat = comp["category"]
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(comp["name"])
-        
+                    })
+
+        seen[guid] = component_info
+        components.append(component_info)
+    
+    # Group components by category
+    categories = {}
+    for comp in components:
+        cat = comp["category"]
+        if cat not in categories:
+            categories[cat] = []
+        categories[cat].append(comp["name"])
+
+    if data.get('format') == 'columns':
         return {
             "success": True,
-            "components": components,
+            "columns": _columnize(components),
             "total_count": len(components),
             "categories": categories,
-            "special_components": [comp for comp in components if comp["is_special"]],
             "summary": f"Found {len(components)} total components across {len(categories)} categories"
         }
-        
-    except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error getting components: {str(e)}",
-            "traceback": traceback.format_exc()
-        }
+
+    return {
+        "success": True,
+        "components": components,
+        "total_count": len(components),
+        "categories": categories,
+        "special_components": [comp for comp in components if comp["is_special"]],
+        "summary": f"Found {len(components)} total components across {len(categories)} categories"
+    }
 
 @gh_tool(
     name="set_multiple_grasshopper_sliders",
@@ -2551,37 +3507,69 @@ def handle_get_components(data):
         "**Parameters:**\n"
         "- **file_name** (str, required): Name of the .gh file containing the sliders (e.g., 'Primary Truss Generator.gh')\n"
         "- **slider_updates** (dict): Dictionary mapping slider names to new values\n"
+        "- **defer_ms** (int, optional): Delay in milliseconds before the coalesced recompute runs (default 5)\n"
         "\n**Returns:**\n"
         "Dictionary containing the results of all slider updates."
     )
 )
-async def set_multiple_grasshopper_sliders(file_name: str, slider_updates: Dict[str, float]) -> Dict[str, Any]:
+async def set_multiple_grasshopper_sliders(file_name: str, slider_updates: Dict[str, float],
+                                           defer_ms: int = 5) -> Dict[str, Any]:
     """
     Set multiple Grasshopper sliders at once via HTTP bridge.
 
     Args:
         file_name: Name of the .gh file containing the sliders
         slider_updates: Dictionary mapping slider names to new values
+        defer_ms: Delay before the scheduled solution runs
 
     Returns:
         Dict containing batch operation results
     """
 
+    # For a handful of sliders, overlapping independent /set_slider calls
+    # on the shared keep-alive client beats the batched endpoint, whose
+    # fixed setup (activation, index build, solver toggling) dominates at
+    # small N. Large batches stay on /set_multiple_sliders, which pays
+    # that setup once and recomputes once.
+    if 0 < len(slider_updates) < 8:
+        semaphore = asyncio.Semaphore(8)
+
+        async def _set_one(slider_name, new_value):
+            async with semaphore:
+                return await call_bridge_api_async("/set_slider", {
+                    "file_name": file_name,
+                    "slider_name": slider_name,
+                    "new_value": new_value
+                })
+
+        results = await asyncio.gather(*(
+            _set_one(name, value) for name, value in slider_updates.items()
+        ))
+        success_count = sum(1 for result in results if result.get("success"))
+        return {
+            # Match the batched endpoint: a fan-out where every update
+            # failed reports failure, not success
+            "success": success_count > 0,
+            "results": list(results),
+            "total_updates": len(results),
+            "successful_updates": success_count,
+            "failed_updates": len(results) - success_count,
+            "summary": f"Successfully updated {success_count} of {len(results)} sliders"
+        }
+
     request_data = {
         "file_name": file_name,
-        "slider_updates": slider_updates
+        "slider_updates": slider_updates,
+        "defer_ms": defer_ms
     }
 
-    return call_bridge_api("/set_multiple_sliders", request_data)
+    return await call_bridge_api_async("/set_multiple_sliders", request_data)
 
 @bridge_handler("/set_multiple_sliders")
 def handle_set_multiple_sliders(data):
     """Bridge handler for setting multiple sliders at once"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
         import System
 
         file_name = data.get('file_name', '')
@@ -2620,38 +3608,57 @@ def handle_set_multiple_sliders(data):
                 "file_name": file_name
             }
         
-        # Cache slider components for efficient batch processing
-        slider_components = {}
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                slider_name = obj.NickName or "Unnamed"
-                slider_components[slider_name] = obj
-        
+        # Look sliders up through the shared nickname index instead of
+        # rebuilding a name->slider dict on every batch call
+        slider_components = _nickname_index(gh_doc, _ensure_gh_types()[0], "sliders")
+
+        # Answer no-op batches before touching the solver: toggling
+        # DisableSolver/EnableSolver is not free and a request full of
+        # unknown names changes nothing
+        missing = [name for name in slider_updates if name not in slider_components]
+        if len(missing) == len(slider_updates):
+            return {
+                "success": False,
+                "error": f"None of the requested sliders were found: {', '.join(missing)}",
+                "results": [
+                    {"slider_name": name, "success": False,
+                     "error": f"Slider '{name}' not found"}
+                    for name in slider_updates
+                ],
+                "total_updates": len(slider_updates),
+                "successful_updates": 0,
+                "failed_updates": len(slider_updates)
+            }
+
         results = []
         success_count = 0
-        
+
         # Disable solver during batch updates
         gh.DisableSolver()
-        
+
         try:
             for slider_name, new_value in slider_updates.items():
                 try:
                     if slider_name in slider_components:
-                        obj = slider_components[slider_name]
-                        old_value = float(str(obj.Slider.Value))
+                        obj = slider_components[slider_name][0]
+                        old_value = _dec_to_float(obj.Slider.Value)
                         
                         # Clamp value to slider bounds
-                        clamped_value = max(float(str(obj.Slider.Minimum)), 
-                                          min(float(str(obj.Slider.Maximum)), float(new_value)))
-                        
-                        obj.Slider.Value = System.Decimal.Parse(str(clamped_value))
+                        clamped_value, was_clamped = _clamp(float(new_value),
+                                                            _dec_to_float(obj.Slider.Minimum),
+                                                            _dec_to_float(obj.Slider.Maximum))
                         
+                        obj.Slider.Value = System.Convert.ToDecimal(clamped_value)
+                        # Expire just this slider so the deferred solve only
+                        # recomputes its downstream components
+                        obj.ExpireSolution(False)
+
                         results.append({
                             "slider_name": slider_name,
                             "success": True,
                             "old_value": old_value,
                             "new_value": float(clamped_value),
-                            "clamped": clamped_value != float(new_value)
+                            "clamped": was_clamped
                         })
                         success_count += 1
                     else:
@@ -2668,15 +3675,19 @@ def handle_set_multiple_sliders(data):
                         "error": f"Error setting slider: {str(e)}"
                     })
             
-            # Re-enable solver and compute solution
+            # Re-enable solver and schedule one coalesced solve on the GH UI
+            # thread. ScheduleSolution returns immediately, so the bridge
+            # worker is free while Grasshopper recomputes the expired set.
             gh.EnableSolver()
-            gh_doc.NewSolution(True)
-            
+            defer_ms = int(data.get('defer_ms', 5) or 5)
+            gh_doc.ScheduleSolution(defer_ms)
+            _bump_doc_mutation()
+
         except Exception as e:
             # Ensure solver is re-enabled even if batch update fails
             gh.EnableSolver()
             raise e
-        
+
         return {
             "success": True,
             "results": results,
@@ -2692,73 +3703,543 @@ def handle_set_multiple_sliders(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in batch slider update: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
-    name="debug_grasshopper_state",
+    name="get_grasshopper_bulk",
     description=(
-        "Get comprehensive debugging information about the current Grasshopper state. "
-        "This tool provides detailed information for troubleshooting issues including "
-        "plugin status, document state, component errors, and system information.\n\n"
-        "**Returns:**\n"
-        "Dictionary containing detailed debugging information about Grasshopper state."
+        "Get sliders, panels, ValueLists and a component overview from a specific Grasshopper file "
+        "in a single call. This tool will activate the specified file (making it visible to the user), "
+        "then traverse the document once and return all requested categories together, avoiding "
+        "separate round-trips for 'list_grasshopper_sliders', 'list_grasshopper_panels', etc.\n\n"
+        "**Parameters:**\n"
+        "- **file_name** (str, required): Name of the .gh file to inspect (e.g., 'Primary Truss Generator.gh')\n"
+        "- **include** (str, optional): Comma-separated categories to return. "
+        "Any of 'sliders', 'panels', 'valuelists', 'components'. Defaults to all.\n"
+        "\n**Returns:**\n"
+        "Dictionary with one list per requested category plus per-category counts."
     )
 )
-async def debug_grasshopper_state() -> Dict[str, Any]:
+async def get_grasshopper_bulk(file_name: str, include: str = "sliders,panels,valuelists,components") -> Dict[str, Any]:
     """
-    Get comprehensive debugging information about Grasshopper state via HTTP bridge.
-    
+    Get multiple component categories from a Grasshopper file in one bridge call.
+
+    Args:
+        file_name: Name of the .gh file to inspect
+        include: Comma-separated categories ('sliders', 'panels', 'valuelists', 'components')
+
     Returns:
-        Dict containing detailed debugging information
+        Dict containing the requested categories
     """
-    
-    return call_bridge_api("/debug_state", {})
 
-@bridge_handler("/debug_state")
-def handle_debug_state(data):
-    """Bridge handler for debugging state requests"""
+    request_data = {
+        "file_name": file_name,
+        "include": include
+    }
+
+    return await call_bridge_api_async("/get_bulk", request_data)
+
+@bridge_handler("/get_bulk")
+def handle_get_bulk(data):
+    """Bridge handler returning sliders/panels/valuelists/components from one traversal"""
     try:
-        import clr
-        import sys
-        import os
-        
-        debug_info = {
-            "system_info": {
-                "python_version": sys.version,
-                "platform": sys.platform,
-                "clr_version": str(clr.version) if hasattr(clr, 'version') else "Unknown"
-            },
-            "assemblies_loaded": [],
-            "grasshopper_status": {},
-            "document_status": {},
-            "component_errors": [],
-            "warnings": []
-        }
-        
-        # Check loaded assemblies
-        try:
-            for assembly in clr.References:
-                debug_info["assemblies_loaded"].append(str(assembly))
-        except Exception as e:
-            debug_info["warnings"].append(f"Could not enumerate assemblies: {str(e)}")
-        
-        try:
-            clr.AddReference('Grasshopper')
-            clr.AddReference('RhinoCommon')
-            import Grasshopper
-            import Rhino
-            
-            # Check Grasshopper plugin status
-            gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-            if gh:
-                debug_info["grasshopper_status"] = {
-                    "plugin_available": True,
-                    "plugin_type": str(type(gh)),
+        Grasshopper, _ = _get_gh()
+
+        file_name = data.get('file_name', '')
+        include_raw = data.get('include', 'sliders,panels,valuelists,components')
+        include = {part.strip().lower() for part in str(include_raw).split(',') if part.strip()}
+
+        # Ensure the correct file is active first
+        activation_result = ensure_file_is_active(file_name)
+        if not activation_result.get("success", False):
+            return {
+                "success": False,
+                "error": activation_result.get("error", "Failed to activate file"),
+                "file_name": file_name
+            }
+
+        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found",
+                "file_name": file_name
+            }
+
+        want_sliders = "sliders" in include
+        want_panels = "panels" in include
+        want_valuelists = "valuelists" in include
+        want_components = "components" in include
+
+        result = {"success": True, "file_name": file_name}
+        if want_sliders:
+            result["sliders"] = []
+        if want_panels:
+            result["panels"] = []
+        if want_valuelists:
+            result["valuelist_components"] = []
+        if want_components:
+            result["components"] = []
+
+        # Single traversal, dispatching per object to the shared extractors
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
+        for obj in gh_doc.Objects:
+            if want_sliders and isinstance(obj, _T_SLIDER):
+                result["sliders"].append(_extract_slider_info(obj))
+            elif want_panels and isinstance(obj, _T_PANEL):
+                result["panels"].append(_extract_panel_info(obj))
+            elif want_valuelists and isinstance(obj, _T_VLIST):
+                result["valuelist_components"].append(_extract_valuelist_info(obj))
+
+            if want_components:
+                result["components"].append({
+                    "name": obj.NickName or "Unnamed",
+                    "type": type(obj).__name__,
+                    "category": obj.Category if hasattr(obj, 'Category') else "Unknown"
+                })
+
+        counts = {key: len(value) for key, value in result.items() if isinstance(value, list)}
+        result["counts"] = counts
+        result["message"] = f"Collected {', '.join(f'{v} {k}' for k, v in counts.items())} in one pass"
+        return result
+
+    except ImportError as e:
+        return {
+            "success": False,
+            "error": f"Grasshopper not available: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error in bulk inspection: {str(e)}",
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
+        }
+
+@gh_tool(
+    name="set_grasshopper_bulk",
+    description=(
+        "Apply a mixed batch of slider, panel and ValueList updates to a specific Grasshopper file "
+        "inside a single solver cycle. This tool will activate the specified file (making it visible "
+        "to the user), apply every update with the solver disabled, then recompute the solution once.\n\n"
+        "**Parameters:**\n"
+        "- **file_name** (str, required): Name of the .gh file to update (e.g., 'Primary Truss Generator.gh')\n"
+        "- **updates** (list, required): List of update dictionaries, each with:\n"
+        "  - **type** (str): 'slider', 'panel' or 'valuelist'\n"
+        "  - **name** (str): Component nickname\n"
+        "  - **value**: New slider value, panel text, or ValueList selection (name or index)\n"
+        "\n**Returns:**\n"
+        "Dictionary containing per-update results and the overall summary."
+    )
+)
+async def set_grasshopper_bulk(file_name: str, updates: list) -> Dict[str, Any]:
+    """
+    Apply a mixed batch of component updates in one bridge call and one recompute.
+
+    Args:
+        file_name: Name of the .gh file to update
+        updates: List of {type, name, value} update dictionaries
+
+    Returns:
+        Dict containing batch operation results
+    """
+
+    request_data = {
+        "file_name": file_name,
+        "updates": updates
+    }
+
+    return await call_bridge_api_async("/set_bulk", request_data)
+
+@bridge_handler("/set_bulk")
+def handle_set_bulk(data):
+    """Bridge handler applying mixed component updates inside one solver cycle"""
+    try:
+        Grasshopper, Rhino = _get_gh()
+        import System
+
+        file_name = data.get('file_name', '')
+        updates = data.get('updates', [])
+
+        if not updates:
+            return {
+                "success": False,
+                "error": "No updates provided",
+                "file_name": file_name
+            }
+
+        # Ensure the correct file is active first
+        activation_result = ensure_file_is_active(file_name)
+        if not activation_result.get("success", False):
+            return {
+                "success": False,
+                "error": activation_result.get("error", "Failed to activate file"),
+                "file_name": file_name
+            }
+
+        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+        if not gh:
+            return {
+                "success": False,
+                "error": "Grasshopper plugin not available",
+                "file_name": file_name
+            }
+
+        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found",
+                "file_name": file_name
+            }
+
+        # One traversal to index the mutable component types by name
+        sliders = {}
+        panels = {}
+        valuelists = {}
+        _T_SLIDER, _T_PANEL, _T_TOGGLE, _T_VLIST = _special_types()
+        for obj in gh_doc.Objects:
+            if isinstance(obj, _T_SLIDER):
+                sliders[obj.NickName or "Unnamed"] = obj
+            elif isinstance(obj, _T_PANEL):
+                panels[obj.NickName or "Unnamed"] = obj
+            elif isinstance(obj, _T_VLIST):
+                valuelists[obj.NickName or "Unnamed"] = obj
+
+        results = []
+        success_count = 0
+
+        # Disable solver during batch updates, recompute once at the end
+        gh.DisableSolver()
+
+        try:
+            for update in updates:
+                update_type = str(update.get('type', '')).lower()
+                name = update.get('name', '')
+                value = update.get('value')
+                entry = {"type": update_type, "name": name, "success": False}
+
+                try:
+                    if update_type == "slider":
+                        obj = sliders.get(name)
+                        if obj is None:
+                            entry["error"] = f"Slider '{name}' not found"
+                        else:
+                            clamped_value, _was_clamped = _clamp(float(value),
+                                                                 _dec_to_float(obj.Slider.Minimum),
+                                                                 _dec_to_float(obj.Slider.Maximum))
+                            obj.Slider.Value = System.Convert.ToDecimal(clamped_value)
+                            entry["success"] = True
+                            entry["new_value"] = float(clamped_value)
+                    elif update_type == "panel":
+                        obj = panels.get(name)
+                        if obj is None:
+                            entry["error"] = f"Panel '{name}' not found"
+                        else:
+                            obj.UserText = str(value)
+                            obj.ExpireSolution(False)
+                            entry["success"] = True
+                            entry["new_text"] = str(value)
+                    elif update_type == "valuelist":
+                        obj = valuelists.get(name)
+                        if obj is None:
+                            entry["error"] = f"ValueList '{name}' not found"
+                        else:
+                            index = None
+                            if isinstance(value, int):
+                                index = value
+                            else:
+                                for i, item in enumerate(obj.ListItems):
+                                    if item.Name == str(value) or str(item.Value) == str(value):
+                                        index = i
+                                        break
+                            if index is None or not (0 <= index < len(obj.ListItems)):
+                                entry["error"] = f"Selection '{value}' not found in ValueList '{name}'"
+                            else:
+                                obj.SelectItem(index)
+                                entry["success"] = True
+                                entry["new_selection_index"] = index
+                    else:
+                        entry["error"] = f"Unknown update type: '{update_type}'"
+                except Exception as e:
+                    entry["error"] = f"Error applying update: {str(e)}"
+
+                if entry["success"]:
+                    success_count += 1
+                results.append(entry)
+
+            # Re-enable solver and compute solution once for the whole batch
+            gh.EnableSolver()
+            gh_doc.NewSolution(True)
+            _bump_doc_mutation()
+
+        except Exception as e:
+            # Ensure solver is re-enabled even if batch update fails
+            gh.EnableSolver()
+            raise e
+
+        return {
+            "success": True,
+            "results": results,
+            "total_updates": len(updates),
+            "successful_updates": success_count,
+            "failed_updates": len(updates) - success_count,
+            "summary": f"Successfully applied {success_count} of {len(updates)} updates in one recompute"
+        }
+
+    except ImportError as e:
+        return {
+            "success": False,
+            "error": f"Grasshopper not available: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error in bulk update: {str(e)}",
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
+        }
+
+@gh_tool(
+    name="inspect_grasshopper",
+    description=(
+        "Inspect the current Grasshopper definition in a single request. "
+        "This bundles the overview, slider list, and slider analysis that agents "
+        "typically call back-to-back before changing parameters, so only one "
+        "bridge round-trip is paid instead of three.\n\n"
+        "**Returns:**\n"
+        "Dictionary with 'overview', 'sliders', and 'slider_analysis' keys, one per sub-call."
+    )
+)
+async def inspect_grasshopper() -> Dict[str, Any]:
+    """
+    Run the common inspect sequence (overview + sliders + analysis) as one multicall.
+
+    Returns:
+        Dict containing the three sub-results
+    """
+
+    calls = [
+        {"path": "/grasshopper_overview", "data": {}},
+        {"path": "/list_sliders", "data": {}},
+        {"path": "/analyze_sliders", "data": {}}
+    ]
+
+    response = await call_bridge_api_async("/bridge_multicall", {"calls": calls})
+    if not response.get("success", False):
+        return response
+
+    results = response.get("results", [])
+    return {
+        "success": True,
+        "overview": results[0] if len(results) > 0 else None,
+        "sliders": results[1] if len(results) > 1 else None,
+        "slider_analysis": results[2] if len(results) > 2 else None
+    }
+
+@bridge_handler("/bridge_multicall")
+def handle_bridge_multicall(data):
+    """Bridge handler dispatching several sub-requests in one HTTP round-trip"""
+    try:
+        try:
+            from .tool_registry import get_bridge_handlers
+        except ImportError:
+            from tool_registry import get_bridge_handlers
+
+        calls = data.get('calls', [])
+        if not isinstance(calls, list) or not calls:
+            return {
+                "success": False,
+                "error": "No calls provided; expected {'calls': [{'path': ..., 'data': {...}}, ...]}"
+            }
+
+        handlers = get_bridge_handlers()
+        results = []
+
+        for call in calls:
+            path = call.get('path', '')
+            if path == "/bridge_multicall":
+                results.append({
+                    "success": False,
+                    "error": "Nested multicall is not allowed"
+                })
+                continue
+
+            handler = handlers.get(path)
+            if handler is None:
+                results.append({
+                    "success": False,
+                    "error": f"Unknown bridge endpoint: '{path}'"
+                })
+                continue
+
+            results.append(handler(call.get('data', {}) or {}))
+
+        return {
+            "success": True,
+            "results": results,
+            "count": len(results)
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error in multicall dispatch: {str(e)}",
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
+        }
+
+@gh_tool(
+    name="wait_for_grasshopper_solution",
+    description=(
+        "Wait until the current Grasshopper solution finishes computing, or until the "
+        "timeout expires. Use this instead of polling debug_grasshopper_state in a loop "
+        "after changing parameters: the bridge blocks on the solver's completion event "
+        "and returns as soon as the solve ends.\n\n"
+        "**Parameters:**\n"
+        "- **timeout** (float, optional): Maximum seconds to wait (default 30)\n"
+        "\n**Returns:**\n"
+        "Dictionary with 'solved' (bool), the seconds waited, and a suggested "
+        "'next_poll_ms' interval if the solve is still running."
+    )
+)
+async def wait_for_grasshopper_solution(timeout: float = 30) -> Dict[str, Any]:
+    """
+    Long-poll the bridge until the active solve completes.
+
+    Args:
+        timeout: Maximum seconds to block on the bridge side
+
+    Returns:
+        Dict describing whether the solution finished
+    """
+
+    return await call_bridge_api_async("/wait_for_solution", {"timeout": timeout})
+
+# Long-poll support: a process-wide event set whenever a Grasshopper
+# solution finishes. The SolutionEnd hook is attached at most once per
+# document so repeated waits do not stack subscriptions.
+_SOLUTION_DONE = threading.Event()
+_SOLUTION_HOOKED_DOCS = set()
+
+
+def _on_solution_end(sender, e):
+    _SOLUTION_DONE.set()
+
+
+def _ensure_solution_hook(gh_doc):
+    """Subscribe _on_solution_end to this document's SolutionEnd once"""
+    doc_key = id(gh_doc)
+    if doc_key not in _SOLUTION_HOOKED_DOCS:
+        gh_doc.SolutionEnd += _on_solution_end
+        _SOLUTION_HOOKED_DOCS.add(doc_key)
+
+
+@bridge_handler("/wait_for_solution")
+def handle_wait_for_solution(data):
+    """Bridge handler blocking until the active solve ends (or timeout)"""
+    if not _GH_AVAILABLE:
+        return _gh_unavailable()
+
+    try:
+        Grasshopper, _ = _get_gh()
+
+        canvas = Grasshopper.Instances.ActiveCanvas
+        gh_doc = canvas.Document if canvas else None
+        if not gh_doc:
+            return {
+                "success": False,
+                "error": "No active Grasshopper document found"
+            }
+
+        _ensure_solution_hook(gh_doc)
+        timeout = float(data.get('timeout', 30) or 30)
+
+        # Nothing running: report completion immediately and suggest a
+        # relaxed poll interval
+        if getattr(gh_doc, 'SolutionDepth', 0) == 0:
+            return {
+                "success": True,
+                "solved": True,
+                "waited": 0.0,
+                "next_poll_ms": 5000
+            }
+
+        _SOLUTION_DONE.clear()
+        started = time.time()
+        # The event is set from the Grasshopper solver thread, so this
+        # wait does not deadlock the HTTP worker
+        done = _SOLUTION_DONE.wait(timeout)
+
+        return {
+            "success": True,
+            "solved": done,
+            "waited": round(time.time() - started, 3),
+            "next_poll_ms": 5000 if done else 100
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Error waiting for solution: {str(e)}",
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
+        }
+
+@gh_tool(
+    name="debug_grasshopper_state",
+    description=(
+        "Get comprehensive debugging information about the current Grasshopper state. "
+        "This tool provides detailed information for troubleshooting issues including "
+        "plugin status, document state, component errors, and system information.\n\n"
+        "**Returns:**\n"
+        "Dictionary containing detailed debugging information about Grasshopper state."
+    )
+)
+async def debug_grasshopper_state() -> Dict[str, Any]:
+    """
+    Get comprehensive debugging information about Grasshopper state via HTTP bridge.
+    
+    Returns:
+        Dict containing detailed debugging information
+    """
+    
+    return await call_bridge_api_async("/debug_state", {})
+
+@bridge_handler("/debug_state")
+def handle_debug_state(data):
+    """Bridge handler for debugging state requests"""
+    try:
+        import clr
+        
+        debug_info = {
+            "system_info": dict(_system_info()),
+            "assemblies_loaded": [],
+            "grasshopper_status": {},
+            "document_status": {},
+            "component_errors": [],
+            "warnings": []
+        }
+        
+        # Check loaded assemblies
+        try:
+            for assembly in clr.References:
+                debug_info["assemblies_loaded"].append(str(assembly))
+        except Exception as e:
+            debug_info["warnings"].append(f"Could not enumerate assemblies: {str(e)}")
+        
+        try:
+            clr.AddReference('Grasshopper')
+            clr.AddReference('RhinoCommon')
+            import Grasshopper
+            import Rhino
+            
+            # Check Grasshopper plugin status
+            gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
+            if gh:
+                debug_info["grasshopper_status"] = {
+                    "plugin_available": True,
+                    "plugin_type": str(type(gh)),
                     "is_loaded": True
                 }
                 
@@ -2775,34 +4256,57 @@ def handle_debug_state(data):
                             "solver_status": "Unknown"
                         }
                         
-                        # Count component types and check for errors
-                        component_summary = {}
-                        error_count = 0
-                        warning_count = 0
-                        
-                        for obj in gh_doc.Objects:
-                            obj_type = type(obj).__name__
-                            component_summary[obj_type] = component_summary.get(obj_type, 0) + 1
-                            
-                            # Check for component runtime messages (errors/warnings)
-                            if hasattr(obj, 'RuntimeMessages'):
-                                for message in obj.RuntimeMessages:
-                                    message_info = {
-                                        "component": obj.NickName or obj_type,
-                                        "level": str(message.Level),
-                                        "message": str(message.Text)
-                                    }
-                                    
-                                    if "Error" in str(message.Level):
-                                        error_count += 1
-                                        debug_info["component_errors"].append(message_info)
-                                    elif "Warning" in str(message.Level):
-                                        warning_count += 1
-                                        debug_info["warnings"].append(message_info)
-                        
-                        debug_info["document_status"]["component_summary"] = component_summary
-                        debug_info["document_status"]["error_count"] = error_count
-                        debug_info["document_status"]["warning_count"] = warning_count
+                        # Runtime messages only change when the document
+                        # recomputes or mutates; reuse the last scan when
+                        # the fingerprint still matches
+                        global _MSG_SNAPSHOT_CACHE
+                        token = _doc_solution_token(gh_doc)
+                        cached = _MSG_SNAPSHOT_CACHE
+                        if cached is not None and cached[0] == token:
+                            summary, errors, warnings = cached[1], cached[2], cached[3]
+                            debug_info["component_errors"].extend(errors)
+                            debug_info["warnings"].extend(warnings)
+                            debug_info["document_status"]["component_summary"] = summary
+                            debug_info["document_status"]["error_count"] = len(errors)
+                            debug_info["document_status"]["warning_count"] = len(warnings)
+                        else:
+                            # Count component types and check for errors
+                            # (Counter avoids the double dict lookup of get-and-set)
+                            component_summary = Counter()
+                            errors = []
+                            warnings = []
+                            append_error = errors.append
+                            append_warning = warnings.append
+
+                            for obj in gh_doc.Objects:
+                                obj_type = type(obj).__name__
+                                component_summary[obj_type] += 1
+
+                                # Check for component runtime messages (errors/warnings)
+                                if hasattr(obj, 'RuntimeMessages'):
+                                    nick = obj.NickName or obj_type
+                                    for message in obj.RuntimeMessages:
+                                        # Stringify the enum once; compare the
+                                        # known names instead of substring scans
+                                        level = str(message.Level)
+                                        message_info = {
+                                            "component": nick,
+                                            "level": level,
+                                            "message": str(message.Text)
+                                        }
+
+                                        if level.endswith("Error"):
+                                            append_error(message_info)
+                                        elif level.endswith("Warning"):
+                                            append_warning(message_info)
+
+                            summary = dict(component_summary)
+                            _MSG_SNAPSHOT_CACHE = (token, summary, errors, warnings)
+                            debug_info["component_errors"].extend(errors)
+                            debug_info["warnings"].extend(warnings)
+                            debug_info["document_status"]["component_summary"] = summary
+                            debug_info["document_status"]["error_count"] = len(errors)
+                            debug_info["document_status"]["warning_count"] = len(warnings)
                         
                     else:
                         debug_info["document_status"] = {
@@ -2831,25 +4335,12 @@ def handle_debug_state(data):
                 "error": f"Unexpected error: {str(e)}"
             }
         
-        # Add environment info
+        # Add environment info (versions cached at module import)
         debug_info["environment"] = {
-            "rhino_version": "Unknown",
-            "grasshopper_version": "Unknown"
+            "rhino_version": _RHINO_VERSION,
+            "grasshopper_version": _GH_VERSION
         }
-        
-        try:
-            import Rhino
-            debug_info["environment"]["rhino_version"] = str(Rhino.RhinoApp.Version)
-        except:
-            pass
-            
-        try:
-            import Grasshopper
-            if hasattr(Grasshopper, 'Versioning'):
-                debug_info["environment"]["grasshopper_version"] = str(Grasshopper.Versioning.Version)
-        except:
-            pass
-        
+
         return {
             "success": True,
             "debug_info": debug_info,
@@ -2857,11 +4348,10 @@ def handle_debug_state(data):
         }
         
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error collecting debug info: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
@@ -2892,76 +4382,36 @@ async def list_grasshopper_valuelist_components(file_name: str) -> Dict[str, Any
         "file_name": file_name
     }
 
-    return call_bridge_api("/list_valuelists", request_data)
+    return await call_bridge_api_async("/list_valuelists", request_data)
 
 @bridge_handler("/list_valuelists")
 def handle_list_valuelists(data):
     """Bridge handler for listing ValueList components"""
+    if not _GH_AVAILABLE:
+        return _gh_unavailable()
+
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
 
         # Ensure the correct file is active first
         activation_result = ensure_file_is_active(file_name)
         if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "valuelist_components": []
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "valuelist_components": []
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "valuelist_components": []
-            }
+            return _err(activation_result.get("error", "Failed to activate file"),
+                        file_name=file_name,
+                        valuelist_components=[])
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, file_name=file_name, valuelist_components=[])
         
         valuelist_components = []
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                valuelist_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "current_selection_index": obj.SelectionIndex,
-                    "current_selection_name": None,
-                    "current_selection_value": None,
-                    "list_items": []
-                }
-                
-                # Get all available items
-                if hasattr(obj, 'ListItems'):
-                    for i, item in enumerate(obj.ListItems):
-                        item_info = {
-                            "index": i,
-                            "name": item.Name,
-                            "value": str(item.Value)
-                        }
-                        valuelist_info["list_items"].append(item_info)
-                        
-                        # Mark current selection
-                        if i == obj.SelectionIndex:
-                            valuelist_info["current_selection_name"] = item.Name
-                            valuelist_info["current_selection_value"] = str(item.Value)
-                
-                valuelist_components.append(valuelist_info)
+        # Filter to ValueLists on the .NET side so other objects never cross over
+        for obj in _typed_objects(gh_doc, Grasshopper.Kernel.Special.GH_ValueList, "valuelists"):
+            valuelist_components.append(_extract_valuelist_info(obj))
         
         return {
             "success": True,
@@ -2971,19 +4421,12 @@ def handle_list_valuelists(data):
         }
         
     except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "valuelist_components": []
-        }
-    except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error listing ValueList components: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "valuelist_components": []
-        }
+        return _err(f"Grasshopper not available: {str(e)}",
+                    valuelist_components=[])
+    except Exception as e:
+        return _err(f"Error listing ValueList components: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    valuelist_components=[])
 
 @gh_tool(
     name="set_grasshopper_valuelist_selection",
@@ -3019,16 +4462,13 @@ async def set_grasshopper_valuelist_selection(file_name: str, valuelist_name: st
         "selection": selection
     }
 
-    return call_bridge_api("/set_valuelist_selection", request_data)
+    return await call_bridge_api_async("/set_valuelist_selection", request_data)
 
 @bridge_handler("/set_valuelist_selection")
 def handle_set_valuelist_selection(data):
     """Bridge handler for setting ValueList selection"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
         valuelist_name = data.get('valuelist_name', '')
@@ -3037,34 +4477,16 @@ def handle_set_valuelist_selection(data):
         # Ensure the correct file is active first
         activation_result = ensure_file_is_active(file_name)
         if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "valuelist_name": valuelist_name,
-                "selection": selection
-            }
+            return _err(activation_result.get("error", "Failed to activate file"),
+                        file_name=file_name,
+                        valuelist_name=valuelist_name,
+                        selection=selection)
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, file_name=file_name,
+                        valuelist_name=valuelist_name, selection=selection)
         
         # Find the ValueList component
         valuelist_found = False
@@ -3073,60 +4495,71 @@ def handle_set_valuelist_selection(data):
         new_selection_name = None
         new_selection_value = None
         
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_ValueList):
-                if (obj.NickName or "Unnamed") == valuelist_name:
-                    valuelist_found = True
-                    old_selection = {
-                        "index": obj.SelectionIndex,
-                        "name": obj.ListItems[obj.SelectionIndex].Name if obj.SelectionIndex < len(obj.ListItems) else None,
-                        "value": str(obj.ListItems[obj.SelectionIndex].Value) if obj.SelectionIndex < len(obj.ListItems) else None
-                    }
-                    
-                    # Try to find the selection by name or index
-                    selection_found = False
-                    
-                    # Try as index first
-                    try:
-                        index = int(selection)
-                        if 0 <= index < len(obj.ListItems):
-                            obj.SelectItem(index)
-                            new_selection_index = index
-                            new_selection_name = obj.ListItems[index].Name
-                            new_selection_value = str(obj.ListItems[index].Value)
-                            selection_found = True
-                    except ValueError:
-                        # Not an integer, try as name or value
-                        for i, item in enumerate(obj.ListItems):
-                            if item.Name == selection or str(item.Value) == selection:
-                                obj.SelectItem(i)
-                                new_selection_index = i
-                                new_selection_name = item.Name
-                                new_selection_value = str(item.Value)
-                                selection_found = True
-                                break
-                    
-                    if not selection_found:
-                        available_options = [f"{i}: {item.Name} ({item.Value})" for i, item in enumerate(obj.ListItems)]
-                        return {
-                            "success": False,
-                            "error": f"Selection '{selection}' not found in ValueList '{valuelist_name}'",
-                            "available_options": available_options,
-                            "valuelist_name": valuelist_name,
-                            "selection": selection
-                        }
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
-                    break
-        
-        if not valuelist_found:
-            return {
-                "success": False,
-                "error": f"ValueList '{valuelist_name}' not found",
-                "valuelist_name": valuelist_name,
-                "selection": selection
+        # Look up the ValueList via the cached nickname index
+        index_by_name = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_ValueList, "valuelists")
+        for obj in index_by_name.get(valuelist_name, []):
+            valuelist_found = True
+
+            # Hoist the item list and selection index; each indexed
+            # access is its own interop call and the old dict did three
+            items = obj.ListItems
+            si = obj.SelectionIndex
+            cur = items[si] if 0 <= si < len(items) else None
+            old_selection = {
+                "index": si,
+                "name": cur.Name if cur else None,
+                "value": str(cur.Value) if cur else None
             }
+
+            # Resolve the requested selection to an index first
+
+            # Try as index first
+            try:
+                index = int(selection)
+                if 0 <= index < len(items):
+                    new_selection_index = index
+            except ValueError:
+                # Not an integer, look it up as a name or value
+                new_selection_index = _valuelist_item_index(obj, items).get(selection)
+
+            if new_selection_index is None:
+                available_options = [f"{i}: {item.Name} ({item.Value})" for i, item in enumerate(items)]
+                return _err(f"Selection '{selection}' not found in ValueList '{valuelist_name}'",
+                            available_options=available_options,
+                            valuelist_name=valuelist_name,
+                            selection=selection)
+
+            new_item = items[new_selection_index]
+            new_selection_name = new_item.Name
+            new_selection_value = str(new_item.Value)
+
+            # Already on the requested item: a recompute is the most
+            # expensive thing Grasshopper does, so don't trigger one
+            # for a no-op
+            if new_selection_index == old_selection["index"]:
+                return {
+                    "success": True,
+                    "valuelist_name": valuelist_name,
+                    "old_selection": old_selection,
+                    "new_selection": {
+                        "index": new_selection_index,
+                        "name": new_selection_name,
+                        "value": new_selection_value
+                    },
+                    "message": f"ValueList '{valuelist_name}' already set to '{new_selection_name}' (no change)"
+                }
+
+            obj.SelectItem(new_selection_index)
+
+            # Trigger solution recompute
+            gh_doc.NewSolution(True)
+            _bump_doc_mutation()
+            break
+
+        if not valuelist_found:
+            return _err(f"ValueList '{valuelist_name}' not found",
+                        valuelist_name=valuelist_name,
+                        selection=selection)
         
         return {
             "success": True,
@@ -3141,22 +4574,155 @@ def handle_set_valuelist_selection(data):
         }
         
     except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "valuelist_name": data.get('valuelist_name', ''),
-            "selection": data.get('selection', '')
-        }
+        return _err(f"Grasshopper not available: {str(e)}",
+                    valuelist_name=data.get('valuelist_name', ''),
+                    selection=data.get('selection', ''))
     except Exception as e:
-        import traceback
+        return _err(f"Error setting ValueList selection: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    valuelist_name=data.get('valuelist_name', ''),
+                    selection=data.get('selection', ''))
+
+@gh_tool(
+    name="set_grasshopper_valuelist_selections",
+    description=(
+        "Set the selections of multiple Grasshopper ValueList components in one call. "
+        "All updates are applied first and the definition recomputes once at the end, "
+        "so this is much faster than calling set_grasshopper_valuelist_selection repeatedly.\n\n"
+        "**Parameters:**\n"
+        "- **file_name** (str, required): Name of the .gh file containing the ValueLists (e.g., 'Primary Truss Generator.gh')\n"
+        "- **updates** (list): List of dicts, each with 'valuelist_name' and 'selection' "
+        "(selection can be an option name, value, or index)\n"
+        "\n**Returns:**\n"
+        "Dictionary containing per-update results and an overall summary."
+    )
+)
+async def set_grasshopper_valuelist_selections(file_name: str, updates: list) -> Dict[str, Any]:
+    """
+    Set multiple ValueList selections at once via HTTP bridge.
+
+    Args:
+        file_name: Name of the .gh file containing the ValueLists
+        updates: List of {'valuelist_name': ..., 'selection': ...} dicts
+
+    Returns:
+        Dict containing batch operation results
+    """
+
+    request_data = {
+        "file_name": file_name,
+        "updates": updates
+    }
+
+    return await call_bridge_api_async("/set_valuelist_selections", request_data)
+
+@bridge_handler("/set_valuelist_selections")
+def handle_set_valuelist_selections(data):
+    """Bridge handler for setting multiple ValueList selections at once"""
+    try:
+        Grasshopper, Rhino = _get_gh()
+
+        file_name = data.get('file_name', '')
+        updates = data.get('updates', [])
+
+        if not updates:
+            return _err("No ValueList updates provided",
+                        file_name=file_name)
+
+        # Ensure the correct file is active first
+        activation_result = ensure_file_is_active(file_name)
+        if not activation_result.get("success", False):
+            return _err(activation_result.get("error", "Failed to activate file"),
+                        file_name=file_name)
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, file_name=file_name)
+
+        index_by_name = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_ValueList, "valuelists")
+
+        results = []
+        success_count = 0
+        changed_count = 0
+
+        for update in updates:
+            valuelist_name = update.get('valuelist_name', '')
+            selection = update.get('selection', '')
+            try:
+                candidates = index_by_name.get(valuelist_name)
+                if not candidates:
+                    results.append({
+                        "valuelist_name": valuelist_name,
+                        "success": False,
+                        "error": f"ValueList '{valuelist_name}' not found"
+                    })
+                    continue
+
+                obj = candidates[0]
+                items = obj.ListItems
+                selected = None
+
+                # Try as index first, then as name or value
+                try:
+                    index = int(selection)
+                    if 0 <= index < len(items):
+                        selected = index
+                except ValueError:
+                    selected = _valuelist_item_index(obj, items).get(selection)
+
+                if selected is None:
+                    results.append({
+                        "valuelist_name": valuelist_name,
+                        "success": False,
+                        "error": f"Selection '{selection}' not found in ValueList '{valuelist_name}'"
+                    })
+                    continue
+
+                if selected != obj.SelectionIndex:
+                    obj.SelectItem(selected)
+                    changed_count += 1
+                results.append({
+                    "valuelist_name": valuelist_name,
+                    "success": True,
+                    "new_selection": {
+                        "index": selected,
+                        "name": items[selected].Name,
+                        "value": str(items[selected].Value)
+                    }
+                })
+                success_count += 1
+
+            except Exception as e:
+                results.append({
+                    "valuelist_name": valuelist_name,
+                    "success": False,
+                    "error": f"Error setting selection: {str(e)}"
+                })
+
+        # One recompute for the whole batch, and only when a selection
+        # actually moved
+        if changed_count:
+            gh_doc.NewSolution(True)
+            _bump_doc_mutation()
+
         return {
-            "success": False,
-            "error": f"Error setting ValueList selection: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "valuelist_name": data.get('valuelist_name', ''),
-            "selection": data.get('selection', '')
+            "success": True,
+            "results": results,
+            "total_updates": len(updates),
+            "successful_updates": success_count,
+            "failed_updates": len(updates) - success_count,
+            "summary": f"Successfully updated {success_count} of {len(updates)} ValueLists"
         }
 
+    except ImportError as e:
+        return _err(f"Grasshopper not available: {str(e)}",
+                    file_name=data.get('file_name', ''))
+    except Exception as e:
+        return _err(f"Error setting ValueList selections: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    file_name=data.get('file_name', ''))
+
 @gh_tool(
     name="list_grasshopper_panels",
     description=(
@@ -3175,89 +4741,35 @@ async def list_grasshopper_panels() -> Dict[str, Any]:
         Dict containing Panel information
     """
     
-    return call_bridge_api("/list_panels", {})
+    return await call_bridge_api_async("/list_panels", {})
 
 @bridge_handler("/list_panels")
 def handle_list_panels(data):
     """Bridge handler for listing Panel components"""
+    if not _GH_AVAILABLE:
+        return _gh_unavailable()
+
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "panels": []
-            }
+        Grasshopper, Rhino = _get_gh()
         
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "panels": []
-            }
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, panels=[])
         
         panels = []
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                panel_info = {
-                    "name": obj.NickName or "Unnamed",
-                    "user_text": obj.UserText if hasattr(obj, 'UserText') else "",
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
-                    "volatile_data": []
-                }
-                
-                # Try to extract volatile data (computed values)
-                try:
-                    if hasattr(obj, 'VolatileData') and obj.VolatileData:
-                        vd = obj.VolatileData
-                        # Try multiple ways to access the data
-                        for path in vd.Paths:
-                            branch = vd.get_Branch(path)
-                            if branch:
-                                for i in range(branch.Count):
-                                    try:
-                                        item = branch[i]
-                                        if item is not None:
-                                            # Try to get the actual value
-                                            if hasattr(item, 'Value'):
-                                                panel_info["volatile_data"].append(str(item.Value))
-                                            else:
-                                                panel_info["volatile_data"].append(str(item))
-                                    except Exception:
-                                        continue
-                    
-                    # Also try to get values from input parameters if panel is displaying input data
-                    if hasattr(obj, 'Params') and obj.Params.Input and obj.Params.Input.Count > 0:
-                        for i in range(obj.Params.Input.Count):
-                            input_param = obj.Params.Input[i]
-                            if hasattr(input_param, 'VolatileData') and input_param.VolatileData:
-                                input_vd = input_param.VolatileData
-                                for path in input_vd.Paths:
-                                    branch = input_vd.get_Branch(path)
-                                    if branch:
-                                        for j in range(branch.Count):
-                                            try:
-                                                item = branch[j]
-                                                if item is not None:
-                                                    if hasattr(item, 'Value'):
-                                                        panel_info["volatile_data"].append(str(item.Value))
-                                                    else:
-                                                        panel_info["volatile_data"].append(str(item))
-                                            except Exception:
-                                                continue
-                                
-                except Exception as e:
-                    panel_info["volatile_data_error"] = f"Error extracting data: {str(e)}"
-                
-                panels.append(panel_info)
+        seen = {}
+
+        # Filter to panels on the .NET side so other objects never cross over
+        for obj in _typed_objects(gh_doc, Grasshopper.Kernel.Special.GH_Panel, "panels"):
+            # Reuse the extraction when the same instance shows up again
+            guid = str(obj.InstanceGuid)
+            if guid in seen:
+                panels.append(seen[guid])
+                continue
+            panel_info = _extract_panel_info(obj)
+            seen[guid] = panel_info
+            panels.append(panel_info)
         
         return {
             "success": True,
@@ -3267,19 +4779,12 @@ def handle_list_panels(data):
         }
         
     except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "panels": []
-        }
+        return _err(f"Grasshopper not available: {str(e)}",
+                    panels=[])
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error listing Panel components: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "panels": []
-        }
+        return _err(f"Error listing Panel components: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    panels=[])
 
 @gh_tool(
     name="set_grasshopper_panel_text",
@@ -3315,16 +4820,13 @@ async def set_grasshopper_panel_text(file_name: str, panel_name: str, new_text:
         "new_text": new_text
     }
 
-    return call_bridge_api("/set_panel_text", request_data)
+    return await call_bridge_api_async("/set_panel_text", request_data)
 
 @bridge_handler("/set_panel_text")
 def handle_set_panel_text(data):
     """Bridge handler for setting Panel text"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
 
         file_name = data.get('file_name', '')
         panel_name = data.get('panel_name', '')
@@ -3333,60 +4835,52 @@ def handle_set_panel_text(data):
         # Ensure the correct file is active first
         activation_result = ensure_file_is_active(file_name)
         if not activation_result.get("success", False):
-            return {
-                "success": False,
-                "error": activation_result.get("error", "Failed to activate file"),
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
-
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available",
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
-
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found",
-                "file_name": file_name,
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
+            return _err(activation_result.get("error", "Failed to activate file"),
+                        file_name=file_name,
+                        panel_name=panel_name,
+                        new_text=new_text)
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, file_name=file_name,
+                        panel_name=panel_name, new_text=new_text)
         
-        # Find the Panel component
+        # Find the Panel component via the cached nickname index
         panel_found = False
         old_text = None
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                if (obj.NickName or "Unnamed") == panel_name:
-                    panel_found = True
-                    old_text = obj.UserText if hasattr(obj, 'UserText') else ""
-                    
-                    # Set the new text
-                    obj.UserText = new_text
-                    obj.ExpireSolution(True)
-                    
-                    # Trigger solution recompute
-                    gh_doc.NewSolution(True)
-                    break
-        
+
+        index_by_name = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_Panel, "panels")
+        for obj in index_by_name.get(panel_name, []):
+            panel_found = True
+            old_text = obj.UserText
+
+            # Text already matches: skip the write and the recompute
+            if old_text == new_text:
+                return {
+                    "success": True,
+                    "panel_name": panel_name,
+                    "old_text": old_text,
+                    "new_text": new_text,
+                    "message": f"Panel '{panel_name}' text unchanged (no change)"
+                }
+
+            # Set the new text; expire quietly so the solve below is the
+            # only recompute. ExpireSolution(True) kicked off its own
+            # downstream pass and NewSolution(True) then expired and
+            # re-solved the entire document on top of it.
+            obj.UserText = new_text
+            obj.ExpireSolution(False)
+
+            # Recompute just the expired set
+            gh_doc.NewSolution(False)
+            _bump_doc_mutation()
+            break
+
         if not panel_found:
-            return {
-                "success": False,
-                "error": f"Panel '{panel_name}' not found",
-                "panel_name": panel_name,
-                "new_text": new_text
-            }
+            return _err(f"Panel '{panel_name}' not found",
+                        panel_name=panel_name,
+                        new_text=new_text)
         
         return {
             "success": True,
@@ -3397,21 +4891,136 @@ def handle_set_panel_text(data):
         }
         
     except ImportError as e:
+        return _err(f"Grasshopper not available: {str(e)}",
+                    panel_name=data.get('panel_name', ''),
+                    new_text=data.get('new_text', ''))
+    except Exception as e:
+        return _err(f"Error setting Panel text: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    panel_name=data.get('panel_name', ''),
+                    new_text=data.get('new_text', ''))
+
+@gh_tool(
+    name="set_grasshopper_panel_texts",
+    description=(
+        "Set the text content of multiple Grasshopper Panel components in one call. "
+        "All panels are updated first and the definition recomputes once at the end, "
+        "so this is much faster than calling set_grasshopper_panel_text repeatedly.\n\n"
+        "**Parameters:**\n"
+        "- **file_name** (str, required): Name of the .gh file containing the Panels (e.g., 'Primary Truss Generator.gh')\n"
+        "- **updates** (list): List of dicts, each with 'panel_name' and 'new_text'\n"
+        "\n**Returns:**\n"
+        "Dictionary containing per-update results and an overall summary."
+    )
+)
+async def set_grasshopper_panel_texts(file_name: str, updates: list) -> Dict[str, Any]:
+    """
+    Set the text of multiple Panel components at once via HTTP bridge.
+
+    Args:
+        file_name: Name of the .gh file containing the Panels
+        updates: List of {'panel_name': ..., 'new_text': ...} dicts
+
+    Returns:
+        Dict containing batch operation results
+    """
+
+    request_data = {
+        "file_name": file_name,
+        "updates": updates
+    }
+
+    return await call_bridge_api_async("/set_panel_texts", request_data)
+
+@bridge_handler("/set_panel_texts")
+def handle_set_panel_texts(data):
+    """Bridge handler for setting multiple Panel texts at once"""
+    try:
+        Grasshopper, Rhino = _get_gh()
+
+        file_name = data.get('file_name', '')
+        updates = data.get('updates', [])
+
+        if not updates:
+            return _err("No Panel updates provided",
+                        file_name=file_name)
+
+        # Ensure the correct file is active first
+        activation_result = ensure_file_is_active(file_name)
+        if not activation_result.get("success", False):
+            return _err(activation_result.get("error", "Failed to activate file"),
+                        file_name=file_name)
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return dict(err, file_name=file_name)
+
+        index_by_name = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_Panel, "panels")
+
+        results = []
+        success_count = 0
+        changed_count = 0
+
+        for update in updates:
+            panel_name = update.get('panel_name', '')
+            new_text = str(update.get('new_text', ''))
+            try:
+                candidates = index_by_name.get(panel_name)
+                if not candidates:
+                    results.append({
+                        "panel_name": panel_name,
+                        "success": False,
+                        "error": f"Panel '{panel_name}' not found"
+                    })
+                    continue
+
+                obj = candidates[0]
+                old_text = obj.UserText
+                if old_text != new_text:
+                    obj.UserText = new_text
+                    # Expire quietly; the single NewSolution below recomputes
+                    # every expired panel's downstream set in one pass
+                    obj.ExpireSolution(False)
+                    changed_count += 1
+
+                results.append({
+                    "panel_name": panel_name,
+                    "success": True,
+                    "old_text": old_text,
+                    "new_text": new_text
+                })
+                success_count += 1
+
+            except Exception as e:
+                results.append({
+                    "panel_name": panel_name,
+                    "success": False,
+                    "error": f"Error setting text: {str(e)}"
+                })
+
+        # One recompute of just the expired set, and only when a panel's
+        # text actually changed
+        if changed_count:
+            gh_doc.NewSolution(False)
+            _bump_doc_mutation()
+
         return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}",
-            "panel_name": data.get('panel_name', ''),
-            "new_text": data.get('new_text', '')
+            "success": True,
+            "results": results,
+            "total_updates": len(updates),
+            "successful_updates": success_count,
+            "failed_updates": len(updates) - success_count,
+            "summary": f"Successfully updated {success_count} of {len(updates)} Panels"
         }
+
+    except ImportError as e:
+        return _err(f"Grasshopper not available: {str(e)}",
+                    file_name=data.get('file_name', ''))
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error setting Panel text: {str(e)}",
-            "traceback": traceback.format_exc(),
-            "panel_name": data.get('panel_name', ''),
-            "new_text": data.get('new_text', '')
-        }
+        return _err(f"Error setting Panel texts: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None,
+                    file_name=data.get('file_name', ''))
 
 @gh_tool(
     name="get_grasshopper_panel_data",
@@ -3421,175 +5030,186 @@ def handle_set_panel_text(data):
         "Useful for reading output values like truss weight, calculations, or any data displayed in panels.\n\n"
         "**Parameters:**\n"
         "- **panel_name** (str, optional): Name of a specific panel to read, or leave empty to read all panels\n"
+        "- **format** (str, optional): 'records' (default) returns a list of panel dicts; "
+        "'columns' returns parallel per-field lists, which is much more compact for large definitions\n"
+        "- **offset** (int, optional): Skip this many panels before reading (only when panel_name is empty)\n"
+        "- **limit** (int, optional): Read at most this many panels per call; 0 means no limit. "
+        "Use offset/limit together to page through large canvases (e.g. 64 panels at a time)\n"
+        "- **max_items** (int, optional): Cap the values collected per panel (default 1000, 0 = unlimited). "
+        "Panels cut short are marked with 'truncated': true\n"
         "\n**Returns:**\n"
         "Dictionary containing panel data including text content and computed values."
     )
 )
-async def get_grasshopper_panel_data(panel_name: str = "") -> Dict[str, Any]:
+async def get_grasshopper_panel_data(panel_name: str = "", format: str = "records",
+                                     offset: int = 0, limit: int = 0,
+                                     max_items: int = 1000) -> Dict[str, Any]:
     """
     Get data from Grasshopper Panel components via HTTP bridge.
-    
+
     Args:
         panel_name: Name of specific panel to read (optional, reads all if empty)
-        
+        format: 'records' for a list of dicts, 'columns' for parallel field lists
+        offset: Number of panels to skip when reading all panels
+        limit: Maximum number of panels to return (0 = unlimited)
+        max_items: Maximum values collected per panel (0 = unlimited)
+
     Returns:
         Dict containing panel data
     """
+
+    request_data = {"panel_name": panel_name, "format": format,
+                    "offset": offset, "limit": limit, "max_items": max_items}
     
-    request_data = {"panel_name": panel_name}
-    
-    return call_bridge_api("/get_panel_data", request_data)
+    return await call_bridge_api_async("/get_panel_data", request_data)
 
 @bridge_handler("/get_panel_data")
 def handle_get_panel_data(data):
     """Bridge handler for getting Panel data"""
+    if not _GH_AVAILABLE:
+        return _gh_unavailable()
+
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
         
         panel_name = data.get('panel_name', '')
-        
-        # Get the Grasshopper plugin and document
-        gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
-        if not gh:
-            return {
-                "success": False,
-                "error": "Grasshopper plugin not available"
-            }
-        
-        gh_doc = Grasshopper.Instances.ActiveCanvas.Document if Grasshopper.Instances.ActiveCanvas else None
-        if not gh_doc:
-            return {
-                "success": False,
-                "error": "No active Grasshopper document found"
-            }
-        
+        # Bound per-panel value collection; 0 means unlimited
+        max_items = int(data.get('max_items', 1000) or 0)
+        if max_items <= 0:
+            max_items = None
+
+        # Get the Grasshopper plugin and document (memoized)
+        gh, gh_doc, err = _acquire_doc()
+        if err:
+            return err
+
         panel_data = []
-        
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Panel):
-                current_panel_name = obj.NickName or "Unnamed"
-                
-                # If specific panel requested, skip others
-                if panel_name and current_panel_name != panel_name:
-                    continue
-                
-                panel_info = {
-                    "name": current_panel_name,
-                    "user_text": obj.UserText if hasattr(obj, 'UserText') else "",
-                    "volatile_data_text": "",
-                    "volatile_data_list": [],
-                    "position": {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)},
-                    "computed_values": [],
-                    "display_text": ""
-                }
+        seen = {}
+        total_panels = None
+
+        if panel_name:
+            # Named lookups go straight through the cached index
+            candidates = _nickname_index(gh_doc, Grasshopper.Kernel.Special.GH_Panel, "panels").get(panel_name, [])
+        else:
+            candidates = _typed_objects(gh_doc, Grasshopper.Kernel.Special.GH_Panel, "panels")
+            total_panels = len(candidates)
+
+            # Page through the canvas instead of extracting every panel in
+            # one shot; extraction is the expensive part, so slicing the
+            # candidate list keeps per-call work bounded by the page size
+            offset = int(data.get('offset', 0) or 0)
+            limit = int(data.get('limit', 0) or 0)
+            if offset:
+                candidates = candidates[offset:]
+            if limit:
+                candidates = candidates[:limit]
+
+        for obj in candidates:
+            current_panel_name = obj.NickName or "Unnamed"
+
+            # Reuse the extraction when the same instance shows up again
+            # (e.g. via group membership) instead of re-reading its data
+            guid = str(obj.InstanceGuid)
+            if guid in seen:
+                panel_data.append(seen[guid])
+                continue
+
+            # Fetch the pivot once instead of crossing into .NET per coordinate
+            pivot = obj.Attributes.Pivot
+            panel_info = {
+                "name": current_panel_name,
+                "user_text": obj.UserText,
+                "volatile_data_text": "",
+                "volatile_data_list": [],
+                "position": {"x": float(pivot.X), "y": float(pivot.Y)},
+                "computed_values": [],
+                "display_text": ""
+            }
+            
+            # Extract volatile data (computed values)
+            try:
+                all_values = []
+                truncated = False
+
+                if obj.VolatileData:
+                    truncated = _extract_volatile_values(obj.VolatileData, all_values,
+                                                         sanitize=True, max_items=max_items)
+
+                # Fall back to the upstream sources only when the panel's
+                # own tree was empty; panels are parameters and carry no
+                # Params collection, and reading both duplicated every value
+                if not all_values and obj.SourceCount > 0:
+                    for source in obj.Sources:
+                        if source.VolatileData:
+                            truncated = _extract_volatile_values(
+                                source.VolatileData, all_values,
+                                sanitize=True, max_items=max_items) or truncated
+
+                if truncated:
+                    panel_info["truncated"] = True
+
+                panel_info["volatile_data_list"] = all_values
+                panel_info["volatile_data_text"] = ','.join(all_values) if all_values else ""
+                panel_info["computed_values"] = all_values
                 
-                # Extract volatile data (computed values)
+                # Build display text straight from the volatile data tree;
+                # this avoids stringifying the whole component via ToString
+                # or going through the GetValue data-access shim
                 try:
-                    all_values = []
-                    
-                    if hasattr(obj, 'VolatileData') and obj.VolatileData:
-                        vd = obj.VolatileData
-                        
-                        for path in vd.Paths:
-                            branch = vd.get_Branch(path)
-                            if branch:
-                                for i in range(branch.Count):
-                                    try:
-                                        item = branch[i]
-                                        if item is not None:
-                                            # Try to get the actual value
-                                            if hasattr(item, 'Value'):
-                                                item_str = str(item.Value).replace('"', "'")
-                                                all_values.append(item_str)
-                                            else:
-                                                item_str = str(item).replace('"', "'")
-                                                all_values.append(item_str)
-                                    except Exception:
-                                        continue
-                    
-                    # Also try to get values from input parameters if panel is displaying input data
-                    if hasattr(obj, 'Params') and obj.Params.Input and obj.Params.Input.Count > 0:
-                        for i in range(obj.Params.Input.Count):
-                            input_param = obj.Params.Input[i]
-                            if hasattr(input_param, 'VolatileData') and input_param.VolatileData:
-                                input_vd = input_param.VolatileData
-                                for path in input_vd.Paths:
-                                    branch = input_vd.get_Branch(path)
-                                    if branch:
-                                        for j in range(branch.Count):
-                                            try:
-                                                item = branch[j]
-                                                if item is not None:
-                                                    if hasattr(item, 'Value'):
-                                                        item_str = str(item.Value).replace('"', "'")
-                                                        all_values.append(item_str)
-                                                    else:
-                                                        item_str = str(item).replace('"', "'")
-                                                        all_values.append(item_str)
-                                            except Exception:
-                                                continue
-                    
-                    panel_info["volatile_data_list"] = all_values
-                    panel_info["volatile_data_text"] = ','.join(all_values) if all_values else ""
-                    panel_info["computed_values"] = all_values
-                    
-                    # Try to extract display text from the panel itself
-                    try:
-                        if hasattr(obj, 'ToString'):
-                            panel_info["display_text"] = str(obj.ToString())
-                    except:
-                        pass
-                        
-                    # Try alternative methods to get the actual displayed content
-                    try:
-                        if hasattr(obj, 'Properties'):
-                            if hasattr(obj.Properties, 'Text'):
-                                panel_info["display_text"] = str(obj.Properties.Text)
-                    except:
-                        pass
-                        
-                    # Try to get text from the panel's visual representation
-                    try:
-                        if hasattr(obj, 'GetValue'):
-                            value = obj.GetValue(0, 0)  # Try to get first value
-                            if value is not None:
-                                panel_info["display_text"] = str(value)
-                    except:
-                        pass
-                        
-                except Exception as e:
-                    panel_info["volatile_data_error"] = f"Could not extract volatile data: {str(e)}"
-                
-                panel_data.append(panel_info)
-        
+                    vd = obj.VolatileData
+                    if vd is not None and vd.DataCount > 0:
+                        parts = []
+                        for goo in vd.AllData(True):
+                            parts.append(goo.ToString() if goo is not None else "")
+                        panel_info["display_text"] = "\n".join(parts)
+                    elif type(obj).__name__ == "GH_Panel":
+                        # Text panels with no computed data display their own text
+                        panel_info["display_text"] = obj.UserText
+                    else:
+                        display_text = _panel_display_text(obj)
+                        if display_text is not None:
+                            panel_info["display_text"] = display_text
+                except _EXPECTED_NET_ERRORS:
+                    pass
+
+            except Exception as e:
+                panel_info["volatile_data_error"] = f"Could not extract volatile data: {str(e)}"
+
+            seen[guid] = panel_info
+            panel_data.append(panel_info)
+    
         if panel_name and not panel_data:
-            return {
-                "success": False,
-                "error": f"Panel '{panel_name}' not found"
+            return _err(f"Panel '{panel_name}' not found")
+
+        if data.get('format') == 'columns':
+            result = {
+                "success": True,
+                "columns": _columnize(panel_data),
+                "count": len(panel_data),
+                "message": f"Retrieved data from {len(panel_data)} panel(s)"
             }
-        
-        return {
-            "success": True,
-            "panel_data": panel_data,
-            "count": len(panel_data),
-            "message": f"Retrieved data from {len(panel_data)} panel(s)"
-        }
+        else:
+            result = {
+                "success": True,
+                "panel_data": panel_data,
+                "count": len(panel_data),
+                "message": f"Retrieved data from {len(panel_data)} panel(s)"
+            }
+
+        if total_panels is not None:
+            result["total_panels"] = total_panels
+            result["offset"] = int(data.get('offset', 0) or 0)
+            result["has_more"] = (int(data.get('offset', 0) or 0) + len(panel_data)) < total_panels
+
+        return result
         
     except ImportError as e:
-        return {
-            "success": False,
-            "error": f"Grasshopper not available: {str(e)}"
-        }
+        return _err(f"Grasshopper not available: {str(e)}")
     except Exception as e:
-        import traceback
-        return {
-            "success": False,
-            "error": f"Error getting Panel data: {str(e)}",
-            "traceback": traceback.format_exc()
-        }
+        # Formatting the traceback allocates a large string, so only pay
+        # for it when debugging is switched on
+        return _err(f"Error getting Panel data: {str(e)}",
+                    traceback=traceback.format_exc() if _DEBUG_TB else None)
 
 @gh_tool(
     name="analyze_grasshopper_inputs_with_context",
@@ -3623,21 +5243,17 @@ async def analyze_grasshopper_inputs_with_context(file_name: str) -> Dict[str, A
         "file_name": file_name
     }
 
-    return call_bridge_api("/analyze_inputs_context", request_data)
+    return await call_bridge_api_async("/analyze_inputs_context", request_data)
 
 @bridge_handler("/analyze_inputs_context")
 def handle_analyze_inputs_context(data):
     """Bridge handler for analyzing inputs with context"""
-    import traceback
     debug_log = []
 
     try:
         debug_log.append("Starting analyze_inputs_context handler")
 
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
+        Grasshopper, Rhino = _get_gh()
         import System
 
         debug_log.append("Imports successful")
@@ -3682,152 +5298,60 @@ def handle_analyze_inputs_context(data):
 
         debug_log.append(f"Found Grasshopper document with {gh_doc.ObjectCount} objects")
 
-        # Build a map of groups and their contained objects
-        groups_map = {}
-        debug_log.append("Building groups map")
-
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Group):
-                # Get bounds - GH_Group uses Attributes.Bounds not obj.Bounds
-                bounds_rect = obj.Attributes.Bounds if hasattr(obj.Attributes, 'Bounds') else None
-
-                if bounds_rect:
-                    group_info = {
-                        "name": obj.NickName or "Unnamed Group",
-                        "color": str(obj.Colour) if hasattr(obj, 'Colour') else "Unknown",
-                        "bounds": {
-                            "left": float(bounds_rect.Left),
-                            "right": float(bounds_rect.Right),
-                            "top": float(bounds_rect.Top),
-                            "bottom": float(bounds_rect.Bottom)
-                        },
-                        "members": []
-                    }
-                    groups_map[str(obj.InstanceGuid)] = group_info
+        # One cached scan builds everything the analysis below consumes;
+        # a back-to-back outputs analysis reuses the same snapshot
+        ctx = _build_doc_context(Grasshopper, gh_doc, debug_log)
+        slider_records = ctx["slider_records"]
+        param_records = ctx["param_records"]
+        groups_map = ctx["groups_map"]
+        component_group_map = ctx["component_group_map"]
+        scribbles = ctx["scribbles"]
+        scribble_grid = ctx["scribble_grid"]
 
         debug_log.append(f"Found {len(groups_map)} groups")
-
-        # Map components to their groups and find nearby scribbles
-        component_group_map = {}
-        scribbles = []
-        debug_log.append("Mapping components to groups and finding scribbles")
-
-        for obj in gh_doc.Objects:
-            try:
-                obj_guid = str(obj.InstanceGuid)
-
-                # Convert bounds to JSON-serializable format
-                bounds_data = None
-                if hasattr(obj.Attributes, 'Bounds'):
-                    bounds_rect = obj.Attributes.Bounds
-                    bounds_data = {
-                        "left": float(bounds_rect.Left),
-                        "right": float(bounds_rect.Right),
-                        "top": float(bounds_rect.Top),
-                        "bottom": float(bounds_rect.Bottom),
-                        "width": float(bounds_rect.Width),
-                        "height": float(bounds_rect.Height)
-                    }
-
-                obj_bounds = {
-                    "x": float(obj.Attributes.Pivot.X),
-                    "y": float(obj.Attributes.Pivot.Y),
-                    "bounds": bounds_data
-                }
-
-                # Check if object is in any group
-                for group_guid, group_info in groups_map.items():
-                    bounds = group_info["bounds"]
-                    if (bounds["left"] <= obj_bounds["x"] <= bounds["right"] and
-                        bounds["top"] <= obj_bounds["y"] <= bounds["bottom"]):
-                        component_group_map[obj_guid] = group_info["name"]
-                        group_info["members"].append(obj.NickName or type(obj).__name__)
-                        break
-
-                # Collect scribble text annotations
-                if isinstance(obj, Grasshopper.Kernel.Special.GH_Scribble):
-                    scribble_text = ""
-                    if hasattr(obj, 'Text'):
-                        scribble_text = obj.Text
-                    elif hasattr(obj, 'RichText'):
-                        scribble_text = obj.RichText
-
-                    scribbles.append({
-                        "text": scribble_text,
-                        "position": obj_bounds,
-                        "guid": obj_guid
-                    })
-            except Exception as obj_error:
-                debug_log.append(f"Error processing object {obj.NickName if hasattr(obj, 'NickName') else 'unknown'}: {str(obj_error)}")
-                continue
-
         debug_log.append(f"Found {len(scribbles)} scribbles, mapped {len(component_group_map)} components to groups")
 
-        # Helper function to find nearby scribbles
-        def find_nearby_annotations(obj_position, max_distance=150):
-            nearby = []
-            for scribble in scribbles:
-                dx = abs(scribble["position"]["x"] - obj_position["x"])
-                dy = abs(scribble["position"]["y"] - obj_position["y"])
-                distance = (dx*dx + dy*dy) ** 0.5
-                if distance < max_distance:
-                    nearby.append({
-                        "text": scribble["text"],
-                        "distance": distance
-                    })
-            # Sort by distance
-            nearby.sort(key=lambda x: x["distance"])
-            return nearby
-
         # Analyze sliders with context
         sliders_with_context = []
         debug_log.append("Analyzing sliders with context")
 
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_NumberSlider):
-                try:
-                    obj_guid = str(obj.InstanceGuid)
-                    position = {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+        for obj, obj_guid, px, py in slider_records:
+            try:
+                position = {"x": px, "y": py}
+                nearby_annotations, nearby_lower = _annotations_near(scribble_grid, px, py)
 
-                    slider_info = {
-                        "name": obj.NickName or "Unnamed",
-                        "current_value": float(str(obj.Slider.Value)),
-                        "min_value": float(str(obj.Slider.Minimum)),
-                        "max_value": float(str(obj.Slider.Maximum)),
-                        "precision": obj.Slider.DecimalPlaces,
-                        "type": obj.Slider.Type.ToString(),
-                        "position": position,
-                        "group_name": component_group_map.get(obj_guid, None),
-                        "nearby_annotations": find_nearby_annotations(position),
-                        "inferred_purpose": "Unknown"
-                    }
+                slider_info = {
+                    "name": obj.NickName or "Unnamed",
+                    "current_value": _dec_to_float(obj.Slider.Value),
+                    "min_value": _dec_to_float(obj.Slider.Minimum),
+                    "max_value": _dec_to_float(obj.Slider.Maximum),
+                    "precision": obj.Slider.DecimalPlaces,
+                    "type": obj.Slider.Type.ToString(),
+                    "position": position,
+                    "group_name": component_group_map.get(obj_guid, None),
+                    "nearby_annotations": nearby_annotations,
+                    "inferred_purpose": "Unknown"
+                }
+
+                # Enhanced purpose inference using group name and annotations
+                parts = [slider_info["name"].lower()]
+                if slider_info["group_name"]:
+                    parts.append(slider_info["group_name"].lower())
+                parts.extend(nearby_lower)
+                all_context_text = " ".join(parts)
 
-                    # Enhanced purpose inference using group name and annotations
-                    all_context_text = (slider_info["name"] + " " +
-                                       (slider_info["group_name"] or "") + " " +
-                                       " ".join([ann["text"] for ann in slider_info["nearby_annotations"]])).lower()
-
-                    if any(kw in all_context_text for kw in ["length", "distance", "span"]):
-                        slider_info["inferred_purpose"] = "Length/Distance control"
-                    elif any(kw in all_context_text for kw in ["width", "wide"]):
-                        slider_info["inferred_purpose"] = "Width control"
-                    elif any(kw in all_context_text for kw in ["height", "tall", "depth"]):
-                        slider_info["inferred_purpose"] = "Height/Depth control"
-                    elif any(kw in all_context_text for kw in ["count", "number", "quantity", "num"]):
-                        slider_info["inferred_purpose"] = "Count/Quantity control"
-                    elif any(kw in all_context_text for kw in ["angle", "rotation", "rotate"]):
-                        slider_info["inferred_purpose"] = "Angle/Rotation control"
-                    elif any(kw in all_context_text for kw in ["factor", "ratio", "proportion"]):
-                        slider_info["inferred_purpose"] = "Factor/Ratio control"
-                    elif any(kw in all_context_text for kw in ["truss", "structural", "beam"]):
-                        slider_info["inferred_purpose"] = "Structural parameter"
-                    elif slider_info["group_name"]:
+                for pattern, label in _INPUT_PURPOSE_PATTERNS:
+                    if pattern.search(all_context_text):
+                        slider_info["inferred_purpose"] = label
+                        break
+                else:
+                    if slider_info["group_name"]:
                         slider_info["inferred_purpose"] = f"Parameter for {slider_info['group_name']}"
 
-                    sliders_with_context.append(slider_info)
-                except Exception as slider_error:
-                    debug_log.append(f"Error processing slider {obj.NickName if hasattr(obj, 'NickName') else 'unknown'}: {str(slider_error)}")
-                    continue
+                sliders_with_context.append(slider_info)
+            except Exception as slider_error:
+                debug_log.append(f"Error processing slider {obj.NickName if _has(obj, 'NickName') else 'unknown'}: {str(slider_error)}")
+                continue
 
         debug_log.append(f"Found {len(sliders_with_context)} sliders with context")
 
@@ -3835,70 +5359,65 @@ def handle_analyze_inputs_context(data):
         geometry_inputs = []
         debug_log.append("Analyzing geometry input parameters with context")
 
-        geometry_param_types = [
-            "Grasshopper.Kernel.Parameters.Param_Curve",
-            "Grasshopper.Kernel.Parameters.Param_Surface",
-            "Grasshopper.Kernel.Parameters.Param_Brep",
-            "Grasshopper.Kernel.Parameters.Param_Geometry",
-            "Grasshopper.Kernel.Parameters.Param_Line",
-            "Grasshopper.Kernel.Parameters.Param_Circle",
-            "Grasshopper.Kernel.Parameters.Param_Arc",
-            "Grasshopper.Kernel.Parameters.Param_Point"
-        ]
-
-        for obj in gh_doc.Objects:
+        for obj, obj_guid, px, py in param_records:
             try:
-                obj_type = type(obj).__module__ + "." + type(obj).__name__
+                obj_type = _type_fullname(type(obj))
 
                 # Check if it's a geometry parameter type
-                is_geometry_param = any(geom_type in obj_type for geom_type in geometry_param_types)
+                is_geometry_param = obj_type in _GEOM_INPUT_PARAM_TYPES
 
                 # Also check for parameter containers
-                if not is_geometry_param and hasattr(obj, 'SourceCount'):
+                if not is_geometry_param and _has(obj, 'SourceCount'):
                     is_geometry_param = (obj.SourceCount == 0 and  # No input connections
-                                        hasattr(obj, 'Recipients') and obj.Recipients.Count > 0)  # Has outputs
+                                        _has(obj, 'Recipients') and obj.Recipients.Count > 0)  # Has outputs
 
                 if is_geometry_param:
-                    obj_guid = str(obj.InstanceGuid)
-                    position = {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+                    position = {"x": px, "y": py}
 
                     # Check if it's truly an input (no sources, has recipients)
-                    has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
-                    has_recipients = hasattr(obj, 'Recipients') and obj.Recipients.Count > 0
+                    has_sources = _has(obj, 'SourceCount') and obj.SourceCount > 0
+                    has_recipients = _has(obj, 'Recipients') and obj.Recipients.Count > 0
 
                     if not has_sources and has_recipients:
+                        nearby_annotations, nearby_lower = _annotations_near(scribble_grid, px, py)
                         geom_info = {
                             "name": obj.NickName or "Unnamed",
                             "type": type(obj).__name__,
                             "full_type": obj_type,
                             "position": position,
                             "group_name": component_group_map.get(obj_guid, None),
-                            "nearby_annotations": find_nearby_annotations(position),
-                            "description": obj.Description if hasattr(obj, 'Description') else "",
+                            "nearby_annotations": nearby_annotations,
+                            "description": obj.Description if _has(obj, 'Description') else "",
                             "has_data": False,
                             "data_count": 0
                         }
 
                         # Check if it has data
-                        if hasattr(obj, 'VolatileDataCount'):
+                        if _has(obj, 'VolatileDataCount'):
                             geom_info["has_data"] = obj.VolatileDataCount > 0
                             geom_info["data_count"] = obj.VolatileDataCount
 
-                        # Infer purpose from context
-                        all_context_text = (geom_info["name"] + " " +
-                                           (geom_info["group_name"] or "") + " " +
-                                           " ".join([ann["text"] for ann in geom_info["nearby_annotations"]])).lower()
-
-                        if "curve" in obj_type.lower() or "curve" in all_context_text:
-                            geom_info["inferred_purpose"] = "Curve input"
-                        elif "surface" in obj_type.lower() or "surface" in all_context_text:
-                            geom_info["inferred_purpose"] = "Surface input"
-                        elif "point" in obj_type.lower() or "point" in all_context_text:
-                            geom_info["inferred_purpose"] = "Point input"
-                        elif "line" in obj_type.lower() or "line" in all_context_text:
-                            geom_info["inferred_purpose"] = "Line input"
-                        else:
-                            geom_info["inferred_purpose"] = "Geometry input"
+                        # Infer purpose: the param type is authoritative;
+                        # only generic params fall back to context keywords
+                        purpose = _PARAM_PURPOSE.get(obj_type)
+                        if purpose is None:
+                            parts = [geom_info["name"].lower()]
+                            if geom_info["group_name"]:
+                                parts.append(geom_info["group_name"].lower())
+                            parts.extend(nearby_lower)
+                            all_context_text = " ".join(parts)
+
+                            if "curve" in all_context_text:
+                                purpose = "Curve input"
+                            elif "surface" in all_context_text:
+                                purpose = "Surface input"
+                            elif "point" in all_context_text:
+                                purpose = "Point input"
+                            elif "line" in all_context_text:
+                                purpose = "Line input"
+                            else:
+                                purpose = "Geometry input"
+                        geom_info["inferred_purpose"] = purpose
 
                         geometry_inputs.append(geom_info)
             except Exception as geom_error:
@@ -3931,7 +5450,7 @@ def handle_analyze_inputs_context(data):
         return {
             "success": False,
             "error": f"Error analyzing inputs: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "debug_log": debug_log
         }
 
@@ -3966,17 +5485,13 @@ async def analyze_grasshopper_outputs_with_context(file_name: str = None) -> Dic
         "file_name": file_name
     }
 
-    return call_bridge_api("/analyze_outputs_context", request_data)
+    return await call_bridge_api_async("/analyze_outputs_context", request_data)
 
 @bridge_handler("/analyze_outputs_context")
 def handle_analyze_outputs_context(data):
     """Bridge handler for analyzing outputs with context"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        import Grasshopper
-        import Rhino
-        import os
+        Grasshopper, Rhino = _get_gh()
 
         # Get the Grasshopper plugin and document
         gh = Rhino.RhinoApp.GetPlugInObject("Grasshopper")
@@ -3995,7 +5510,7 @@ def handle_analyze_outputs_context(data):
             doc_server = Grasshopper.Instances.DocumentServer
             if doc_server:
                 for doc in doc_server:
-                    if doc and hasattr(doc, 'FilePath') and doc.FilePath:
+                    if doc and _has(doc, 'FilePath') and doc.FilePath:
                         current_file_name = os.path.basename(str(doc.FilePath))
                         if current_file_name.lower() == file_name.lower():
                             gh_doc = doc
@@ -4015,116 +5530,45 @@ def handle_analyze_outputs_context(data):
                     "error": "No active Grasshopper document found"
                 }
 
-        # Build groups map and scribbles (reuse logic from inputs analysis)
-        groups_map = {}
-        for obj in gh_doc.Objects:
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Group):
-                # Get bounds - GH_Group uses Attributes.Bounds not obj.Bounds
-                bounds_rect = obj.Attributes.Bounds if hasattr(obj.Attributes, 'Bounds') else None
-
-                if bounds_rect:
-                    group_info = {
-                        "name": obj.NickName or "Unnamed Group",
-                        "bounds": {
-                            "left": float(bounds_rect.Left),
-                            "right": float(bounds_rect.Right),
-                            "top": float(bounds_rect.Top),
-                            "bottom": float(bounds_rect.Bottom)
-                        }
-                    }
-                    groups_map[str(obj.InstanceGuid)] = group_info
-
-        component_group_map = {}
-        scribbles = []
-
-        for obj in gh_doc.Objects:
-            obj_guid = str(obj.InstanceGuid)
-            obj_bounds = {
-                "x": float(obj.Attributes.Pivot.X),
-                "y": float(obj.Attributes.Pivot.Y)
-            }
-
-            # Map to groups
-            for group_guid, group_info in groups_map.items():
-                bounds = group_info["bounds"]
-                if (bounds["left"] <= obj_bounds["x"] <= bounds["right"] and
-                    bounds["top"] <= obj_bounds["y"] <= bounds["bottom"]):
-                    component_group_map[obj_guid] = group_info["name"]
-                    break
-
-            # Collect scribbles
-            if isinstance(obj, Grasshopper.Kernel.Special.GH_Scribble):
-                scribble_text = ""
-                if hasattr(obj, 'Text'):
-                    scribble_text = obj.Text
-                elif hasattr(obj, 'RichText'):
-                    scribble_text = obj.RichText
-
-                scribbles.append({
-                    "text": scribble_text,
-                    "position": obj_bounds,
-                    "guid": obj_guid
-                })
-
-        def find_nearby_annotations(obj_position, max_distance=150):
-            nearby = []
-            for scribble in scribbles:
-                dx = abs(scribble["position"]["x"] - obj_position["x"])
-                dy = abs(scribble["position"]["y"] - obj_position["y"])
-                distance = (dx*dx + dy*dy) ** 0.5
-                if distance < max_distance:
-                    nearby.append({
-                        "text": scribble["text"],
-                        "distance": distance
-                    })
-            nearby.sort(key=lambda x: x["distance"])
-            return nearby
+        # Reuse (or build) the shared canvas-layout snapshot
+        ctx = _build_doc_context(Grasshopper, gh_doc)
+        all_records = ctx["all_records"]
+        component_group_map = ctx["component_group_map"]
+        scribble_grid = ctx["scribble_grid"]
 
         # Analyze geometry output parameters
         geometry_outputs = []
-        geometry_param_types = [
-            "Grasshopper.Kernel.Parameters.Param_Curve",
-            "Grasshopper.Kernel.Parameters.Param_Surface",
-            "Grasshopper.Kernel.Parameters.Param_Brep",
-            "Grasshopper.Kernel.Parameters.Param_Geometry",
-            "Grasshopper.Kernel.Parameters.Param_Line",
-            "Grasshopper.Kernel.Parameters.Param_Circle",
-            "Grasshopper.Kernel.Parameters.Param_Arc",
-            "Grasshopper.Kernel.Parameters.Param_Point",
-            "Grasshopper.Kernel.Parameters.Param_Mesh"
-        ]
-
-        for obj in gh_doc.Objects:
-            obj_type = type(obj).__module__ + "." + type(obj).__name__
+        for obj, obj_guid, px, py in all_records:
+            obj_type = _type_fullname(type(obj))
 
             # Check if it's a geometry parameter type
-            is_geometry_param = any(geom_type in obj_type for geom_type in geometry_param_types)
+            is_geometry_param = obj_type in _GEOM_OUTPUT_PARAM_TYPES
 
-            if is_geometry_param or hasattr(obj, 'SourceCount'):
-                obj_guid = str(obj.InstanceGuid)
-                position = {"x": float(obj.Attributes.Pivot.X), "y": float(obj.Attributes.Pivot.Y)}
+            if is_geometry_param or _has(obj, 'SourceCount'):
+                position = {"x": px, "y": py}
 
                 # Check if it's truly an output (has sources, no/few recipients)
-                has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
-                has_recipients = hasattr(obj, 'Recipients') and obj.Recipients.Count > 0
+                has_sources = _has(obj, 'SourceCount') and obj.SourceCount > 0
+                has_recipients = _has(obj, 'Recipients') and obj.Recipients.Count > 0
 
                 # Output criteria: has input data but doesn't feed other components (or very few)
                 if has_sources and not has_recipients:
+                    nearby_annotations, nearby_lower = _annotations_near(scribble_grid, px, py)
                     geom_info = {
                         "name": obj.NickName or "Unnamed",
                         "type": type(obj).__name__,
                         "full_type": obj_type,
                         "position": position,
                         "group_name": component_group_map.get(obj_guid, None),
-                        "nearby_annotations": find_nearby_annotations(position),
-                        "description": obj.Description if hasattr(obj, 'Description') else "",
+                        "nearby_annotations": nearby_annotations,
+                        "description": obj.Description if _has(obj, 'Description') else "",
                         "has_data": False,
                         "data_count": 0,
                         "data_type": "Unknown"
                     }
 
                     # Check if it has data
-                    if hasattr(obj, 'VolatileDataCount'):
+                    if _has(obj, 'VolatileDataCount'):
                         geom_info["has_data"] = obj.VolatileDataCount > 0
                         geom_info["data_count"] = obj.VolatileDataCount
 
@@ -4143,24 +5587,21 @@ def handle_analyze_outputs_context(data):
                         geom_info["data_type"] = "Geometry"
 
                     # Infer purpose from context
-                    all_context_text = (geom_info["name"] + " " +
-                                       (geom_info["group_name"] or "") + " " +
-                                       " ".join([ann["text"] for ann in geom_info["nearby_annotations"]])).lower()
-
-                    if any(kw in all_context_text for kw in ["truss", "beam", "member", "element"]):
-                        geom_info["inferred_purpose"] = "Structural elements output"
-                    elif any(kw in all_context_text for kw in ["upper", "top", "chord"]):
-                        geom_info["inferred_purpose"] = "Upper/top elements output"
-                    elif any(kw in all_context_text for kw in ["lower", "bottom"]):
-                        geom_info["inferred_purpose"] = "Lower/bottom elements output"
-                    elif any(kw in all_context_text for kw in ["vertical", "vert"]):
-                        geom_info["inferred_purpose"] = "Vertical elements output"
-                    elif any(kw in all_context_text for kw in ["diagonal", "diag", "brace"]):
-                        geom_info["inferred_purpose"] = "Diagonal/bracing elements output"
-                    elif geom_info["group_name"]:
-                        geom_info["inferred_purpose"] = f"{geom_info['group_name']} output"
+                    parts = [geom_info["name"].lower()]
+                    if geom_info["group_name"]:
+                        parts.append(geom_info["group_name"].lower())
+                    parts.extend(nearby_lower)
+                    all_context_text = " ".join(parts)
+
+                    for pattern, label in _OUTPUT_PURPOSE_PATTERNS:
+                        if pattern.search(all_context_text):
+                            geom_info["inferred_purpose"] = label
+                            break
                     else:
-                        geom_info["inferred_purpose"] = f"{geom_info['data_type']} output"
+                        if geom_info["group_name"]:
+                            geom_info["inferred_purpose"] = f"{geom_info['group_name']} output"
+                        else:
+                            geom_info["inferred_purpose"] = f"{geom_info['data_type']} output"
 
                     geometry_outputs.append(geom_info)
 
@@ -4186,11 +5627,10 @@ def handle_analyze_outputs_context(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error analyzing outputs: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
@@ -4227,20 +5667,17 @@ async def set_grasshopper_geometry_input(file_name: str, parameter_name: str, rh
         "rhino_object_ids": rhino_object_ids
     }
 
-    return call_bridge_api("/set_geometry_input", request_data)
+    return await call_bridge_api_async("/set_geometry_input", request_data)
 
 @bridge_handler("/set_geometry_input")
 def handle_set_geometry_input(data):
     """Bridge handler for setting geometry input"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
         import System
         import scriptcontext as sc
-        import os
 
         file_name = data.get('file_name', '')
         parameter_name = data.get('parameter_name', '')
@@ -4287,36 +5724,31 @@ def handle_set_geometry_input(data):
                 "file_name": file_name
             }
 
+        # Resolve the parameter through the shared canvas index rather
+        # than scanning gh_doc.Objects for each lookup attempt
+        ctx = _build_doc_context(Grasshopper, gh_doc)
+        name_to_objs = ctx["name_to_objs"]
+
         # Find the parameter component - try multiple approaches
         param_found = False
         target_param = None
 
         # First, try exact name match
-        for obj in gh_doc.Objects:
-            obj_name = obj.NickName if obj.NickName else (obj.Name if hasattr(obj, 'Name') else "Unnamed")
+        for obj, obj_name in name_to_objs.get(parameter_name.lower(), ()):
             if obj_name == parameter_name:
                 # Check if it's a parameter - be more flexible
-                obj_type_name = type(obj).__name__
-                is_param = ("Param" in obj_type_name or
-                           (hasattr(obj, 'Category') and obj.Category == "Params") or
-                           hasattr(obj, 'PersistentData'))
-
-                if is_param:
+                if _is_param(obj):
                     target_param = obj
                     param_found = True
                     break
 
-        # If not found, try case-insensitive partial match
+        # If not found, try case-insensitive partial match over the
+        # prebuilt doc-order records (names are already lowered)
         if not param_found:
-            for obj in gh_doc.Objects:
-                obj_name = obj.NickName if obj.NickName else (obj.Name if hasattr(obj, 'Name') else "Unnamed")
-                if parameter_name.lower() in obj_name.lower() or obj_name.lower() in parameter_name.lower():
-                    obj_type_name = type(obj).__name__
-                    is_param = ("Param" in obj_type_name or
-                               (hasattr(obj, 'Category') and obj.Category == "Params") or
-                               hasattr(obj, 'PersistentData'))
-
-                    if is_param:
+            parameter_name_lower = parameter_name.lower()
+            for obj, obj_name, name_lower in ctx["name_records"]:
+                if parameter_name_lower in name_lower or name_lower in parameter_name_lower:
+                    if _is_param(obj):
                         target_param = obj
                         param_found = True
                         break
@@ -4324,101 +5756,145 @@ def handle_set_geometry_input(data):
         if not param_found:
             # List available geometry parameters to help user
             available_params = []
-            for obj in gh_doc.Objects:
+            for obj, obj_name, name_lower in ctx["name_records"]:
                 obj_type_name = type(obj).__name__
                 if "Param" in obj_type_name and ("Curve" in obj_type_name or "Geometry" in obj_type_name or "Surface" in obj_type_name):
-                    obj_name = obj.NickName if obj.NickName else (obj.Name if hasattr(obj, 'Name') else "Unnamed")
-                    has_sources = hasattr(obj, 'SourceCount') and obj.SourceCount > 0
+                    has_sources = _param_traits(obj)[1] and obj.SourceCount > 0
                     if not has_sources:  # Only show input parameters
                         available_params.append(obj_name)
+                        if len(available_params) == 10:
+                            # The response only shows 10; no point scanning the rest
+                            break
 
             return {
                 "success": False,
                 "error": f"Parameter '{parameter_name}' not found",
-                "available_geometry_parameters": available_params[:10],  # Show first 10
+                "available_geometry_parameters": available_params,  # Show first 10
                 "suggestion": "Try one of the available parameter names listed above"
             }
 
-        # Clear existing data first to replace (not append)
-        cleared_info = []
+        # Keep the canvas from reacting to intermediate state while the
+        # parameter's data is cleared and replaced; the solve happens once
+        # at the end
+        prev_enabled = gh_doc.Enabled
+        gh_doc.Enabled = False
         try:
-            if hasattr(target_param, 'ClearData'):
-                target_param.ClearData()
-                cleared_info.append("ClearData()")
-
-            # Also clear persistent data to ensure complete replacement
-            if hasattr(target_param, 'PersistentData') and target_param.PersistentData is not None:
-                old_count = target_param.PersistentData.DataCount if hasattr(target_param.PersistentData, 'DataCount') else 0
-                target_param.PersistentData.Clear()
-                cleared_info.append(f"PersistentData.Clear() - removed {old_count} items")
+            # Clear existing data first to replace (not append)
+            cleared_info = []
+            try:
+                if hasattr(target_param, 'ClearData'):
+                    target_param.ClearData()
+                    cleared_info.append("ClearData()")
 
-            # Clear volatile data if present
-            if hasattr(target_param, 'VolatileData') and target_param.VolatileData is not None:
-                target_param.VolatileData.Clear()
-                cleared_info.append("VolatileData.Clear()")
+                # Also clear persistent data to ensure complete replacement
+                if hasattr(target_param, 'PersistentData') and target_param.PersistentData is not None:
+                    old_count = target_param.PersistentData.DataCount if hasattr(target_param.PersistentData, 'DataCount') else 0
+                    target_param.PersistentData.Clear()
+                    cleared_info.append(f"PersistentData.Clear() - removed {old_count} items")
 
-        except Exception as e:
-            # Log but continue - some parameters may not support clearing
-            cleared_info.append(f"Clear error (continuing): {str(e)}")
+                # Clear volatile data if present
+                if hasattr(target_param, 'VolatileData') and target_param.VolatileData is not None:
+                    target_param.VolatileData.Clear()
+                    cleared_info.append("VolatileData.Clear()")
 
-        # Convert Rhino object IDs to Guids and get geometry
-        geometries_added = []
-        errors = []
+            except Exception as e:
+                # Log but continue - some parameters may not support clearing
+                cleared_info.append(f"Clear error (continuing): {str(e)}")
+
+            # Convert Rhino object IDs to Guids and get geometry. The
+            # buffer's element type follows the target parameter (e.g.
+            # List[GH_Point] for Param_Point) so the typed structure's
+            # AppendRange binds directly; unknown params keep the generic
+            # IGH_Goo buffer. Capacity is preallocated to the input size.
+            from System.Collections.Generic import List
+            goo_type = _goo_type_for_param(type(target_param).__name__)
+            if goo_type is None:
+                goo_type = Grasshopper.Kernel.Types.IGH_Goo
+            goo_buffer = List[goo_type](len(rhino_object_ids))
+            geometries_added = []
+            errors = []
+
+            # Callers re-setting geometry often repeat ids; resolve each id
+            # against the ObjectTable once per call
+            found_objects = {}
+
+            # Inline cache for the wrapper: inputs are almost always one
+            # geometry kind, so remember the last resolved type and skip
+            # even the dispatch-dict probe while it holds
+            last_cls = None
+            last_wrapper = None
 
-        for obj_id in rhino_object_ids:
-            try:
-                guid = System.Guid(obj_id)
-                rhino_obj = sc.doc.Objects.FindId(guid)
+            for obj_id in rhino_object_ids:
+                try:
+                    if obj_id in found_objects:
+                        rhino_obj = found_objects[obj_id]
+                    else:
+                        guid = System.Guid(obj_id)
+                        rhino_obj = sc.doc.Objects.FindId(guid)
+                        found_objects[obj_id] = rhino_obj
 
-                if rhino_obj:
-                    geom = rhino_obj.Geometry
+                    if rhino_obj:
+                        geom = rhino_obj.Geometry
 
-                    if geom:
-                        # Create appropriate GH type wrapper
-                        gh_geom = None
-
-                        if isinstance(geom, Rhino.Geometry.Curve):
-                            gh_geom = Grasshopper.Kernel.Types.GH_Curve(geom)
-                        elif isinstance(geom, Rhino.Geometry.Surface):
-                            gh_geom = Grasshopper.Kernel.Types.GH_Surface(geom)
-                        elif isinstance(geom, Rhino.Geometry.Brep):
-                            gh_geom = Grasshopper.Kernel.Types.GH_Brep(geom)
-                        elif isinstance(geom, Rhino.Geometry.Point3d):
-                            gh_geom = Grasshopper.Kernel.Types.GH_Point(geom)
-                        elif isinstance(geom, Rhino.Geometry.Mesh):
-                            gh_geom = Grasshopper.Kernel.Types.GH_Mesh(geom)
-                        else:
-                            # Try generic geometry wrapper
-                            try:
-                                gh_geom = Grasshopper.Kernel.Types.GH_GeometricGoo.CreateFromGeometry(geom)
-                            except:
-                                pass
+                        if geom:
+                            # Create appropriate GH type wrapper
+                            gh_geom = None
+
+                            cls = type(geom)
+                            if cls is not last_cls:
+                                last_cls = cls
+                                last_wrapper = _gh_wrapper_for(cls)
+                            wrapper = last_wrapper
+                            if wrapper is not None:
+                                gh_geom = wrapper(geom)
+                            else:
+                                # Try generic geometry wrapper
+                                try:
+                                    gh_geom = Grasshopper.Kernel.Types.GH_GeometricGoo.CreateFromGeometry(geom)
+                                except:
+                                    pass
 
-                        if gh_geom:
-                            # Add to persistent data
-                            target_param.AddPersistentData(gh_geom)
-                            geometries_added.append(obj_id)
+                            if gh_geom:
+                                # Buffer for one batched persistent-data append
+                                goo_buffer.Add(gh_geom)
+                                geometries_added.append(obj_id)
+                            else:
+                                errors.append(f"Could not convert geometry type {type(geom).__name__}")
                         else:
-                            errors.append(f"Could not convert geometry type {type(geom).__name__}")
+                            errors.append(f"Object {obj_id} has no geometry")
                     else:
-                        errors.append(f"Object {obj_id} has no geometry")
-                else:
-                    errors.append(f"Object {obj_id} not found in Rhino document")
+                        errors.append(f"Object {obj_id} not found in Rhino document")
 
-            except Exception as e:
-                errors.append(f"Error processing {obj_id}: {str(e)}")
-                continue
+                except Exception as e:
+                    errors.append(f"Error processing {obj_id}: {str(e)}")
+                    continue
 
-        if not geometries_added:
-            return {
-                "success": False,
-                "error": "Failed to add any geometry to parameter",
-                "details": errors
-            }
+            if not geometries_added:
+                return {
+                    "success": False,
+                    "error": "Failed to add any geometry to parameter",
+                    "details": errors
+                }
 
-        # Expire solution to recompute
+            # Hand the whole buffer to the parameter at once: one structure
+            # mutation instead of n AddPersistentData calls, each of which
+            # can re-validate the persistent tree
+            try:
+                target_param.PersistentData.AppendRange(goo_buffer, Grasshopper.Kernel.Data.GH_Path(0))
+            except Exception:
+                # Typed params whose structure rejects the IGH_Goo list fall
+                # back to the per-item path
+                for goo in goo_buffer:
+                    target_param.AddPersistentData(goo)
+
+        finally:
+            gh_doc.Enabled = prev_enabled
+
+        # Expire solution to recompute; the targeted param is already
+        # expired, so solve just the expired set rather than everything
         target_param.ExpireSolution(True)
-        gh_doc.NewSolution(True)
+        gh_doc.NewSolution(False)
+        _bump_doc_mutation()
 
         return {
             "success": True,
@@ -4435,11 +5911,10 @@ def handle_set_geometry_input(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error setting geometry input: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 @gh_tool(
@@ -4484,18 +5959,16 @@ async def extract_grasshopper_geometry_output(
         "layer_name": layer_name
     }
 
-    return call_bridge_api("/extract_geometry_output", request_data)
+    return await call_bridge_api_async("/extract_geometry_output", request_data)
 
 @bridge_handler("/extract_geometry_output")
 def handle_extract_geometry_output(data):
     """Bridge handler for extracting geometry output"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
-        import rhinoscriptsyntax as rs
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
+        import System
         import scriptcontext as sc
 
         file_name = data.get('file_name', '')
@@ -4537,14 +6010,15 @@ def handle_extract_geometry_output(data):
                 "file_name": file_name
             }
 
-        # Find the parameter component
+        # Find the parameter component through the shared canvas index
+        ctx = _build_doc_context(Grasshopper, gh_doc)
         param_found = False
         target_param = None
 
-        for obj in gh_doc.Objects:
-            if (obj.NickName or "Unnamed") == parameter_name:
+        for obj, obj_name in ctx["name_to_objs"].get(parameter_name.lower(), ()):
+            if obj_name == parameter_name:
                 # Check if it's a parameter with output data
-                if hasattr(obj, 'VolatileData') and obj.VolatileData:
+                if _has(obj, 'VolatileData') and obj.VolatileData:
                     target_param = obj
                     param_found = True
                     break
@@ -4563,22 +6037,34 @@ def handle_extract_geometry_output(data):
         if target_param.VolatileData:
             vd = target_param.VolatileData
 
-            # Set up layer if baking
+            # Resolve the bake layer to object attributes instead of
+            # switching the document's current layer, which is a global
+            # side effect this handler never restored
+            bake_attrs = None
             if bake_to_rhino and layer_name:
-                if not rs.IsLayer(layer_name):
-                    rs.AddLayer(layer_name)
-                rs.CurrentLayer(layer_name)
-
-            for path in vd.Paths:
-                branch = vd.get_Branch(path)
+                layer_index = sc.doc.Layers.FindByFullPath(layer_name, -1)
+                if layer_index < 0:
+                    layer_index = sc.doc.Layers.Add(layer_name, System.Drawing.Color.Black)
+                if layer_index >= 0:
+                    bake_attrs = Rhino.DocObjects.ObjectAttributes()
+                    bake_attrs.LayerIndex = layer_index
+
+            # One undo record for the whole bake instead of one per object
+            undo_record = 0
+            if bake_to_rhino:
+                undo_record = sc.doc.BeginUndoRecord("Bake Grasshopper output")
+
+            for path, branch in zip(vd.Paths, vd.Branches):
                 if branch:
-                    for i in range(branch.Count):
+                    # Format the branch path once, not once per item
+                    path_str = str(path)
+                    # Enumerate the branch directly; the index is only needed for reporting
+                    for i, item in enumerate(branch):
                         try:
-                            item = branch[i]
                             if item is not None:
                                 geom_info = {
                                     "index": i,
-                                    "path": str(path),
+                                    "path": path_str,
                                     "type": type(item).__name__,
                                     "data": {}
                                 }
@@ -4601,153 +6087,158 @@ def handle_extract_geometry_output(data):
                                     if success and converted_geom:
                                         bakeable_geom = converted_geom
 
-                                # Get geometry details based on type
-                                # Check for Line FIRST (before Curve) as it's a struct, not a Curve subclass
-                                if isinstance(actual_geom, Rhino.Geometry.Line):
+                                # Get geometry details based on type; the
+                                # struct-before-Curve ordering lives in
+                                # _geom_kind's base table
+                                kind = _geom_kind(type(actual_geom))
+
+                                # .NET doubles cross the boundary as
+                                # Python floats; wrapping them in
+                                # float() only allocates a copy
+                                if kind == "Line":
                                     geom_info["geometry_type"] = "Line"
-                                    geom_info["data"]["length"] = float(actual_geom.Length)
+                                    geom_info["data"]["length"] = actual_geom.Length
                                     geom_info["data"]["start"] = {
-                                        "x": float(actual_geom.From.X),
-                                        "y": float(actual_geom.From.Y),
-                                        "z": float(actual_geom.From.Z)
+                                        "x": actual_geom.From.X,
+                                        "y": actual_geom.From.Y,
+                                        "z": actual_geom.From.Z
                                     }
                                     geom_info["data"]["end"] = {
-                                        "x": float(actual_geom.To.X),
-                                        "y": float(actual_geom.To.Y),
-                                        "z": float(actual_geom.To.Z)
+                                        "x": actual_geom.To.X,
+                                        "y": actual_geom.To.Y,
+                                        "z": actual_geom.To.Z
                                     }
 
                                     # Bake if requested - use converted geometry
                                     if bake_to_rhino and bakeable_geom:
-                                        obj_id = sc.doc.Objects.Add(bakeable_geom)
+                                        obj_id = sc.doc.Objects.Add(bakeable_geom, bake_attrs) if bake_attrs else sc.doc.Objects.Add(bakeable_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Arc):
+                                elif kind == "Arc":
                                     geom_info["geometry_type"] = "Arc"
-                                    geom_info["data"]["length"] = float(actual_geom.Length)
-                                    geom_info["data"]["radius"] = float(actual_geom.Radius)
+                                    geom_info["data"]["length"] = actual_geom.Length
+                                    geom_info["data"]["radius"] = actual_geom.Radius
                                     geom_info["data"]["center"] = {
-                                        "x": float(actual_geom.Center.X),
-                                        "y": float(actual_geom.Center.Y),
-                                        "z": float(actual_geom.Center.Z)
+                                        "x": actual_geom.Center.X,
+                                        "y": actual_geom.Center.Y,
+                                        "z": actual_geom.Center.Z
                                     }
 
                                     # Bake if requested
                                     if bake_to_rhino and bakeable_geom:
-                                        obj_id = sc.doc.Objects.Add(bakeable_geom)
+                                        obj_id = sc.doc.Objects.Add(bakeable_geom, bake_attrs) if bake_attrs else sc.doc.Objects.Add(bakeable_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Circle):
+                                elif kind == "Circle":
                                     geom_info["geometry_type"] = "Circle"
-                                    geom_info["data"]["radius"] = float(actual_geom.Radius)
-                                    geom_info["data"]["circumference"] = float(actual_geom.Circumference)
+                                    geom_info["data"]["radius"] = actual_geom.Radius
+                                    geom_info["data"]["circumference"] = actual_geom.Circumference
                                     geom_info["data"]["center"] = {
-                                        "x": float(actual_geom.Center.X),
-                                        "y": float(actual_geom.Center.Y),
-                                        "z": float(actual_geom.Center.Z)
+                                        "x": actual_geom.Center.X,
+                                        "y": actual_geom.Center.Y,
+                                        "z": actual_geom.Center.Z
                                     }
 
                                     # Bake if requested
                                     if bake_to_rhino and bakeable_geom:
-                                        obj_id = sc.doc.Objects.Add(bakeable_geom)
+                                        obj_id = sc.doc.Objects.Add(bakeable_geom, bake_attrs) if bake_attrs else sc.doc.Objects.Add(bakeable_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Curve):
+                                elif kind == "Curve":
                                     geom_info["geometry_type"] = "Curve"
-                                    geom_info["data"]["length"] = float(actual_geom.GetLength())
+                                    geom_info["data"]["length"] = actual_geom.GetLength()
                                     geom_info["data"]["is_closed"] = actual_geom.IsClosed
 
-                                    # Sample points
+                                    # Sample points: fetch Domain once and
+                                    # interpolate the parameter in Python
+                                    # instead of one ParameterAt call per t
+                                    domain = actual_geom.Domain
+                                    t0 = domain.T0
+                                    span = domain.Length
+                                    # Flat [x0, y0, z0, x1, ...] layout:
+                                    # one list and no per-point dicts on
+                                    # the wire
                                     sample_points = []
-                                    for t in [0.0, 0.25, 0.5, 0.75, 1.0]:
-                                        param = actual_geom.Domain.ParameterAt(t)
-                                        pt = actual_geom.PointAt(param)
-                                        sample_points.append({
-                                            "x": float(pt.X),
-                                            "y": float(pt.Y),
-                                            "z": float(pt.Z)
-                                        })
+                                    extend = sample_points.extend
+                                    for frac in _SAMPLE_FRACS:
+                                        pt = actual_geom.PointAt(t0 + frac * span)
+                                        extend((pt.X, pt.Y, pt.Z))
                                     geom_info["data"]["sample_points"] = sample_points
+                                    geom_info["data"]["sample_points_layout"] = "xyz_interleaved"
 
                                     # Bake if requested
                                     if bake_to_rhino:
-                                        obj_id = sc.doc.Objects.AddCurve(actual_geom)
+                                        obj_id = sc.doc.Objects.AddCurve(actual_geom, bake_attrs) if bake_attrs else sc.doc.Objects.AddCurve(actual_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Surface):
+                                elif kind == "Surface":
                                     geom_info["geometry_type"] = "Surface"
                                     try:
                                         area = actual_geom.GetSurfaceSize()
-                                        geom_info["data"]["area"] = float(area[0]) if area[0] else None
+                                        geom_info["data"]["area"] = area[0] if area[0] else None
                                     except:
                                         geom_info["data"]["area"] = None
 
                                     # Bake if requested
                                     if bake_to_rhino:
-                                        obj_id = sc.doc.Objects.AddSurface(actual_geom)
+                                        obj_id = sc.doc.Objects.AddSurface(actual_geom, bake_attrs) if bake_attrs else sc.doc.Objects.AddSurface(actual_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Point3d):
+                                elif kind == "Point":
                                     geom_info["geometry_type"] = "Point"
+                                    # Point3d coords marshal as Python
+                                    # floats already; no float() needed
                                     geom_info["data"]["coordinates"] = {
-                                        "x": float(actual_geom.X),
-                                        "y": float(actual_geom.Y),
-                                        "z": float(actual_geom.Z)
+                                        "x": actual_geom.X,
+                                        "y": actual_geom.Y,
+                                        "z": actual_geom.Z
                                     }
 
                                     # Bake if requested
                                     if bake_to_rhino:
-                                        obj_id = sc.doc.Objects.AddPoint(actual_geom)
+                                        obj_id = sc.doc.Objects.AddPoint(actual_geom, bake_attrs) if bake_attrs else sc.doc.Objects.AddPoint(actual_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Brep):
+                                elif kind == "Brep":
                                     geom_info["geometry_type"] = "Brep"
                                     geom_info["data"]["is_solid"] = actual_geom.IsSolid
-                                    geom_info["data"]["volume"] = float(actual_geom.GetVolume()) if actual_geom.IsSolid else None
+                                    geom_info["data"]["volume"] = actual_geom.GetVolume() if actual_geom.IsSolid else None
 
                                     # Bake if requested
                                     if bake_to_rhino:
-                                        obj_id = sc.doc.Objects.AddBrep(actual_geom)
+                                        obj_id = sc.doc.Objects.AddBrep(actual_geom, bake_attrs) if bake_attrs else sc.doc.Objects.AddBrep(actual_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
-                                elif isinstance(actual_geom, Rhino.Geometry.Mesh):
+                                elif kind == "Mesh":
                                     geom_info["geometry_type"] = "Mesh"
                                     geom_info["data"]["vertex_count"] = actual_geom.Vertices.Count
                                     geom_info["data"]["face_count"] = actual_geom.Faces.Count
 
                                     # Bake if requested
                                     if bake_to_rhino:
-                                        obj_id = sc.doc.Objects.AddMesh(actual_geom)
+                                        obj_id = sc.doc.Objects.AddMesh(actual_geom, bake_attrs) if bake_attrs else sc.doc.Objects.AddMesh(actual_geom)
                                         if obj_id != System.Guid.Empty:
                                             baked_ids.append(str(obj_id))
-                                            sc.doc.Views.Redraw()
 
                                 # Handle data types (numbers, text, etc.) - cannot be baked
-                                elif isinstance(actual_geom, (int, float)):
+                                elif kind == "Number":
                                     geom_info["geometry_type"] = "Number"
                                     geom_info["data"]["value"] = float(actual_geom)
                                     # Numbers cannot be baked to Rhino
 
-                                elif isinstance(actual_geom, str):
+                                elif kind == "Text":
                                     geom_info["geometry_type"] = "Text"
                                     geom_info["data"]["text"] = str(actual_geom)
                                     # Text cannot be baked to Rhino (would need text entity)
 
-                                elif isinstance(actual_geom, bool):
+                                elif kind == "Boolean":
                                     geom_info["geometry_type"] = "Boolean"
                                     geom_info["data"]["value"] = bool(actual_geom)
                                     # Booleans cannot be baked to Rhino
@@ -4757,6 +6248,13 @@ def handle_extract_geometry_output(data):
                         except Exception as e:
                             continue
 
+            if bake_to_rhino:
+                if undo_record:
+                    sc.doc.EndUndoRecord(undo_record)
+                # Repaint once after all objects are in the document
+                if baked_ids:
+                    sc.doc.Views.Redraw()
+
         result = {
             "success": True,
             "parameter_name": parameter_name,
@@ -4783,11 +6281,10 @@ def handle_extract_geometry_output(data):
             "error": f"Grasshopper not available: {str(e)}"
         }
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error extracting geometry output: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 # ============================================================================
@@ -4883,7 +6380,7 @@ def validate_geometry_compatibility(source_types, target_param_obj, debug_log=No
     Validate if source geometry types are compatible with target parameter.
     Returns (is_compatible, warning_message)
     """
-    import Grasshopper
+    Grasshopper, _ = _get_gh()
 
     if not target_param_obj:
         return (True, None)  # Can't validate without target
@@ -4986,20 +6483,17 @@ async def transfer_eml_geometry_between_files(
         "auto_open_files": auto_open_files
     }
 
-    return call_bridge_api("/transfer_eml_geometry", request_data)
+    return await call_bridge_api_async("/transfer_eml_geometry", request_data)
 
 @bridge_handler("/transfer_eml_geometry")
 def handle_transfer_eml_geometry(data):
     """Bridge handler for transferring geometry between files"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
         import System
         import scriptcontext as sc
-        import os
 
         source_file = data.get('source_file', '')
         source_parameter = data.get('source_parameter', '')
@@ -5102,14 +6596,15 @@ def handle_transfer_eml_geometry(data):
                     debug_info.append(f"WARNING: No active canvas after OpenDocument")
             except Exception as e:
                 debug_info.append(f"ERROR activating source file: {str(e)}")
-                import traceback
-                debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
+                if _DEBUG_TB:
+                    debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
 
         # Find source parameter and extract geometry
         source_obj = None
         for obj in source_doc.Objects:
-            if hasattr(obj, 'NickName') and obj.NickName:
-                if obj.NickName.lower() == source_parameter.lower():
+            nick = obj.NickName if hasattr(obj, 'NickName') else None
+            if nick:
+                if nick.lower() == source_parameter.lower():
                     source_obj = obj
                     debug_info.append(f"Found source parameter: {source_parameter}")
                     break
@@ -5136,9 +6631,7 @@ def handle_transfer_eml_geometry(data):
             volatile_data = source_obj.VolatileData
             debug_info.append(f"VolatileData PathCount: {volatile_data.PathCount}")
 
-            for i in range(volatile_data.PathCount):
-                path = volatile_data.get_Path(i)
-                branch = volatile_data.get_Branch(path)
+            for i, branch in enumerate(volatile_data.Branches):
                 debug_info.append(f"Branch {i} has {len(branch)} items")
 
                 for item in branch:
@@ -5170,11 +6663,10 @@ def handle_transfer_eml_geometry(data):
                             else:
                                 debug_info.append(f"WARNING: Failed to add {orig_type} (as {conv_type}) to Rhino document")
         except Exception as e:
-            import traceback
             return {
                 "success": False,
                 "error": f"Error extracting geometry: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": traceback.format_exc() if _DEBUG_TB else None,
                 "debug_info": debug_info
             }
 
@@ -5226,14 +6718,15 @@ def handle_transfer_eml_geometry(data):
                     debug_info.append(f"WARNING: No active canvas after OpenDocument")
             except Exception as e:
                 debug_info.append(f"ERROR activating target file: {str(e)}")
-                import traceback
-                debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
+                if _DEBUG_TB:
+                    debug_info.append(f"Traceback: {traceback.format_exc()[:300]}")
 
         # Find target parameter
         target_obj = None
         for obj in target_doc.Objects:
-            if hasattr(obj, 'NickName') and obj.NickName:
-                if obj.NickName.lower() == target_parameter.lower():
+            nick = obj.NickName if hasattr(obj, 'NickName') else None
+            if nick:
+                if nick.lower() == target_parameter.lower():
                     target_obj = obj
                     debug_info.append(f"Found target parameter: {target_parameter}")
                     break
@@ -5321,9 +6814,9 @@ def handle_transfer_eml_geometry(data):
             return result
 
         except Exception as e:
-            import traceback
             debug_info.append(f"ERROR during injection: {str(e)}")
-            debug_info.append(f"Traceback: {traceback.format_exc()[:500]}")
+            if _DEBUG_TB:
+                debug_info.append(f"Traceback: {traceback.format_exc()[:500]}")
 
             # Clean up temporary Rhino objects
             for obj_id in rhino_object_ids:
@@ -5334,16 +6827,15 @@ def handle_transfer_eml_geometry(data):
             return {
                 "success": False,
                 "error": f"Error injecting geometry: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": traceback.format_exc() if _DEBUG_TB else None,
                 "debug_info": debug_info
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in geometry transfer: {str(e)}",
-            "traceback": traceback.format_exc(),
+            "traceback": traceback.format_exc() if _DEBUG_TB else None,
             "debug_info": debug_info if 'debug_info' in locals() else []
         }
 
@@ -5403,20 +6895,17 @@ async def execute_eml_workflow(
         "auto_discover": auto_discover
     }
 
-    return call_bridge_api("/execute_eml_workflow", request_data)
+    return await call_bridge_api_async("/execute_eml_workflow", request_data)
 
 @bridge_handler("/execute_eml_workflow")
 def handle_execute_eml_workflow(data):
     """Bridge handler for executing EML workflows"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
         import System
         import scriptcontext as sc
-        import os
         import re
 
         workflow_steps = data.get('workflow_steps', [])
@@ -5535,8 +7024,9 @@ def handle_execute_eml_workflow(data):
                 # Find the parameter
                 param_obj = None
                 for obj in doc.Objects:
-                    if hasattr(obj, 'NickName') and obj.NickName:
-                        if obj.NickName.lower() == param_name.lower():
+                    nick = obj.NickName if hasattr(obj, 'NickName') else None
+                    if nick:
+                        if nick.lower() == param_name.lower():
                             param_obj = obj
                             break
 
@@ -5597,8 +7087,9 @@ def handle_execute_eml_workflow(data):
                 # Find the parameter
                 output_obj = None
                 for obj in doc.Objects:
-                    if hasattr(obj, 'NickName') and obj.NickName:
-                        if obj.NickName.lower() == output_param_name.lower():
+                    nick = obj.NickName if hasattr(obj, 'NickName') else None
+                    if nick:
+                        if nick.lower() == output_param_name.lower():
                             output_obj = obj
                             break
 
@@ -5612,9 +7103,7 @@ def handle_execute_eml_workflow(data):
                         volatile_data = output_obj.VolatileData
                         temp_obj_ids = []
 
-                        for i in range(volatile_data.PathCount):
-                            path = volatile_data.get_Path(i)
-                            branch = volatile_data.get_Branch(path)
+                        for branch in volatile_data.Branches:
                             for item in branch:
                                 if hasattr(item, 'Value'):
                                     geom = item.Value
@@ -5663,11 +7152,10 @@ def handle_execute_eml_workflow(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error executing workflow: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 # ============================================================================
@@ -5712,7 +7200,7 @@ async def bake_grasshopper_geometry_to_rhino(
     """
     Handler for explicit geometry baking with user confirmation.
     """
-    return call_bridge_api("/bake_gh_geometry", {
+    return await call_bridge_api_async("/bake_gh_geometry", {
         "file_name": file_name,
         "parameter_names": parameter_names,
         "layer_name": layer_name,
@@ -5726,11 +7214,9 @@ async def bake_grasshopper_geometry_to_rhino(
 def handle_bake_gh_geometry(data):
     """Bridge handler for explicit geometry baking"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
         import rhinoscriptsyntax as rs
         import scriptcontext as sc
         import System
@@ -5902,10 +7388,7 @@ def handle_bake_gh_geometry(data):
 
             try:
                 volatile_data = param_obj.VolatileData
-                for i in range(volatile_data.PathCount):
-                    path = volatile_data.get_Path(i)
-                    branch = volatile_data.get_Branch(path)
-
+                for branch in volatile_data.Branches:
                     for item in branch:
                         try:
                             actual_geom = item.Value if hasattr(item, 'Value') else item
@@ -5944,11 +7427,10 @@ def handle_bake_gh_geometry(data):
                 total_baked += len(baked_ids)
 
             except Exception as e:
-                import traceback
                 baking_results[param_name] = {
                     "success": False,
                     "error": str(e),
-                    "traceback": traceback.format_exc()
+                    "traceback": traceback.format_exc() if _DEBUG_TB else None
                 }
 
         return {
@@ -5961,11 +7443,10 @@ def handle_bake_gh_geometry(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error baking geometry: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 
@@ -6007,7 +7488,7 @@ async def execute_custom_python_script(
     """
     Handler for custom script execution with debugging.
     """
-    return call_bridge_api("/execute_custom_script", {
+    return await call_bridge_api_async("/execute_custom_script", {
         "script_code": script_code,
         "script_description": script_description,
         "return_variable": return_variable
@@ -6018,17 +7499,14 @@ async def execute_custom_python_script(
 def handle_execute_custom_script(data):
     """Bridge handler for custom script execution"""
     try:
-        import clr
-        clr.AddReference('Grasshopper')
-        clr.AddReference('RhinoCommon')
-        import Grasshopper
-        import Rhino
+        # Cached module references; clr.AddReference and the CLR import
+        # machinery only run on the first call in the process
+        Grasshopper, Rhino = _get_gh()
         import rhinoscriptsyntax as rs
         import scriptcontext as sc
         import System
         import math
         import io
-        import sys
 
         script_code = data.get('script_code', '')
         script_description = data.get('script_description', 'Custom script')
@@ -6120,7 +7598,6 @@ def handle_execute_custom_script(data):
             return result
 
         except Exception as e:
-            import traceback
 
             # Restore stdout/stderr
             sys.stdout = old_stdout
@@ -6132,7 +7609,7 @@ def handle_execute_custom_script(data):
             return {
                 "success": False,
                 "error": f"Script execution failed: {str(e)}",
-                "traceback": traceback.format_exc(),
+                "traceback": traceback.format_exc() if _DEBUG_TB else None,
                 "output": output_text if output_text else None,
                 "errors": error_text if error_text else None,
                 "debug_log": debug_log,
@@ -6140,11 +7617,10 @@ def handle_execute_custom_script(data):
             }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error in script handler: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 
@@ -6179,7 +7655,7 @@ async def suggest_gh_workflow(
     """
     Get workflow suggestions based on metadata.
     """
-    return call_bridge_api("/suggest_workflow", {
+    return await call_bridge_api_async("/suggest_workflow", {
         "goal": goal,
         "category": category,
         "workflow_id": workflow_id
@@ -6190,7 +7666,6 @@ async def suggest_gh_workflow(
 def handle_suggest_workflow(data):
     """Bridge handler for workflow suggestions"""
     try:
-        import os
         import json
 
         goal = data.get('goal', '').lower()
@@ -6277,11 +7752,10 @@ def handle_suggest_workflow(data):
         }
 
     except Exception as e:
-        import traceback
         return {
             "success": False,
             "error": f"Error suggesting workflows: {str(e)}",
-            "traceback": traceback.format_exc()
+            "traceback": traceback.format_exc() if _DEBUG_TB else None
         }
 
 
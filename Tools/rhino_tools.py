@@ -11,9 +11,12 @@ import sys
 import os
 from typing import Dict, Any
 
-# Import bridge_client from MCP directory
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'MCP'))
-from bridge_client import call_bridge_api
+# Import bridge_client from MCP directory (path added once per process;
+# discovery reloads this module and unguarded appends grow sys.path)
+_MCP_PATH = os.path.join(os.path.dirname(__file__), '..', 'MCP')
+if _MCP_PATH not in sys.path:
+    sys.path.append(_MCP_PATH)
+from bridge_client import call_bridge_api, call_bridge_api_async
 
 # Import the decorator system
 try:
@@ -22,25 +25,13 @@ except ImportError:
     # Fallback for direct import
     from tool_registry import rhino_tool, bridge_handler
 
-# Get DEBUG_MODE from environment
-DEBUG_MODE = False
+# Get DEBUG_MODE from the shared, mtime-cached .env parse
 try:
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    env_file = os.path.join(project_root, '.env')
-
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if key.strip() == 'DEBUG_MODE':
-                        DEBUG_MODE = value.strip().lower() == 'true'
-                        break
-    else:
-        DEBUG_MODE = os.environ.get('DEBUG_MODE', 'false').lower() == 'true'
-except:
-    DEBUG_MODE = False
+    from ._envcache import get_debug_mode
+except ImportError:
+    # Fallback for direct import
+    from _envcache import get_debug_mode
+DEBUG_MODE = get_debug_mode()
 
 def filter_debug_response(response: Dict[str, Any]) -> Dict[str, Any]:
     """Filter response based on DEBUG_MODE to save tokens"""
@@ -119,7 +110,9 @@ async def draw_line_rhino(
         "end_z": end_z
     }
 
-    return call_bridge_api("/draw_line", request_data)
+    # Await the shared keep-alive client so the HTTP round-trip does
+    # not block the event loop under concurrent tool calls
+    return await call_bridge_api_async("/draw_line", request_data)
 
 @bridge_handler("/draw_line")
 def handle_draw_line(data):
@@ -191,7 +184,9 @@ async def get_rhino_info() -> Dict[str, Any]:
         Dict containing Rhino session information
     """
 
-    return call_bridge_api("/get_rhino_info", {})
+    # Await the shared keep-alive client so the HTTP round-trip does
+    # not block the event loop under concurrent tool calls
+    return await call_bridge_api_async("/get_rhino_info", {})
 
 @bridge_handler("/get_rhino_info")
 def handle_get_rhino_info(data):
@@ -339,7 +334,9 @@ async def typical_roof_truss_generator(
         "truss_plane_direction": truss_plane_direction
     }
 
-    return call_bridge_api("/generate_truss", request_data)
+    # Await the shared keep-alive client so the HTTP round-trip does
+    # not block the event loop under concurrent tool calls
+    return await call_bridge_api_async("/generate_truss", request_data)
 
 @bridge_handler("/generate_truss")
 def handle_generate_truss(data):
@@ -698,7 +695,7 @@ async def get_selected_rhino_objects() -> Dict[str, Any]:
         Dict containing selected object information
     """
 
-    return call_bridge_api("/get_selected_objects", {})
+    return await call_bridge_api_async("/get_selected_objects", {})
 
 @bridge_handler("/get_selected_objects")
 def handle_get_selected_objects(data):
@@ -792,7 +789,7 @@ async def get_rhino_object_geometry(object_id: str) -> Dict[str, Any]:
 
     request_data = {"object_id": object_id}
 
-    return call_bridge_api("/get_object_geometry", request_data)
+    return await call_bridge_api_async("/get_object_geometry", request_data)
 
 @bridge_handler("/get_object_geometry")
 def handle_get_object_geometry(data):
@@ -945,7 +942,7 @@ async def get_curve_length(object_id: str) -> Dict[str, Any]:
 
     request_data = {"object_id": object_id}
 
-    return call_bridge_api("/get_curve_length", request_data)
+    return await call_bridge_api_async("/get_curve_length", request_data)
 
 
 @bridge_handler("/get_curve_length")
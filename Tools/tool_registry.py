@@ -9,6 +9,7 @@ without manually updating registration lists.
 import importlib
 import os
 import sys
+import types
 from typing import Dict, Any, List, Callable, Optional
 from functools import wraps
 
@@ -18,6 +19,51 @@ _gh_tools = []
 _custom_tools = []
 _bridge_handlers = {}
 
+# Read-only view handed to consumers; it tracks the dict across
+# rediscovery without the per-call copy the old getter made
+_BRIDGE_HANDLERS_VIEW = types.MappingProxyType(_bridge_handlers)
+
+# Discovery cache: re-importing every tool module is only needed when the
+# Tools directory actually changed, so discover_tools records the newest
+# .py mtime it saw and short-circuits while that stamp still matches.
+_discovery_stamp = None
+
+# Materialized MCP-format lists, rebuilt lazily after each real discovery
+_rhino_tools_mcp = None
+_gh_tools_mcp = None
+_custom_tools_mcp = None
+
+
+def _scan_tool_files():
+    """
+    One scandir pass over the Tools directory.
+
+    Returns (tool_files, stamp) where tool_files are the importable tool
+    module filenames and stamp is the newest mtime among all .py entries
+    (None when the directory cannot be read). scandir gives both the
+    listing and the stat data without a second syscall per entry.
+    """
+    tools_dir = os.path.dirname(__file__)
+    tool_files = []
+    newest = 0.0
+    try:
+        with os.scandir(tools_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.py') or not entry.is_file():
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime > newest:
+                    newest = mtime
+                if name != '__init__.py' and name != 'tool_registry.py':
+                    tool_files.append(name)
+    except OSError:
+        return [], None
+    return tool_files, newest
+
 class ToolDefinition:
     """Represents a registered tool definition"""
     
@@ -26,14 +72,19 @@ class ToolDefinition:
         self.description = description
         self.function = function
         self.tool_type = tool_type
-        
+        # MCP-format dict, built on first use; the definition is
+        # immutable after registration so one dict serves every caller
+        self._mcp_dict = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for MCP registration"""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "function": self.function
-        }
+        if self._mcp_dict is None:
+            self._mcp_dict = {
+                "name": self.name,
+                "description": self.description,
+                "function": self.function
+            }
+        return self._mcp_dict
 
 def rhino_tool(name: str = None, description: str = None):
     """
@@ -59,11 +110,9 @@ def rhino_tool(name: str = None, description: str = None):
         # Register in global registry
         _rhino_tools.append(tool_def)
         
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        
-        return wrapper
+        # Return the function unmodified: a pass-through async wrapper
+        # only adds a frame and a coroutine allocation per call
+        return func
     
     return decorator
 
@@ -91,11 +140,9 @@ def gh_tool(name: str = None, description: str = None):
         # Register in global registry
         _gh_tools.append(tool_def)
         
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        
-        return wrapper
+        # Return the function unmodified: a pass-through async wrapper
+        # only adds a frame and a coroutine allocation per call
+        return func
     
     return decorator
 
@@ -124,11 +171,9 @@ def custom_tool(name: str = None, description: str = None):
         # Register in global registry
         _custom_tools.append(tool_def)
 
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-
-        return wrapper
+        # Return the function unmodified: a pass-through async wrapper
+        # only adds a frame and a coroutine allocation per call
+        return func
 
     return decorator
 
@@ -238,8 +283,26 @@ def discover_tools() -> Dict[str, List[ToolDefinition]]:
     Returns:
         Dictionary with 'rhino' and 'grasshopper' tool lists
     """
-    # Clear existing registries
     global _rhino_tools, _gh_tools, _custom_tools, _bridge_handlers
+    global _discovery_stamp, _rhino_tools_mcp, _gh_tools_mcp, _custom_tools_mcp
+
+    # One directory scan yields both the file list and the change stamp;
+    # skip the whole import/reload pass when nothing on disk changed
+    # since the last discovery
+    discovered_files, stamp = _scan_tool_files()
+    if (stamp is not None and stamp == _discovery_stamp
+            and (_rhino_tools or _gh_tools or _custom_tools)):
+        print("[DISCOVERY] Tool files unchanged; reusing previous discovery")
+        return {
+            'rhino': _rhino_tools,
+            'grasshopper': _gh_tools,
+            'custom': _custom_tools
+        }
+
+    # Clear existing registries and invalidate the materialized lists
+    _rhino_tools_mcp = None
+    _gh_tools_mcp = None
+    _custom_tools_mcp = None
     _rhino_tools.clear()
     _gh_tools.clear()
     _custom_tools.clear()
@@ -249,25 +312,18 @@ def discover_tools() -> Dict[str, List[ToolDefinition]]:
     tools_dir = os.path.dirname(__file__)
 
     print(f"[DISCOVERY] Scanning Tools directory: {tools_dir}")
-
-    # Import all Python modules in Tools directory
-    discovered_files = []
-    for filename in os.listdir(tools_dir):
-        if filename.endswith('.py') and filename != '__init__.py' and filename != 'tool_registry.py':
-            discovered_files.append(filename)
-
     print(f"[DISCOVERY] Found {len(discovered_files)} tool files: {', '.join(discovered_files)}")
 
-    for filename in discovered_files:
-        module_name = filename[:-3]  # Remove .py extension
-        try:
-            # Import the module to trigger decorator registration
-            # Only reload if module was already imported (to get latest changes)
-            original_cwd = os.getcwd()
+    # Switch into the Tools directory once for the whole import pass
+    # instead of chdir-ing back and forth per file
+    original_cwd = os.getcwd()
+    os.chdir(tools_dir)
+    try:
+        for filename in discovered_files:
+            module_name = filename[:-3]  # Remove .py extension
             try:
-                os.chdir(tools_dir)
-
-                # Try to import the module
+                # Import the module to trigger decorator registration
+                # Only reload if module was already imported (to get latest changes)
                 try:
                     # Check if module is already imported
                     module_already_imported = module_name in sys.modules
@@ -281,28 +337,33 @@ def discover_tools() -> Dict[str, List[ToolDefinition]]:
                     else:
                         print(f"[DISCOVERY] Loaded tools from: {module_name}.py")
                 except ImportError:
-                    # Try with Tools prefix
+                    # Try with Tools prefix from the original working directory
                     os.chdir(original_cwd)
-                    full_module_name = f'Tools.{module_name}'
-                    module_already_imported = full_module_name in sys.modules
-
-                    module = importlib.import_module(full_module_name)
-
-                    # Only reload if it was already imported
-                    if module_already_imported:
-                        importlib.reload(module)
-                        print(f"[DISCOVERY] Reloaded tools from: {module_name}.py (Tools prefix)")
-                    else:
-                        print(f"[DISCOVERY] Loaded tools from: {module_name}.py (Tools prefix)")
-            finally:
-                os.chdir(original_cwd)
-        except Exception as e:
-            print(f"[DISCOVERY] Warning: Could not import {module_name}.py: {e}")
-            import traceback
-            print(traceback.format_exc())
+                    try:
+                        full_module_name = f'Tools.{module_name}'
+                        module_already_imported = full_module_name in sys.modules
+
+                        module = importlib.import_module(full_module_name)
+
+                        # Only reload if it was already imported
+                        if module_already_imported:
+                            importlib.reload(module)
+                            print(f"[DISCOVERY] Reloaded tools from: {module_name}.py (Tools prefix)")
+                        else:
+                            print(f"[DISCOVERY] Loaded tools from: {module_name}.py (Tools prefix)")
+                    finally:
+                        os.chdir(tools_dir)
+            except Exception as e:
+                print(f"[DISCOVERY] Warning: Could not import {module_name}.py: {e}")
+                import traceback
+                print(traceback.format_exc())
+    finally:
+        os.chdir(original_cwd)
 
     print(f"[DISCOVERY] Registered {len(_rhino_tools)} Rhino tools, {len(_gh_tools)} Grasshopper tools, {len(_custom_tools)} Custom tools, {len(_bridge_handlers)} bridge handlers")
 
+    _discovery_stamp = stamp
+
     return {
         'rhino': _rhino_tools,
         'grasshopper': _gh_tools,
@@ -311,16 +372,25 @@ def discover_tools() -> Dict[str, List[ToolDefinition]]:
 
 def get_rhino_tools() -> List[Dict[str, Any]]:
     """Get all registered Rhino tools in MCP format"""
-    return [tool.to_dict() for tool in _rhino_tools]
+    global _rhino_tools_mcp
+    if _rhino_tools_mcp is None:
+        _rhino_tools_mcp = [tool.to_dict() for tool in _rhino_tools]
+    return _rhino_tools_mcp
 
 def get_gh_tools() -> List[Dict[str, Any]]:
     """Get all registered Grasshopper tools in MCP format"""
-    return [tool.to_dict() for tool in _gh_tools]
+    global _gh_tools_mcp
+    if _gh_tools_mcp is None:
+        _gh_tools_mcp = [tool.to_dict() for tool in _gh_tools]
+    return _gh_tools_mcp
 
 def get_custom_tools() -> List[Dict[str, Any]]:
     """Get all registered custom tools in MCP format"""
-    return [tool.to_dict() for tool in _custom_tools]
+    global _custom_tools_mcp
+    if _custom_tools_mcp is None:
+        _custom_tools_mcp = [tool.to_dict() for tool in _custom_tools]
+    return _custom_tools_mcp
 
 def get_bridge_handlers() -> Dict[str, Callable]:
-    """Get all registered bridge handlers"""
-    return _bridge_handlers.copy()
\ No newline at end of file
+    """Get all registered bridge handlers (read-only view, no copy)"""
+    return _BRIDGE_HANDLERS_VIEW
\ No newline at end of file